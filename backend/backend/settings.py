@@ -4,6 +4,7 @@ Django settings for backend project.
 
 from pathlib import Path
 import os
+import tempfile
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -42,6 +43,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'jobs.middleware.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -148,7 +150,26 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.AllowAny',
     ],
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'jobs.renderers.FastJSONRenderer',
     ],
 }
 
+
+# Crawl scheduler settings (python manage.py crawl_scheduler)
+SCHEDULER_MAX_CONCURRENCY = int(os.getenv('SCHEDULER_MAX_CONCURRENCY', '2'))
+SCHEDULER_JITTER_SECONDS = int(os.getenv('SCHEDULER_JITTER_SECONDS', '60'))
+SCHEDULER_POLL_SECONDS = int(os.getenv('SCHEDULER_POLL_SECONDS', '15'))
+
+
+# Request profiling (profile=1 on search/details; staff users or X-Profile-Token)
+PROFILING_TOKEN = os.getenv('PROFILING_TOKEN', '')
+PROFILE_DIR = os.getenv('PROFILE_DIR', os.path.join(tempfile.gettempdir(), 'naukri_profiles'))
+
+
+# Response compression (jobs.middleware.CompressionMiddleware; Brotli if installed, else gzip)
+COMPRESSION_MIN_BYTES = int(os.getenv('COMPRESSION_MIN_BYTES', '1024'))
+BROTLI_QUALITY = int(os.getenv('BROTLI_QUALITY', '5'))
+
+# Content-hash ETags of search/details responses are remembered this long, so
+# revalidating clients get a 304 without a scrape
+ETAG_CACHE_SECONDS = int(os.getenv('ETAG_CACHE_SECONDS', '900'))
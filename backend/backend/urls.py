@@ -3,9 +3,12 @@ URL configuration for backend project.
 """
 from django.contrib import admin
 from django.urls import path, include
+from jobs.views import metrics, readiness
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/', include('jobs.urls')),
+    path('metrics', metrics, name='metrics'),
+    path('ready', readiness, name='readiness'),
 ]
 
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Parity benchmark of the command-line scraper and the search API.
+
+``scrape_jobs.py`` and ``/api/jobs/search/`` both scrape through
+``scraper.naukri_service``. This benchmark runs the same searches through
+both against the replay server and checks that they return the same
+listings, then times them:
+
+    api          GET /api/jobs/search/ through Django's test client (the
+                 view also indexes the listings and counts facets)
+    cli          scrape_jobs.search_page, the CLI's scraping call
+    cli_process  scrape_jobs.py run end to end in a fresh interpreter,
+                 writing JSON Lines (checked for parity, timed once)
+
+Besides the end-to-end latency of each path, the median scrape time the
+service itself reports (metadata timings) is recorded, which separates the
+shared engine from the view's indexing.
+
+The 'browser' engine needs Chrome and is skipped (with the reason recorded)
+when it cannot be started.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_cli_parity
+    python -m benchmarks.bench_cli_parity --engines api --pages 2 --iterations 50 --output parity.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPO_DIR = os.path.dirname(BACKEND_DIR)
+for path in (BACKEND_DIR, REPO_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from benchmarks.replay_server import DEFAULT_FIXTURES_DIR, start_in_thread  # noqa: E402
+from benchmarks.run import measure, percentile  # noqa: E402
+
+
+QUERY = {
+    'job_type': 'job',
+    'designation': 'python developer',
+    'location': 'bangalore',
+    'experience': 2,
+}
+
+
+def setup_django():
+    """Set up Django with a throwaway test database for the view's index writes"""
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+    import django
+    django.setup()
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    setup_test_environment()
+    connection.creation.create_test_db(verbosity=0)
+
+
+def api_search(client, engine, page):
+    """
+    One page from the search API
+
+    Returns:
+        Tuple of (listings as JSON dictionaries, scrape milliseconds)
+    """
+    response = client.get('/api/jobs/search/', {
+        'job_type': QUERY['job_type'],
+        'keyword': QUERY['designation'],
+        'location': QUERY['location'],
+        'experience': QUERY['experience'],
+        'page': page,
+        'engine': engine,
+    })
+    data = json.loads(response.content)
+    if not data.get('success'):
+        raise Exception(data.get('message') or data.get('error'))
+    return data['jobs'], data['metadata']['debug_info']['timings'].get('total')
+
+
+def cli_search(base_url, engine, page):
+    """
+    One page from the CLI's scraping call
+
+    Returns:
+        Tuple of (listings as JSON dictionaries, scrape milliseconds)
+    """
+    from scrape_jobs import search_page
+    from scraper.records import jobs_to_dicts
+
+    result = search_page(QUERY, page, engine=engine, base_url=base_url)
+    if result['error']:
+        raise Exception(result['error'])
+    return jobs_to_dicts(result['jobs']), result['metadata']['debug_info']['timings'].get('total')
+
+
+def cli_process(base_url, engine):
+    """
+    Run scrape_jobs.py for page 1 in a fresh interpreter
+
+    Returns:
+        Tuple of (listings written, seconds)
+    """
+    from scraper.export import read_jsonl
+
+    with tempfile.TemporaryDirectory() as directory:
+        output = os.path.join(directory, 'jobs.jsonl')
+        command = [
+            sys.executable, os.path.join(REPO_DIR, 'scrape_jobs.py'),
+            '-t', QUERY['job_type'], '-d', QUERY['designation'], '-l', QUERY['location'],
+            '-e', str(QUERY['experience']), '--engine', engine, '--base-url', base_url, '-o', output,
+        ]
+        started = time.perf_counter()
+        completed = subprocess.run(command, capture_output=True, text=True, timeout=300)
+        elapsed = time.perf_counter() - started
+        if completed.returncode != 0:
+            raise Exception((completed.stdout + completed.stderr).strip().splitlines()[-1])
+        return list(read_jsonl(output)), elapsed
+
+
+def run(engines, pages, iterations, fixtures_dir, log=print):
+    """
+    Compare and time the CLI and the API for every engine
+
+    Returns:
+        Dictionary keyed by engine of {'identical', 'jobs', 'api', 'cli',
+        'cli_process_seconds'} (or {'skipped', 'reason'}); 'api' and 'cli'
+        are measure() results plus 'scrape_p50_ms'
+    """
+    # Keep the adaptive rate limiter from throttling the local server
+    os.environ.setdefault('NAUKRI_RATE_LIMIT', '1000')
+    os.environ.setdefault('NAUKRI_RATE_LIMIT_MAX', '1000')
+    os.environ.setdefault('NAUKRI_RATE_LIMIT_BURST', '1000')
+    server, base_url = start_in_thread(port=0, fixtures=fixtures_dir, quiet=True)
+    os.environ['NAUKRI_BASE_URL'] = base_url
+    setup_django()
+    from django.test import Client
+
+    client = Client()
+    results = {}
+    try:
+        for engine in engines:
+            log(f"Running {engine} engine ({iterations} iterations of {pages} pages)...")
+            try:
+                searches = {
+                    'api': lambda page: api_search(client, engine, page),
+                    'cli': lambda page: cli_search(base_url, engine, page),
+                }
+                listings = {
+                    name: [search(page)[0] for page in range(1, pages + 1)]
+                    for name, search in searches.items()
+                }
+                process_jobs, process_seconds = cli_process(base_url, engine)
+                results[engine] = {
+                    'identical': listings['api'] == listings['cli'] and process_jobs == listings['api'][0],
+                    'jobs': sum(len(page_jobs) for page_jobs in listings['api']),
+                    'cli_process_seconds': round(process_seconds, 3),
+                }
+
+                for name, search in searches.items():
+                    scrape_ms = []
+
+                    def run_pages():
+                        count = 0
+                        for page in range(1, pages + 1):
+                            jobs, elapsed_ms = search(page)
+                            count += len(jobs)
+                            scrape_ms.append(elapsed_ms or 0)
+                        return count
+
+                    stats = measure(run_pages, iterations)
+                    stats['scrape_p50_ms'] = round(percentile(scrape_ms, 0.50), 3)
+                    results[engine][name] = stats
+            except Exception as e:
+                results[engine] = {'skipped': True, 'reason': str(e).splitlines()[0][:200]}
+                log(f"  skipped: {results[engine]['reason']}")
+    finally:
+        server.shutdown()
+    return results
+
+
+def parse_arguments(argv=None):
+    """Parse command-line arguments"""
+    parser = argparse.ArgumentParser(description='Compare the CLI and the search API')
+    parser.add_argument(
+        '--engines', nargs='+', choices=['api', 'browser'], default=['api', 'browser'], help='Engines to compare'
+    )
+    parser.add_argument('--pages', type=int, default=2, help='Result pages per iteration')
+    parser.add_argument('--iterations', type=int, default=20, help='Timed runs per path and engine')
+    parser.add_argument('--fixtures', default=DEFAULT_FIXTURES_DIR, help='Fixtures directory')
+    parser.add_argument('--output', '-o', help='Write results as JSON to this file')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_arguments(argv)
+    results = run(args.engines, args.pages, args.iterations, args.fixtures)
+
+    print(f"\n{'engine':<8} {'path':<6} {'p50 ms':>9} {'p95 ms':>9} {'scrape ms':>10} {'jobs/s':>9} {'identical':>10}")
+    for engine, paths in results.items():
+        if paths.get('skipped'):
+            print(f"{engine:<8} skipped: {paths['reason']}")
+            continue
+        for name in ('api', 'cli'):
+            stats = paths[name]
+            print(
+                f"{engine:<8} {name:<6} {stats['p50_ms']:>9.2f} {stats['p95_ms']:>9.2f} {stats['scrape_p50_ms']:>10.2f} "
+                f"{stats['items_per_sec'] or 0:>9.0f} {str(paths['identical']):>10}"
+            )
+        print(f"{engine:<8} cli_process (one run, interpreter start included): {paths['cli_process_seconds']:.2f}s")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    return 1 if any(paths.get('identical') is False for paths in results.values()) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark of salary/experience normalization.
+
+Compares, on batches of synthetic Naukri-style labels:
+    every_label   vectorized string ops over every listing's label
+    factorized    the same ops over distinct labels, spread back with a take
+                  (scraper.normalize.normalize_salaries/normalize_experience)
+    batch_dicts   normalize_batch, including the per-job dicts index_jobs uses
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_normalize
+    python -m benchmarks.bench_normalize --sizes 20 1000 100000 --iterations 10 --output normalize.json
+"""
+import argparse
+import json
+import os
+import random
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from benchmarks.run import measure  # noqa: E402
+
+
+def make_jobs(count, seed=0):
+    """Job dictionaries with a realistic spread of salary and experience labels"""
+    rng = random.Random(seed)
+    salaries = (
+        [f'{low}-{low + rng.randint(1, 6)} Lacs PA' for low in range(1, 40)]
+        + [f'{amount},000 /month' for amount in range(5, 40)]
+        + ['Not disclosed'] * 20 + ['Unpaid', '10k/month', '12-22.5 Lacs PA', '1-1.5 Cr PA', '']
+    )
+    experiences = [f'{low}-{low + span} Yrs' for low in range(15) for span in range(1, 6)] + ['Fresher', '5+ Yrs']
+    return [
+        {'salary': rng.choice(salaries), 'experience': rng.choice(experiences)}
+        for _ in range(count)
+    ]
+
+
+def paths():
+    import pandas as pd
+    from scraper.normalize import (
+        _experience_ranges, _salary_ranges, normalize_batch, normalize_experience, normalize_salaries
+    )
+
+    def every_label(jobs):
+        _salary_ranges(pd.Series([job['salary'] for job in jobs], dtype='object').str.lower())
+        _experience_ranges(pd.Series([job['experience'] for job in jobs], dtype='object').str.lower())
+        return len(jobs)
+
+    def factorized(jobs):
+        normalize_salaries([job['salary'] for job in jobs])
+        normalize_experience([job['experience'] for job in jobs])
+        return len(jobs)
+
+    def batch_dicts(jobs):
+        return len(normalize_batch(jobs))
+
+    return {'every_label': every_label, 'factorized': factorized, 'batch_dicts': batch_dicts}
+
+
+def run(sizes, iterations):
+    """
+    Time every path at every batch size
+
+    Returns:
+        Dictionary keyed by size, then path, of measure() results
+    """
+    results = {}
+    for size in sizes:
+        jobs = make_jobs(size)
+        results[size] = {
+            name: measure(lambda: func(jobs), iterations)
+            for name, func in paths().items()
+        }
+    return results
+
+
+def parse_arguments(argv=None):
+    """Parse command-line arguments"""
+    parser = argparse.ArgumentParser(description='Benchmark salary/experience normalization')
+    parser.add_argument('--sizes', nargs='+', type=int, default=[20, 1000, 20000, 100000], help='Jobs per batch')
+    parser.add_argument('--iterations', type=int, default=10, help='Timed runs per path and size')
+    parser.add_argument('--output', '-o', help='Write results as JSON to this file')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_arguments(argv)
+    results = run(args.sizes, args.iterations)
+
+    print(f"{'jobs':>7} {'path':<12} {'p50 ms':>9} {'p95 ms':>9} {'jobs/s':>12} {'speedup':>8}")
+    for size, stats_by_path in results.items():
+        baseline = stats_by_path['every_label']['p50_ms']
+        for name, stats in stats_by_path.items():
+            print(
+                f"{size:>7} {name:<12} {stats['p50_ms']:>9.3f} {stats['p95_ms']:>9.3f} "
+                f"{stats['items_per_sec'] or 0:>12.0f} {baseline / stats['p50_ms']:>7.1f}x"
+            )
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({str(size): stats for size, stats in results.items()}, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
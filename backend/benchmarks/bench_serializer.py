@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the search response encoding paths.
+
+Compares, for 100 and 1000 jobs parsed from the bundled API fixtures:
+    drf_serializer   JobSerializer(many=True) + DRF's JSONRenderer (previous path)
+    fast_renderer    Job records encoded directly by FastJSONRenderer (orjson)
+    stdlib_json      Job records encoded by json.dumps with JobJSONEncoder
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_serializer
+    python -m benchmarks.bench_serializer --sizes 100 1000 5000 --iterations 50 --output serializer.json
+"""
+import argparse
+import json
+import os
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from benchmarks.replay_server import DEFAULT_FIXTURES_DIR, FixtureStore  # noqa: E402
+from benchmarks.run import measure  # noqa: E402
+
+
+def load_jobs(fixtures_dir, count):
+    """Parse the API fixtures into Job records and repeat them up to count"""
+    from scraper.naukri_scraper import NaukriScraper
+
+    parser = NaukriScraper(browser=False)
+    store = FixtureStore(fixtures_dir)
+    jobs = []
+    for entry in store.index['entries'].values():
+        if 'json' in entry['content_type']:
+            data = json.loads(store.read(entry))
+            jobs.extend(parser._parse_api_job_data(data.get('jobDetails', []), max_jobs=1000))
+    return (jobs * (count // max(1, len(jobs)) + 1))[:count]
+
+
+def encoders():
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+    import django
+    django.setup()
+    from rest_framework.renderers import JSONRenderer
+    from jobs.renderers import FastJSONRenderer
+    from jobs.serializers import JobSerializer
+    from scraper.records import JobJSONEncoder
+
+    drf_renderer = JSONRenderer()
+    fast_renderer = FastJSONRenderer()
+
+    def drf_serializer(jobs):
+        return drf_renderer.render({'success': True, 'jobs': JobSerializer(jobs, many=True).data})
+
+    def fast(jobs):
+        return fast_renderer.render({'success': True, 'jobs': jobs})
+
+    def stdlib_json(jobs):
+        return json.dumps({'success': True, 'jobs': jobs}, cls=JobJSONEncoder).encode('utf-8')
+
+    return {'drf_serializer': drf_serializer, 'fast_renderer': fast, 'stdlib_json': stdlib_json}
+
+
+def run(sizes, iterations, fixtures_dir):
+    """
+    Time every encoder at every size
+
+    Returns:
+        Dictionary keyed by size, then encoder, of measure() results plus
+        the encoded response size in bytes
+    """
+    paths = encoders()
+    results = {}
+    for size in sizes:
+        jobs = load_jobs(fixtures_dir, size)
+        results[size] = {}
+        for name, encode in paths.items():
+            stats = measure(lambda: len(jobs) if encode(jobs) else 0, iterations)
+            stats['response_bytes'] = len(encode(jobs))
+            results[size][name] = stats
+    return results
+
+
+def parse_arguments(argv=None):
+    """Parse command-line arguments"""
+    parser = argparse.ArgumentParser(description='Benchmark search response encoding')
+    parser.add_argument('--sizes', nargs='+', type=int, default=[100, 1000], help='Jobs per response')
+    parser.add_argument('--iterations', type=int, default=30, help='Timed runs per encoder and size')
+    parser.add_argument('--fixtures', default=DEFAULT_FIXTURES_DIR, help='Fixtures directory')
+    parser.add_argument('--output', '-o', help='Write results as JSON to this file')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_arguments(argv)
+    results = run(args.sizes, args.iterations, args.fixtures)
+
+    print(f"{'jobs':>6} {'encoder':<16} {'p50 ms':>9} {'p95 ms':>9} {'jobs/s':>12} {'speedup':>8}")
+    for size, paths in results.items():
+        baseline = paths['drf_serializer']['p50_ms']
+        for name, stats in paths.items():
+            print(
+                f"{size:>6} {name:<16} {stats['p50_ms']:>9.3f} {stats['p95_ms']:>9.3f} "
+                f"{stats['items_per_sec'] or 0:>12.0f} {baseline / stats['p50_ms']:>7.1f}x"
+            )
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({str(size): paths for size, paths in results.items()}, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
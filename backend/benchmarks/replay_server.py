@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Local replay server for offline scraping benchmarks.
+
+Serves captured naukri.com search pages, job detail pages and
+``/jobapi/v3/search`` JSON responses from a fixtures directory, so the
+scraper can be exercised without network access. Point the scraper at it
+with ``NAUKRI_BASE_URL=http://127.0.0.1:8765`` (or ``base_url=``).
+
+Usage:
+    # Serve the bundled fixtures
+    python benchmarks/replay_server.py serve
+
+    # Add 300ms +/- 100ms latency and fail 10% of requests with HTTP 429
+    python benchmarks/replay_server.py serve --latency-ms 300 --jitter-ms 100 \\
+        --error-rate 0.1 --error-status 429
+
+    # Record: proxy to naukri.com and capture every HTML/JSON response
+    python benchmarks/replay_server.py record --fixtures /tmp/captured
+
+Fixtures are stored as files plus an ``index.json`` manifest mapping request
+keys (path and query string without volatile parameters) to files. When no
+exact match exists, the server falls back to the same path with any query,
+then to the default fixture of the request kind (search, api or details).
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+DEFAULT_FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+DEFAULT_UPSTREAM = 'https://www.naukri.com'
+
+# Query parameters that change on every request and must not affect matching
+VOLATILE_PARAMS = {'sid'}
+
+# Only these response types are captured in record mode
+RECORDED_CONTENT_TYPES = ('text/html', 'application/json')
+
+BLOCK_PAGE = b'<html><body><h1>Access Denied</h1><p>Please complete the captcha to continue.</p></body></html>'
+
+
+def request_kind(path):
+    """Classify a request path as 'api', 'details', 'search' or 'other'"""
+    if path.startswith('/jobapi/'):
+        return 'api'
+    if path.startswith('/job-listings-'):
+        return 'details'
+    if re.match(r'^/[^/]+-jobs(-in-[^/]+)?$', path):
+        return 'search'
+    return 'other'
+
+
+def request_key(path, query):
+    """Build the fixture key of a request"""
+    params = [
+        (name, value)
+        for name, value in urllib.parse.parse_qsl(query, keep_blank_values=True)
+        if name not in VOLATILE_PARAMS
+    ]
+    params.sort()
+    if not params:
+        return path
+    return f"{path}?{urllib.parse.urlencode(params)}"
+
+
+class FixtureStore:
+    """Fixture files on disk plus the index.json manifest describing them"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.index_path = os.path.join(directory, 'index.json')
+        self._lock = threading.Lock()
+        if os.path.exists(self.index_path):
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self.index = json.load(f)
+        else:
+            self.index = {'entries': {}, 'defaults': {}}
+
+    def lookup(self, path, query):
+        """
+        Find the fixture for a request
+
+        Returns:
+            Entry dictionary with 'file', 'status' and 'content_type', or None
+        """
+        entries = self.index['entries']
+        key = request_key(path, query)
+        if key in entries:
+            return entries[key]
+        if path in entries:
+            return entries[path]
+        for entry_key, entry in entries.items():
+            if entry_key.split('?', 1)[0] == path:
+                return entry
+        default_key = self.index['defaults'].get(request_kind(path))
+        if default_key:
+            return entries.get(default_key)
+        return None
+
+    def read(self, entry):
+        with open(os.path.join(self.directory, entry['file']), 'rb') as f:
+            return f.read()
+
+    def save(self, path, query, status, content_type, body):
+        """Store a captured response and update the manifest"""
+        key = request_key(path, query)
+        kind = request_kind(path)
+        extension = 'json' if 'json' in content_type else 'html'
+        filename = f"{kind}-{hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]}.{extension}"
+
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(os.path.join(self.directory, filename), 'wb') as f:
+                f.write(body)
+            self.index['entries'][key] = {
+                'file': filename,
+                'status': status,
+                'content_type': content_type,
+            }
+            self.index['defaults'].setdefault(kind, key)
+            with open(self.index_path, 'w', encoding='utf-8') as f:
+                json.dump(self.index, f, indent=2, sort_keys=True)
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    """Serves fixtures, or proxies and records them in record mode"""
+
+    server_version = 'NaukriReplay/1.0'
+
+    def do_GET(self):
+        config = self.server.config
+        parsed = urllib.parse.urlsplit(self.path)
+
+        if config.latency_ms or config.jitter_ms:
+            delay = config.latency_ms + random.uniform(-config.jitter_ms, config.jitter_ms)
+            time.sleep(max(0.0, delay) / 1000.0)
+
+        if config.error_rate and random.random() < config.error_rate:
+            if config.error_status == 200:
+                # 200 with a captcha interstitial, like a soft block
+                self._send(200, 'text/html; charset=utf-8', BLOCK_PAGE)
+            else:
+                self._send(config.error_status, 'text/plain; charset=utf-8', b'', retry_after=config.retry_after)
+            return
+
+        if config.mode == 'record':
+            self._proxy_and_record(parsed)
+            return
+
+        entry = self.server.store.lookup(parsed.path, parsed.query)
+        if entry is None:
+            self._send(404, 'text/plain; charset=utf-8', b'No fixture for this request')
+            return
+        self._send(entry.get('status', 200), entry['content_type'], self.server.store.read(entry))
+
+    def _proxy_and_record(self, parsed):
+        import requests
+
+        config = self.server.config
+        url = config.upstream + self.path
+        headers = {
+            name: value for name, value in self.headers.items()
+            if name.lower() not in ('host', 'accept-encoding', 'connection')
+        }
+        try:
+            response = requests.get(url, headers=headers, timeout=30)
+        except requests.RequestException as e:
+            self._send(502, 'text/plain; charset=utf-8', str(e).encode('utf-8'))
+            return
+
+        content_type = response.headers.get('content-type', 'application/octet-stream')
+        if response.ok and content_type.startswith(RECORDED_CONTENT_TYPES):
+            self.server.store.save(parsed.path, parsed.query, response.status_code, content_type, response.content)
+        self._send(response.status_code, content_type, response.content)
+
+    def _send(self, status, content_type, body, retry_after=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        if retry_after is not None:
+            self.send_header('Retry-After', str(retry_after))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if not self.server.config.quiet:
+            super().log_message(format, *args)
+
+
+def make_server(config):
+    """Create a replay server for parsed command-line options"""
+    server = ThreadingHTTPServer((config.host, config.port), ReplayHandler)
+    server.daemon_threads = True
+    server.config = config
+    server.store = FixtureStore(config.fixtures)
+    return server
+
+
+def start_in_thread(**options):
+    """
+    Start a replay server on a background thread
+
+    Accepts the same options as the command line (e.g. port=0 for a random
+    free port, latency_ms=200).
+
+    Returns:
+        Tuple of (server, base_url); call server.shutdown() when done
+    """
+    config = parse_arguments(['serve'])
+    for name, value in options.items():
+        setattr(config, name, value)
+    server = make_server(config)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    return server, f"http://{host}:{port}"
+
+
+def parse_arguments(argv=None):
+    """Parse command-line arguments"""
+    parser = argparse.ArgumentParser(description='Serve or record naukri.com fixtures for offline benchmarks')
+    parser.add_argument('mode', choices=['serve', 'record'], help='Serve fixtures or record them through a proxy')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--fixtures', default=DEFAULT_FIXTURES_DIR, help='Fixtures directory')
+    parser.add_argument('--upstream', default=DEFAULT_UPSTREAM, help='Site to proxy to in record mode')
+    parser.add_argument('--latency-ms', type=float, default=0, help='Delay added to every response')
+    parser.add_argument('--jitter-ms', type=float, default=0, help='Random +/- variation of the delay')
+    parser.add_argument('--error-rate', type=float, default=0, help='Fraction of requests answered with an error')
+    parser.add_argument('--error-status', type=int, default=503,
+                        help='Status of injected errors (200 serves a captcha page)')
+    parser.add_argument('--retry-after', type=int, default=None, help='Retry-After header sent with injected errors')
+    parser.add_argument('--quiet', action='store_true', help='Do not log requests')
+    return parser.parse_args(argv)
+
+
+def main():
+    config = parse_arguments()
+    server = make_server(config)
+    host, port = server.server_address[:2]
+    print(f"{config.mode.capitalize()} mode on http://{host}:{port} (fixtures: {config.fixtures})")
+    if config.mode == 'record':
+        print(f"Proxying to {config.upstream}")
+    print(f"Point the scraper at it with NAUKRI_BASE_URL=http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmarks for the search and details pipelines.
+
+Every stage runs against the local replay server and bundled fixtures, so
+results do not depend on naukri.com. Browser stages need Chrome and are
+skipped (with the reason recorded) when it cannot be started.
+
+Usage (from the backend directory):
+    python -m benchmarks.run
+    python -m benchmarks.run --iterations 50 --output results.json
+    python -m benchmarks.run --stages api_parsing detail_parsing --compare baseline.json
+
+Stages:
+    driver_startup   Launch and quit Chrome
+    page_load        Load a search results page in the browser
+    card_extraction  Extract job cards from the loaded page
+    api_request      Fetch and parse /jobapi/v3/search over HTTP
+    api_parsing      Parse a /jobapi/v3/search JSON response
+    detail_parsing   Parse a job detail page with BeautifulSoup
+    serializer       Encode 100 parsed jobs into a search response
+
+Output is a JSON document with p50/p95 latency, throughput and peak RSS per
+stage; ``--compare`` prints the change against an earlier run.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from benchmarks.replay_server import DEFAULT_FIXTURES_DIR, FixtureStore, start_in_thread  # noqa: E402
+
+
+SEARCH_PARAMS = {
+    'job_type': 'job',
+    'keyword': 'python developer',
+    'location': 'bangalore',
+}
+
+BROWSER_STAGES = ['driver_startup', 'page_load', 'card_extraction']
+ALL_STAGES = BROWSER_STAGES + ['api_request', 'api_parsing', 'detail_parsing', 'serializer']
+
+
+def percentile(samples, fraction):
+    """Return the nearest-rank percentile of a list of samples"""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in megabytes"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return round(peak / divisor, 1)
+
+
+def measure(func, iterations, warmup=1):
+    """
+    Time a callable repeatedly
+
+    Args:
+        func: Callable returning the number of items it processed
+        iterations: Number of timed runs
+        warmup: Untimed runs before measuring
+
+    Returns:
+        Dictionary of latency percentiles (ms), throughput and peak RSS
+    """
+    for _ in range(warmup):
+        func()
+
+    samples = []
+    items = 0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        items += func() or 0
+        samples.append(time.perf_counter() - start)
+
+    total = sum(samples)
+    return {
+        'iterations': iterations,
+        'p50_ms': round(percentile(samples, 0.50) * 1000, 3),
+        'p95_ms': round(percentile(samples, 0.95) * 1000, 3),
+        'mean_ms': round(statistics.mean(samples) * 1000, 3),
+        'min_ms': round(min(samples) * 1000, 3),
+        'max_ms': round(max(samples) * 1000, 3),
+        'ops_per_sec': round(iterations / total, 2) if total else None,
+        'items_per_sec': round(items / total, 2) if total and items else None,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+class BenchmarkContext:
+    """Shared state for the stages: replay server, fixtures and a browser"""
+
+    def __init__(self, base_url, fixtures_dir, headless=True):
+        from scraper.naukri_scraper import NaukriScraper
+
+        self.base_url = base_url
+        self.headless = headless
+        self.store = FixtureStore(fixtures_dir)
+        self.parser = NaukriScraper(base_url=base_url, browser=False)
+        self._browser = None
+
+        self.api_payload = self.store.read(self._default_entry('api'))
+        self.detail_html = self.store.read(self._default_entry('details')).decode('utf-8')
+        self.jobs = self._load_all_api_jobs()
+
+    def _default_entry(self, kind):
+        index = self.store.index
+        return index['entries'][index['defaults'][kind]]
+
+    def _load_all_api_jobs(self):
+        jobs = []
+        for entry in self.store.index['entries'].values():
+            if 'json' in entry['content_type']:
+                data = json.loads(self.store.read(entry))
+                jobs.extend(self.parser._parse_api_job_data(data.get('jobDetails', []), max_jobs=1000))
+        return jobs
+
+    def new_browser(self):
+        from scraper.naukri_scraper import NaukriScraper
+        return NaukriScraper(headless=self.headless, base_url=self.base_url)
+
+    @property
+    def browser(self):
+        if self._browser is None:
+            self._browser = self.new_browser()
+        return self._browser
+
+    def close(self):
+        if self._browser is not None:
+            self._browser.close()
+            self._browser = None
+
+
+def stage_driver_startup(ctx):
+    def run():
+        ctx.new_browser().close()
+        return 1
+    return run
+
+
+def stage_page_load(ctx):
+    url = ctx.browser.build_url(**SEARCH_PARAMS)
+
+    def run():
+        ctx.browser._navigate(url)
+        return 1
+    return run
+
+
+def stage_card_extraction(ctx):
+    ctx.browser._navigate(ctx.browser.build_url(**SEARCH_PARAMS))
+    if not ctx.browser._wait_for_container(layout='job'):
+        raise RuntimeError('Job cards container not found on the replayed page')
+
+    def run():
+        return len(ctx.browser._extract_job_cards(max_jobs=20))
+    return run
+
+
+def stage_api_request(ctx):
+    def run():
+        jobs, _ = ctx.parser.scrape_jobs_via_api(max_jobs=20, **SEARCH_PARAMS)
+        return len(jobs)
+    return run
+
+
+def stage_api_parsing(ctx):
+    def run():
+        data = json.loads(ctx.api_payload)
+        return len(ctx.parser._parse_api_job_data(data['jobDetails'], max_jobs=1000))
+    return run
+
+
+def stage_detail_parsing(ctx):
+    def run():
+        ctx.parser.parse_job_details(ctx.detail_html)
+        return 1
+    return run
+
+
+def stage_serializer(ctx):
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+    import django
+    django.setup()
+    from jobs.renderers import FastJSONRenderer
+
+    renderer = FastJSONRenderer()
+    jobs = (ctx.jobs * (100 // max(1, len(ctx.jobs)) + 1))[:100]
+
+    def run():
+        renderer.render({'success': True, 'jobs': jobs})
+        return len(jobs)
+    return run
+
+
+STAGES = {
+    'driver_startup': stage_driver_startup,
+    'page_load': stage_page_load,
+    'card_extraction': stage_card_extraction,
+    'api_request': stage_api_request,
+    'api_parsing': stage_api_parsing,
+    'detail_parsing': stage_detail_parsing,
+    'serializer': stage_serializer,
+}
+
+
+def run_benchmarks(stages, iterations, browser_iterations, fixtures_dir, headless=True, log=print):
+    """
+    Run the selected stages against an in-process replay server
+
+    Returns:
+        Results dictionary (see module docstring)
+    """
+    server, base_url = start_in_thread(port=0, fixtures=fixtures_dir, quiet=True)
+    # Keep the adaptive rate limiter from throttling the local server
+    os.environ.setdefault('NAUKRI_RATE_LIMIT', '1000')
+    os.environ.setdefault('NAUKRI_RATE_LIMIT_MAX', '1000')
+    os.environ.setdefault('NAUKRI_RATE_LIMIT_BURST', '1000')
+
+    ctx = BenchmarkContext(base_url, fixtures_dir, headless=headless)
+    results = {}
+    try:
+        for name in stages:
+            count = browser_iterations if name in BROWSER_STAGES else iterations
+            log(f"Running {name} ({count} iterations)...")
+            try:
+                results[name] = measure(STAGES[name](ctx), count)
+            except Exception as e:
+                results[name] = {'skipped': True, 'reason': str(e).splitlines()[0][:200]}
+                log(f"  skipped: {results[name]['reason']}")
+    finally:
+        ctx.close()
+        server.shutdown()
+
+    return {
+        'timestamp': datetime.now().isoformat(),
+        'environment': environment_info(),
+        'stages': results,
+    }
+
+
+def environment_info():
+    """Describe the machine and revision the benchmark ran on"""
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=BACKEND_DIR, capture_output=True, text=True, timeout=5
+        ).stdout.strip()
+    except Exception:
+        commit = ''
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'git_commit': commit,
+    }
+
+
+def print_table(results, baseline=None):
+    """Print a summary table, with deltas against a baseline run if given"""
+    header = f"{'stage':<16} {'p50 ms':>10} {'p95 ms':>10} {'ops/s':>10} {'items/s':>10} {'rss MB':>8}"
+    if baseline:
+        header += f" {'p50 change':>11}"
+    print(header)
+    print('-' * len(header))
+
+    base_stages = (baseline or {}).get('stages', {})
+    for name, stats in results['stages'].items():
+        if stats.get('skipped'):
+            print(f"{name:<16} skipped: {stats['reason']}")
+            continue
+        line = (
+            f"{name:<16} {stats['p50_ms']:>10.2f} {stats['p95_ms']:>10.2f} "
+            f"{stats['ops_per_sec'] or 0:>10.1f} {stats['items_per_sec'] or 0:>10.1f} {stats['peak_rss_mb']:>8.1f}"
+        )
+        previous = base_stages.get(name, {})
+        if baseline and previous.get('p50_ms'):
+            change = (stats['p50_ms'] - previous['p50_ms']) / previous['p50_ms']
+            line += f" {change:>+10.1%}"
+        print(line)
+
+
+def parse_arguments(argv=None):
+    """Parse command-line arguments"""
+    parser = argparse.ArgumentParser(description='Benchmark the search and details pipelines against local fixtures')
+    parser.add_argument('--stages', nargs='+', choices=ALL_STAGES, default=ALL_STAGES, help='Stages to run')
+    parser.add_argument('--iterations', type=int, default=20, help='Timed runs per non-browser stage')
+    parser.add_argument('--browser-iterations', type=int, default=3, help='Timed runs per browser stage')
+    parser.add_argument('--fixtures', default=DEFAULT_FIXTURES_DIR, help='Fixtures directory')
+    parser.add_argument('--no-headless', action='store_false', dest='headless', help='Show the browser')
+    parser.add_argument('--output', '-o', help='Write results as JSON to this file')
+    parser.add_argument('--compare', help='Earlier results JSON file to compare against')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_arguments(argv)
+    results = run_benchmarks(
+        args.stages, args.iterations, args.browser_iterations, args.fixtures, headless=args.headless
+    )
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    print()
+    print_table(results, baseline)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
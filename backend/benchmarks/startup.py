@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark: import time of Django entry points.
+
+Each scenario runs in a fresh interpreter and reports wall time (process
+start to exit) and in-process import time, plus which heavy scraping
+dependencies ended up imported.
+
+Usage (from the backend directory):
+    python -m benchmarks.startup
+    python -m benchmarks.startup --runs 10 --output startup.json
+    python -m benchmarks.startup --importtime worker_boot
+
+Scenarios:
+    django_setup    django.setup() only
+    migrate         What ``manage.py migrate`` loads before touching the
+                    database: apps, system checks (URLconf and views) and
+                    the migration graph
+    worker_boot     What a gunicorn worker loads: the WSGI application and
+                    the URLconf
+    engine_warmup   worker_boot plus scraper.naukri_service.warmup()
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ['selenium', 'webdriver_manager', 'bs4', 'requests', 'pandas', 'numpy']
+
+_PRELUDE = """
+import os, sys, time, json
+start = time.perf_counter()
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+"""
+
+_EPILOGUE = """
+elapsed = time.perf_counter() - start
+print(json.dumps({'import_ms': elapsed * 1000, 'modules': [m for m in %r if m in sys.modules]}))
+""" % (HEAVY_MODULES,)
+
+SCENARIOS = {
+    'django_setup': """
+import django
+django.setup()
+""",
+    'migrate': """
+import django
+django.setup()
+from django.core import checks
+from django.db.migrations.loader import MigrationLoader
+checks.run_checks()
+MigrationLoader(None, ignore_no_migrations=True)
+""",
+    'worker_boot': """
+from backend.wsgi import application
+from django.urls import get_resolver
+get_resolver().url_patterns
+""",
+    'engine_warmup': """
+from backend.wsgi import application
+from django.urls import get_resolver
+get_resolver().url_patterns
+from scraper.naukri_service import warmup
+warmup()
+""",
+}
+
+
+def run_scenario(name, runs):
+    """
+    Run a scenario in fresh interpreters
+
+    Returns:
+        Dictionary with wall and import time (ms) and the heavy modules loaded
+    """
+    code = _PRELUDE + SCENARIOS[name] + _EPILOGUE
+    wall_samples = []
+    import_samples = []
+    modules = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, '-c', code],
+            cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        )
+        wall_samples.append((time.perf_counter() - start) * 1000)
+        output = json.loads(completed.stdout.strip().splitlines()[-1])
+        import_samples.append(output['import_ms'])
+        modules = output['modules']
+    return {
+        'runs': runs,
+        'wall_ms_median': round(statistics.median(wall_samples), 1),
+        'wall_ms_min': round(min(wall_samples), 1),
+        'import_ms_median': round(statistics.median(import_samples), 1),
+        'import_ms_min': round(min(import_samples), 1),
+        'heavy_modules': modules,
+    }
+
+
+def import_profile(name, top=20):
+    """Return the slowest imports of a scenario (cumulative microseconds)"""
+    code = _PRELUDE + SCENARIOS[name]
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+    )
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_part, cumulative_us, module = line.split('|', 2)
+        self_us = self_part.split(':', 1)[1]
+        rows.append((int(cumulative_us), int(self_us), module.strip()))
+    rows.sort(reverse=True)
+    return rows[:top]
+
+
+def parse_arguments(argv=None):
+    """Parse command-line arguments"""
+    parser = argparse.ArgumentParser(description='Measure import time of the Django entry points')
+    parser.add_argument('--scenarios', nargs='+', choices=list(SCENARIOS), default=list(SCENARIOS),
+                        help='Scenarios to run')
+    parser.add_argument('--runs', type=int, default=5, help='Fresh interpreters per scenario')
+    parser.add_argument('--importtime', choices=list(SCENARIOS),
+                        help='Print the slowest imports of one scenario instead')
+    parser.add_argument('--output', '-o', help='Write results as JSON to this file')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_arguments(argv)
+
+    if args.importtime:
+        print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+        for cumulative_us, self_us, module in import_profile(args.importtime):
+            print(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>9.1f}  {module}")
+        return 0
+
+    results = {}
+    print(f"{'scenario':<15} {'wall ms':>9} {'import ms':>10}  heavy modules loaded")
+    for name in args.scenarios:
+        results[name] = stats = run_scenario(name, args.runs)
+        print(
+            f"{name:<15} {stats['wall_ms_median']:>9.1f} {stats['import_ms_median']:>10.1f}  "
+            f"{', '.join(stats['heavy_modules']) or '-'}"
+        )
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'python': sys.version.split()[0], 'scenarios': results}, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
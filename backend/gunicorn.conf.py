@@ -0,0 +1,38 @@
+"""
+Gunicorn configuration.
+
+The Django application is loaded once in the master (preload_app) and
+forked into the workers. Each worker then warms up in ``post_worker_init``,
+before it accepts requests: it imports the scraping engine, resolves
+chromedriver and starts NAUKRI_BROWSER_POOL_SIZE headless browsers (see
+scraper.warmup). Browsers are started after the fork because Chrome
+processes cannot be shared between workers, and after the worker has
+installed its own signal handlers (unlike ``post_fork``) so the master's
+SIGCHLD handler does not reap the subprocesses Chrome and chromedriver use.
+
+Usage (from the backend directory):
+    gunicorn -c gunicorn.conf.py backend.wsgi:application
+"""
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv('WEB_CONCURRENCY', '2'))
+# Browser scrapes take tens of seconds; the default 30s would kill workers mid-scrape
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '120'))
+preload_app = True
+
+
+def when_ready(server):
+    # Import the scraping engine in the master so workers inherit it on fork
+    from scraper.naukri_service import warmup
+    server.log.info(f"Scraping engine imported in {warmup()} ms")
+
+
+def post_worker_init(worker):
+    from scraper.warmup import warmup_worker
+    warmup_worker(log=worker.log.info)
+
+
+def worker_exit(server, worker):
+    from scraper.browser_pool import get_browser_pool
+    get_browser_pool().close_all()
@@ -0,0 +1,27 @@
+from django.contrib import admin
+
+from .models import SavedSearch, ScrapedJob, SearchResult
+
+
+@admin.register(SavedSearch)
+class SavedSearchAdmin(admin.ModelAdmin):
+    list_display = ('__str__', 'job_type', 'interval_minutes', 'is_active', 'next_run_at', 'last_run_at', 'last_status')
+    list_filter = ('job_type', 'is_active')
+    search_fields = ('name', 'keyword', 'location')
+
+
+@admin.register(SearchResult)
+class SearchResultAdmin(admin.ModelAdmin):
+    list_display = ('__str__', 'data_source', 'count', 'scraped_at')
+    list_filter = ('data_source', 'job_type')
+    search_fields = ('keyword', 'location')
+    readonly_fields = ('scraped_at',)
+
+
+@admin.register(ScrapedJob)
+class ScrapedJobAdmin(admin.ModelAdmin):
+    list_display = ('job_title', 'company_name', 'location', 'experience', 'job_type', 'duplicate_of', 'last_seen_at')
+    list_filter = ('job_type', ('duplicate_of', admin.EmptyFieldListFilter))
+    search_fields = ('job_title', 'company_name', 'job_url')
+    readonly_fields = ('first_seen_at', 'last_seen_at')
+    raw_id_fields = ('duplicate_of',)
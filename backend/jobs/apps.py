@@ -1,3 +1,5 @@
+import os
+
 from django.apps import AppConfig
 
 
@@ -5,3 +7,8 @@ class JobsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'jobs'
 
+    def ready(self):
+        # Under gunicorn, warmup runs from the post_worker_init hook (gunicorn.conf.py)
+        if os.getenv('NAUKRI_WARMUP_ON_READY', 'False').lower() == 'true':
+            from scraper.warmup import start_warmup_thread
+            start_warmup_thread()
@@ -0,0 +1,121 @@
+"""
+Content-hash ETags and conditional GET for search and details responses.
+
+The ETag of a response is a hash of its content (jobs and pagination for a
+search, the job details for a details request); timings and other debug
+metadata are left out so that an identical re-scrape keeps the same ETag.
+The latest ETag of every query is kept in the Django cache for
+``ETAG_CACHE_SECONDS``, so a client revalidating with ``If-None-Match``
+gets a 304 without a scrape while that entry is fresh. As RFC 9110
+requires, 304s are only sent for GET and HEAD requests; POST responses carry
+the ETag so the client can revalidate with a GET.
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+
+from scraper.metrics import record_cache_lookup
+
+from .renderers import dumps
+
+SAFE_METHODS = ('GET', 'HEAD')
+
+# Suffixes CompressionMiddleware appends to ETags of encoded responses
+ENCODING_SUFFIXES = ('-br', '-gzip')
+
+
+def compute_etag(content):
+    """Return a strong ETag for JSON-serializable content (may contain Job records)"""
+    return f'"{hashlib.sha256(dumps(content)).hexdigest()[:32]}"'
+
+
+def _opaque(etag):
+    """Strip the weak prefix and encoding suffix of an ETag for comparison"""
+    if etag.startswith('W/'):
+        etag = etag[2:]
+    for suffix in ENCODING_SUFFIXES:
+        if etag.endswith(f'{suffix}"'):
+            return etag[:-len(suffix) - 1] + '"'
+    return etag
+
+
+def etag_matches(if_none_match, etag):
+    """
+    Check an If-None-Match header against an ETag (weak comparison)
+
+    Args:
+        if_none_match: Header value (may list several ETags or be '*')
+        etag: Current ETag of the resource
+    """
+    if not if_none_match or not etag:
+        return False
+    candidates = parse_etags(if_none_match)
+    if '*' in candidates:
+        return True
+    return _opaque(etag) in {_opaque(candidate) for candidate in candidates}
+
+
+def _cache_key(kind, key):
+    return f"etag:{kind}:{key}"
+
+
+def cached_etag(kind, key):
+    """Return the last ETag served for a query, or None"""
+    return cache.get(_cache_key(kind, key))
+
+
+def store_etag(kind, key, etag):
+    """Remember the ETag served for a query"""
+    cache.set(_cache_key(kind, key), etag, settings.ETAG_CACHE_SECONDS)
+
+
+def not_modified_response(request, kind, key):
+    """
+    Answer a revalidation request from the ETag cache
+
+    Returns:
+        A 304 response if the request's If-None-Match matches the cached
+        ETag of the query, otherwise None (the caller must scrape)
+    """
+    if_none_match = request.headers.get('If-None-Match')
+    if not if_none_match or request.method not in SAFE_METHODS:
+        return None
+    etag = cached_etag(kind, key)
+    hit = etag_matches(if_none_match, etag)
+    record_cache_lookup('etag', hit)
+    if not hit:
+        return None
+    return with_etag(Response(status=status.HTTP_304_NOT_MODIFIED), etag)
+
+
+def with_etag(response, etag):
+    """Set the ETag and revalidation headers on a response"""
+    response['ETag'] = etag
+    response['Cache-Control'] = 'no-cache'
+    return response
+
+
+def conditional_response(request, kind, key, data, content):
+    """
+    Build the response of a fresh scrape with its content ETag
+
+    Args:
+        request: Current request
+        kind: 'search' or 'details'
+        key: Query key the ETag is cached under
+        data: Response body
+        content: Stable part of the body the ETag is computed from
+
+    Returns:
+        304 if the client already holds this content (GET/HEAD only),
+        otherwise a 200 response with the body
+    """
+    etag = compute_etag(content)
+    store_etag(kind, key, etag)
+    if request.method in SAFE_METHODS and etag_matches(request.headers.get('If-None-Match'), etag):
+        return with_etag(Response(status=status.HTTP_304_NOT_MODIFIED), etag)
+    return with_etag(Response(data, status=status.HTTP_200_OK), etag)
@@ -0,0 +1,180 @@
+"""
+Facet values of scraped listings.
+
+Facets are derived once, when a listing is indexed (see
+``jobs.search_index``), and stored as ``JobFacet`` rows so that counts and
+filters run as indexed SQL over every stored listing instead of over the
+page the browser happens to hold. A listing can have several values for one
+facet (e.g. two cities or Remote and Hybrid).
+
+Department and role category come from the job details page when it has
+been scraped; otherwise they are guessed from the title and tags. The
+stipend bucket comes from the normalized salary (``scraper.normalize``).
+"""
+import re
+
+FACET_NAMES = ('department', 'role_category', 'stipend', 'work_mode', 'city')
+
+# (facet value, pattern) pairs; the first match wins
+_DEPARTMENT_RULES = (
+    ('Engineering', r'engineer|developer|software|programmer'),
+    ('Marketing', r'marketing|digital|seo\b'),
+    ('Sales', r'sales|business development'),
+    ('Design', r'design|\bui\b|\bux\b'),
+    ('Data & Analytics', r'\bdata\b|analyst|analytics|science'),
+    ('HR', r'\bhr\b|human resource|recruit|talent acquisition'),
+    ('Finance', r'financ|accounting|accountant'),
+    ('Operations', r'operations|\bops\b'),
+)
+
+_ROLE_RULES = (
+    ('Mobile', r'mobile|android|\bios\b|flutter|react native'),
+    ('Full Stack', r'full[\s-]?stack|\bmern\b|\bmean\b'),
+    ('Frontend', r'front[\s-]?end|react|angular|vue|javascript|typescript'),
+    ('Backend', r'back[\s-]?end|node|python|\bjava\b|django|spring|golang'),
+    ('DevOps', r'devops|cloud|\baws\b|azure|kubernetes|docker'),
+    ('Data Science', r'\bdata\b|machine learning|\bml\b|\bai\b|deep learning'),
+)
+
+_DEPARTMENT_RULES = tuple((value, re.compile(pattern)) for value, pattern in _DEPARTMENT_RULES)
+_ROLE_RULES = tuple((value, re.compile(pattern)) for value, pattern in _ROLE_RULES)
+
+_REMOTE = re.compile(r'remote|work from home|\bwfh\b')
+_HYBRID = re.compile(r'hybrid')
+
+# Former or alternate names of cities, lowercase, to the name facets use
+_CITY_ALIASES = {
+    'bangalore': 'Bengaluru',
+    'bengaluru': 'Bengaluru',
+    'gurgaon': 'Gurugram',
+    'gurugram': 'Gurugram',
+    'bombay': 'Mumbai',
+    'mumbai': 'Mumbai',
+    'madras': 'Chennai',
+    'chennai': 'Chennai',
+    'calcutta': 'Kolkata',
+    'kolkata': 'Kolkata',
+    'new delhi': 'Delhi',
+    'delhi': 'Delhi',
+    'poona': 'Pune',
+    'pune': 'Pune',
+    'trivandrum': 'Thiruvananthapuram',
+    'thiruvananthapuram': 'Thiruvananthapuram',
+    'baroda': 'Vadodara',
+    'vadodara': 'Vadodara',
+    'mysore': 'Mysuru',
+    'mysuru': 'Mysuru',
+}
+
+
+def _first_match(rules, text):
+    for value, pattern in rules:
+        if pattern.search(text):
+            return value
+    return None
+
+
+def department(job_title, detail_department=''):
+    """Department from the details page, else guessed from the title"""
+    if detail_department:
+        return detail_department.split('-')[0].strip()
+    return _first_match(_DEPARTMENT_RULES, (job_title or '').lower())
+
+
+def role_categories(tags, job_title='', detail_role_category=''):
+    """Role categories from the details page, else from the tags and title"""
+    if detail_role_category:
+        return [detail_role_category.strip()]
+    roles = set()
+    for text in list(tags or ()) + [job_title or '']:
+        role = _first_match(_ROLE_RULES, text.lower())
+        if role:
+            roles.add(role)
+    return sorted(roles)
+
+
+def stipend(min_salary, max_salary=None):
+    """
+    Monthly stipend bucket of a normalized salary
+
+    Args:
+        min_salary: Lower bound in annual INR (scraper.normalize), or None
+        max_salary: Upper bound in annual INR, used when there is no lower bound
+
+    Returns:
+        '0-10k', '10k-20k', '20k-30k', '30k+' or 'Unpaid', or None if the
+        salary is unknown
+    """
+    annual = min_salary if min_salary is not None else max_salary
+    if annual is None:
+        return None
+    amount = annual / 12
+    if amount == 0:
+        return 'Unpaid'
+    if amount < 10000:
+        return '0-10k'
+    if amount < 20000:
+        return '10k-20k'
+    if amount < 30000:
+        return '20k-30k'
+    return '30k+'
+
+
+def work_modes(location, job_description=''):
+    """Remote and/or Hybrid when the listing mentions them, else On-site"""
+    text = f"{location or ''} {job_description or ''}".lower()
+    modes = []
+    if _REMOTE.search(text):
+        modes.append('Remote')
+    if _HYBRID.search(text):
+        modes.append('Hybrid')
+    return modes or ['On-site']
+
+
+def canonical_city(place):
+    """
+    Canonical name of a place ("bangalore" and "Bangalore/Bengaluru" give
+    "Bengaluru"); places without a known alias are returned stripped
+    """
+    place = ' '.join((place or '').split())
+    for name in [place] + place.split('/'):
+        canonical = _CITY_ALIASES.get(name.strip().lower())
+        if canonical:
+            return canonical
+    return place
+
+
+def cities(location):
+    """The comma-separated places of a location label (canonical names), without remote markers"""
+    places = []
+    for place in (location or '').split(','):
+        place = canonical_city(place)
+        if place and not _REMOTE.search(place.lower()) and place not in places:
+            places.append(place)
+    return places
+
+
+def compute_facets(scraped_job):
+    """
+    Derive the facet values of a listing
+
+    Args:
+        scraped_job: ScrapedJob (or any object with the same attributes)
+
+    Returns:
+        List of (facet name, value) pairs
+    """
+    pairs = []
+    dept = department(scraped_job.job_title, scraped_job.department)
+    if dept:
+        pairs.append(('department', dept))
+    for role in role_categories(scraped_job.tags, scraped_job.job_title, scraped_job.role_category):
+        pairs.append(('role_category', role))
+    bucket = stipend(scraped_job.min_salary, scraped_job.max_salary)
+    if bucket:
+        pairs.append(('stipend', bucket))
+    for mode in work_modes(scraped_job.location, scraped_job.job_description):
+        pairs.append(('work_mode', mode))
+    for city in cities(scraped_job.location):
+        pairs.append(('city', city[:100]))
+    return pairs
@@ -0,0 +1,55 @@
+"""
+SQLite FTS5 triggers for the local search index.
+
+Migration 0002 creates ``jobs_scrapedjob_fts`` and these triggers. SQLite
+applies most ``ALTER``-style migrations by rebuilding ``jobs_scrapedjob``,
+which drops its triggers, so any migration that changes that table must end
+with ``migrations.RunPython(restore_fts_triggers, migrations.RunPython.noop)``.
+"""
+from django.db import OperationalError
+
+FTS_TABLE = 'jobs_scrapedjob_fts'
+
+TRIGGERS_SQL = [
+    """
+    CREATE TRIGGER jobs_scrapedjob_fts_ai AFTER INSERT ON jobs_scrapedjob BEGIN
+        INSERT INTO jobs_scrapedjob_fts(rowid, job_title, company_name, job_description, tags, key_skills)
+        VALUES (new.id, new.job_title, new.company_name, new.job_description, new.tags, new.key_skills);
+    END
+    """,
+    """
+    CREATE TRIGGER jobs_scrapedjob_fts_ad AFTER DELETE ON jobs_scrapedjob BEGIN
+        INSERT INTO jobs_scrapedjob_fts(jobs_scrapedjob_fts, rowid, job_title, company_name, job_description, tags, key_skills)
+        VALUES ('delete', old.id, old.job_title, old.company_name, old.job_description, old.tags, old.key_skills);
+    END
+    """,
+    """
+    CREATE TRIGGER jobs_scrapedjob_fts_au
+    AFTER UPDATE OF job_title, company_name, job_description, tags, key_skills ON jobs_scrapedjob BEGIN
+        INSERT INTO jobs_scrapedjob_fts(jobs_scrapedjob_fts, rowid, job_title, company_name, job_description, tags, key_skills)
+        VALUES ('delete', old.id, old.job_title, old.company_name, old.job_description, old.tags, old.key_skills);
+        INSERT INTO jobs_scrapedjob_fts(rowid, job_title, company_name, job_description, tags, key_skills)
+        VALUES (new.id, new.job_title, new.company_name, new.job_description, new.tags, new.key_skills);
+    END
+    """,
+]
+
+DROP_TRIGGERS_SQL = [
+    'DROP TRIGGER IF EXISTS jobs_scrapedjob_fts_ai',
+    'DROP TRIGGER IF EXISTS jobs_scrapedjob_fts_ad',
+    'DROP TRIGGER IF EXISTS jobs_scrapedjob_fts_au',
+]
+
+
+def restore_fts_triggers(apps, schema_editor):
+    """Recreate the FTS triggers and rebuild the index (no-op without the FTS table)"""
+    connection = schema_editor.connection
+    if connection.vendor != 'sqlite' or FTS_TABLE not in connection.introspection.table_names():
+        return
+    with connection.cursor() as cursor:
+        for statement in DROP_TRIGGERS_SQL + TRIGGERS_SQL:
+            cursor.execute(statement)
+        try:
+            cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+        except OperationalError as e:
+            print(f"\n  Could not rebuild {FTS_TABLE}: {e}")
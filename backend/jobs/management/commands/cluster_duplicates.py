@@ -0,0 +1,54 @@
+"""
+Group stored listings into near-duplicate clusters.
+
+Signs every listing that has no MinHash signature yet (or all of them with
+--resign) and links each listing to the oldest listing of its cluster.
+
+Usage:
+    python manage.py cluster_duplicates
+    python manage.py cluster_duplicates --threshold 0.8 --resign
+    python manage.py cluster_duplicates --dry-run
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from jobs.near_duplicates import cluster_corpus, near_duplicate_threshold
+
+
+class Command(BaseCommand):
+    help = 'Cluster stored listings into near-duplicate groups with MinHash/LSH'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=None,
+            help='Minimum estimated Jaccard similarity (default: NAUKRI_NEAR_DUP_THRESHOLD or 0.7)'
+        )
+        parser.add_argument(
+            '--resign',
+            action='store_true',
+            help='Recompute every signature, not only missing ones'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report the clusters without saving them'
+        )
+
+    def handle(self, *args, **options):
+        threshold = options['threshold']
+        if threshold is None:
+            threshold = near_duplicate_threshold()
+        if not 0 < threshold <= 1:
+            raise CommandError('--threshold must be between 0 and 1')
+
+        stats = cluster_corpus(threshold=threshold, resign=options['resign'], dry_run=options['dry_run'])
+
+        self.stdout.write(
+            f"{stats['listings']} listings, {stats['signed']} signed, "
+            f"{stats['clusters']} clusters, {stats['duplicates']} near-duplicates (threshold {threshold})"
+        )
+        if options['dry_run']:
+            self.stdout.write('Dry run: nothing was saved')
+        else:
+            self.stdout.write(self.style.SUCCESS('Near-duplicate links updated'))
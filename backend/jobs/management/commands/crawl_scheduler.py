@@ -0,0 +1,58 @@
+"""
+Run saved searches on their configured schedule.
+
+Usage:
+    python manage.py crawl_scheduler
+    python manage.py crawl_scheduler --once --max-concurrency 4
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from jobs.scheduler import CrawlScheduler
+
+
+class Command(BaseCommand):
+    help = 'Run saved searches at their configured intervals and persist the results'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Run every due search once and exit instead of polling forever'
+        )
+        parser.add_argument(
+            '--max-concurrency',
+            type=int,
+            default=settings.SCHEDULER_MAX_CONCURRENCY,
+            help='Maximum number of scrapes running at the same time'
+        )
+        parser.add_argument(
+            '--jitter',
+            type=int,
+            default=settings.SCHEDULER_JITTER_SECONDS,
+            help='Maximum random offset (seconds) added to each run interval'
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=int,
+            default=settings.SCHEDULER_POLL_SECONDS,
+            help='Seconds between checks for due searches'
+        )
+
+    def handle(self, *args, **options):
+        scheduler = CrawlScheduler(
+            max_concurrency=options['max_concurrency'],
+            jitter_seconds=options['jitter'],
+            poll_seconds=options['poll_interval'],
+            log=lambda message: self.stdout.write(message)
+        )
+
+        if options['once']:
+            submitted = scheduler.run_once()
+            self.stdout.write(self.style.SUCCESS(f"Ran {submitted} due search(es)"))
+            return
+
+        try:
+            scheduler.run_forever()
+        except KeyboardInterrupt:
+            self.stdout.write("\nScheduler stopped")
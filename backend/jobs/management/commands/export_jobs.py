@@ -0,0 +1,88 @@
+"""
+Export the listings of the local search index for analytics.
+
+Writes every stored listing, including the normalized salary/experience
+ranges and the details-page fields (key skills, department, role category,
+industry), to Parquet (needs pyarrow) or JSON Lines.
+
+Usage:
+    python manage.py export_jobs jobs.parquet
+    python manage.py export_jobs jobs.jsonl.gz --job-type internship
+    python manage.py export_jobs jobs.parquet --since-days 7 --row-group-size 100000
+"""
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from jobs.models import ScrapedJob
+from scraper.export import EXPORT_FIELDS, JSONLWriter, ParquetWriter
+
+
+class Command(BaseCommand):
+    help = 'Export indexed listings to Parquet or JSON Lines'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'output',
+            help='Output file (.parquet, .jsonl, .ndjson, optionally .gz for JSON Lines)'
+        )
+        parser.add_argument(
+            '--format',
+            choices=['parquet', 'jsonl'],
+            default=None,
+            help='Output format (default: from the file extension)'
+        )
+        parser.add_argument(
+            '--job-type',
+            choices=['job', 'internship'],
+            default=None,
+            help='Only export this job type'
+        )
+        parser.add_argument(
+            '--since-days',
+            type=int,
+            default=None,
+            help='Only export listings seen in the last N days'
+        )
+        parser.add_argument(
+            '--include-duplicates',
+            action='store_true',
+            help='Also export listings marked as near-duplicates'
+        )
+        parser.add_argument(
+            '--row-group-size',
+            type=int,
+            default=50000,
+            help='Listings per Parquet row group (default: 50000)'
+        )
+
+    def handle(self, *args, **options):
+        output = options['output']
+        output_format = options['format'] or ('parquet' if output.lower().endswith('.parquet') else 'jsonl')
+
+        queryset = ScrapedJob.objects.order_by('id')
+        if options['job_type']:
+            queryset = queryset.filter(job_type=options['job_type'])
+        if options['since_days'] is not None:
+            queryset = queryset.filter(last_seen_at__gte=timezone.now() - timedelta(days=options['since_days']))
+        if not options['include_duplicates']:
+            queryset = queryset.filter(duplicate_of=None)
+        rows = queryset.values(*EXPORT_FIELDS).iterator(chunk_size=2000)
+
+        started = time.perf_counter()
+        try:
+            if output_format == 'parquet':
+                writer = ParquetWriter(output, row_group_size=options['row_group_size'], normalize=False)
+            else:
+                writer = JSONLWriter(output)
+        except ImportError as e:
+            raise CommandError(str(e))
+        with writer:
+            writer.write_many(rows)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Exported {writer.count} listings to {output} ({output_format}) "
+            f"in {time.perf_counter() - started:.1f}s"
+        ))
@@ -0,0 +1,75 @@
+"""
+Show stored request profiles and their top hotspots.
+
+Usage:
+    python manage.py profile_report                 # list profiles
+    python manage.py profile_report <profile_id>    # top hotspots
+    python manage.py profile_report <profile_id> --sort tottime --limit 40
+"""
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from jobs.profiling import SORT_KEYS, list_profiles, top_hotspots
+
+
+class Command(BaseCommand):
+    help = 'List stored request profiles or print the top hotspots of one'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'profile_id',
+            nargs='?',
+            help='Profile to inspect (omit to list profiles)'
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=25,
+            help='Number of profiles or functions to show (default: 25)'
+        )
+        parser.add_argument(
+            '--sort',
+            choices=SORT_KEYS,
+            default='cumulative',
+            help='Hotspot ordering (default: cumulative)'
+        )
+        parser.add_argument(
+            '--json',
+            action='store_true',
+            help='Print the output as JSON'
+        )
+
+    def handle(self, *args, **options):
+        if not options['profile_id']:
+            profiles = list_profiles(limit=options['limit'])
+            if options['json']:
+                self.stdout.write(json.dumps(profiles, indent=2))
+                return
+            if not profiles:
+                self.stdout.write('No profiles stored')
+                return
+            for profile in profiles:
+                params = ', '.join(
+                    f"{name}={value}" for name, value in profile.get('params', {}).items()
+                    if value is not None and name != 'task_type'
+                )
+                self.stdout.write(f"{profile['id']}  {profile['elapsed_ms']:>9.1f} ms  {params}")
+            return
+
+        hotspots = top_hotspots(options['profile_id'], limit=options['limit'], sort=options['sort'])
+        if hotspots is None:
+            raise CommandError(f"No profile with id '{options['profile_id']}'")
+
+        if options['json']:
+            self.stdout.write(json.dumps(hotspots, indent=2))
+            return
+
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f"{'ncalls':>10} {'tottime ms':>12} {'cumtime ms':>12}  function"
+        ))
+        for spot in hotspots:
+            self.stdout.write(
+                f"{spot['ncalls']:>10} {spot['tottime_ms']:>12.1f} {spot['cumtime_ms']:>12.1f}  "
+                f"{spot['function']} ({spot['file']}:{spot['line']})"
+            )
@@ -0,0 +1,45 @@
+"""
+Show hit rates of the browser scraping selectors.
+
+Usage:
+    python manage.py selector_report
+    python manage.py selector_report --json
+"""
+import json
+
+from django.core.management.base import BaseCommand
+
+from scraper.selector_registry import SelectorRegistry
+
+
+class Command(BaseCommand):
+    help = 'Print per-field and per-variant hit rates of the scraping selectors'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--json',
+            action='store_true',
+            help='Print the report as JSON'
+        )
+
+    def handle(self, *args, **options):
+        report = SelectorRegistry().report()
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
+        for field, stats in report.items():
+            hit_rate = _format_rate(stats['hit_rate'])
+            self.stdout.write(self.style.MIGRATE_HEADING(
+                f"{field}: {stats['hits']}/{stats['lookups']} lookups hit ({hit_rate})"
+            ))
+            for position, variant in enumerate(stats['variants'], start=1):
+                self.stdout.write(
+                    f"  {position}. {_format_rate(variant['recent_hit_rate']):>6} recent, "
+                    f"{variant['hits']}/{variant['attempts']} total  {variant['selector']}"
+                )
+
+
+def _format_rate(rate):
+    return '-' if rate is None else f"{rate:.0%}"
@@ -0,0 +1,84 @@
+"""
+Response compression for the jobs API.
+
+Compresses responses of at least ``COMPRESSION_MIN_BYTES`` with Brotli when
+the client accepts it and the ``brotli`` package is installed, and with gzip
+otherwise. Unlike Django's GZipMiddleware, a strong ETag stays strong: the
+encoding is appended to it (``"<hash>-br"``), since each encoding is a
+different byte representation. ``jobs.caching.etag_matches`` ignores that
+suffix when comparing If-None-Match.
+"""
+import re
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_string
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def _accepted_encodings(header):
+    """Return the encodings an Accept-Encoding header allows (q > 0)"""
+    accepted = set()
+    for part in header.split(','):
+        name, _, params = part.strip().partition(';')
+        quality = 1.0
+        match = re.search(r'q=([0-9.]+)', params)
+        if match:
+            try:
+                quality = float(match.group(1))
+            except ValueError:
+                quality = 0.0
+        if name and quality > 0:
+            accepted.add(name.strip().lower())
+    return accepted
+
+
+def _compress(content, encoding):
+    if encoding == 'br':
+        return brotli.compress(content, quality=settings.BROTLI_QUALITY)
+    return compress_string(content)
+
+
+class CompressionMiddleware:
+    """Brotli/gzip compression of large responses, keeping ETags strong"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        if (
+            response.streaming
+            or response.status_code != 200
+            or response.has_header('Content-Encoding')
+            or len(response.content) < settings.COMPRESSION_MIN_BYTES
+        ):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        accepted = _accepted_encodings(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if brotli is not None and 'br' in accepted:
+            encoding = 'br'
+        elif 'gzip' in accepted:
+            encoding = 'gzip'
+        else:
+            return response
+
+        compressed = _compress(response.content, encoding)
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response['Content-Length'] = str(len(compressed))
+        response['Content-Encoding'] = encoding
+
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = f'{etag[:-1]}-{encoding}"'
+        return response
@@ -0,0 +1,61 @@
+# Generated by Django 4.2.7 on 2026-10-19 08:08
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SavedSearch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(blank=True, max_length=200)),
+                ('job_type', models.CharField(choices=[('job', 'Job'), ('internship', 'Internship')], default='job', max_length=20)),
+                ('keyword', models.CharField(max_length=200)),
+                ('location', models.CharField(max_length=200)),
+                ('experience', models.PositiveIntegerField(blank=True, null=True)),
+                ('pages', models.PositiveIntegerField(default=1)),
+                ('page_size', models.PositiveIntegerField(default=20)),
+                ('interval_minutes', models.PositiveIntegerField(default=60)),
+                ('freshness_minutes', models.PositiveIntegerField(default=30, help_text='Skip a run if results newer than this already exist')),
+                ('is_active', models.BooleanField(default=True)),
+                ('next_run_at', models.DateTimeField(blank=True, db_index=True, null=True)),
+                ('last_run_at', models.DateTimeField(blank=True, null=True)),
+                ('last_status', models.CharField(blank=True, max_length=200)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['next_run_at', 'id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SearchResult',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('query_key', models.CharField(db_index=True, max_length=64)),
+                ('job_type', models.CharField(max_length=20)),
+                ('keyword', models.CharField(max_length=200)),
+                ('location', models.CharField(max_length=200)),
+                ('experience', models.PositiveIntegerField(blank=True, null=True)),
+                ('page', models.PositiveIntegerField(default=1)),
+                ('page_size', models.PositiveIntegerField(default=20)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('data_source', models.CharField(blank=True, max_length=50)),
+                ('jobs', models.JSONField(default=list)),
+                ('pagination', models.JSONField(default=dict)),
+                ('scraped_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('saved_search', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='results', to='jobs.savedsearch')),
+            ],
+            options={
+                'ordering': ['-scraped_at'],
+            },
+        ),
+    ]
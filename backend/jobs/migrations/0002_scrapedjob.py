@@ -0,0 +1,104 @@
+# Generated by Django 4.2.7 on 2026-10-19 08:29
+
+from django.db import OperationalError, migrations, models
+
+
+# External-content FTS5 index over the text columns of jobs_scrapedjob, kept
+# in sync by triggers. Porter stemming lets "developer" match "development".
+FTS_SQL = [
+    """
+    CREATE VIRTUAL TABLE jobs_scrapedjob_fts USING fts5(
+        job_title, company_name, job_description, tags, key_skills,
+        content='jobs_scrapedjob', content_rowid='id',
+        tokenize='porter unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER jobs_scrapedjob_fts_ai AFTER INSERT ON jobs_scrapedjob BEGIN
+        INSERT INTO jobs_scrapedjob_fts(rowid, job_title, company_name, job_description, tags, key_skills)
+        VALUES (new.id, new.job_title, new.company_name, new.job_description, new.tags, new.key_skills);
+    END
+    """,
+    """
+    CREATE TRIGGER jobs_scrapedjob_fts_ad AFTER DELETE ON jobs_scrapedjob BEGIN
+        INSERT INTO jobs_scrapedjob_fts(jobs_scrapedjob_fts, rowid, job_title, company_name, job_description, tags, key_skills)
+        VALUES ('delete', old.id, old.job_title, old.company_name, old.job_description, old.tags, old.key_skills);
+    END
+    """,
+    """
+    CREATE TRIGGER jobs_scrapedjob_fts_au
+    AFTER UPDATE OF job_title, company_name, job_description, tags, key_skills ON jobs_scrapedjob BEGIN
+        INSERT INTO jobs_scrapedjob_fts(jobs_scrapedjob_fts, rowid, job_title, company_name, job_description, tags, key_skills)
+        VALUES ('delete', old.id, old.job_title, old.company_name, old.job_description, old.tags, old.key_skills);
+        INSERT INTO jobs_scrapedjob_fts(rowid, job_title, company_name, job_description, tags, key_skills)
+        VALUES (new.id, new.job_title, new.company_name, new.job_description, new.tags, new.key_skills);
+    END
+    """,
+]
+
+DROP_FTS_SQL = [
+    'DROP TRIGGER IF EXISTS jobs_scrapedjob_fts_ai',
+    'DROP TRIGGER IF EXISTS jobs_scrapedjob_fts_ad',
+    'DROP TRIGGER IF EXISTS jobs_scrapedjob_fts_au',
+    'DROP TABLE IF EXISTS jobs_scrapedjob_fts',
+]
+
+
+def create_fts_index(apps, schema_editor):
+    """Create the FTS5 index on SQLite builds that have FTS5; search falls back to LIKE otherwise"""
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        try:
+            cursor.execute(FTS_SQL[0])
+        except OperationalError as e:
+            print(f"\n  FTS5 unavailable ({e}); local search will use LIKE queries")
+            return
+        for statement in FTS_SQL[1:]:
+            cursor.execute(statement)
+
+
+def drop_fts_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for statement in DROP_FTS_SQL:
+            cursor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScrapedJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('job_url', models.CharField(max_length=500, unique=True)),
+                ('job_type', models.CharField(db_index=True, default='job', max_length=20)),
+                ('job_title', models.CharField(blank=True, max_length=300)),
+                ('company_name', models.CharField(blank=True, max_length=200)),
+                ('company_logo', models.CharField(blank=True, max_length=500)),
+                ('rating', models.CharField(blank=True, max_length=20)),
+                ('reviews', models.CharField(blank=True, max_length=50)),
+                ('experience', models.CharField(blank=True, max_length=50)),
+                ('min_experience', models.PositiveIntegerField(blank=True, null=True)),
+                ('max_experience', models.PositiveIntegerField(blank=True, null=True)),
+                ('salary', models.CharField(blank=True, max_length=100)),
+                ('location', models.CharField(blank=True, max_length=300)),
+                ('job_description', models.TextField(blank=True)),
+                ('tags', models.JSONField(default=list)),
+                ('key_skills', models.JSONField(default=list)),
+                ('job_post_date', models.CharField(blank=True, max_length=50)),
+                ('first_seen_at', models.DateTimeField(auto_now_add=True)),
+                ('last_seen_at', models.DateTimeField(auto_now=True, db_index=True)),
+            ],
+            options={
+                'ordering': ['-last_seen_at'],
+            },
+        ),
+        migrations.RunPython(create_fts_index, drop_fts_index),
+    ]
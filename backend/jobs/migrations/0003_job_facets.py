@@ -0,0 +1,57 @@
+# Generated by Django 4.2.7 on 2026-10-19 08:32
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+from jobs.facets import compute_facets
+from jobs.fts import restore_fts_triggers
+
+
+def backfill_facets(apps, schema_editor):
+    ScrapedJob = apps.get_model('jobs', 'ScrapedJob')
+    JobFacet = apps.get_model('jobs', 'JobFacet')
+    facets = []
+    for scraped_job in ScrapedJob.objects.iterator():
+        # The normalized salary arrives in 0004; 0008 adds the stipend facets
+        scraped_job.min_salary = scraped_job.max_salary = None
+        facets.extend(
+            JobFacet(job_id=scraped_job.pk, name=name, value=value)
+            for name, value in compute_facets(scraped_job)
+        )
+    JobFacet.objects.bulk_create(facets, batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0002_scrapedjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='scrapedjob',
+            name='department',
+            field=models.CharField(blank=True, help_text='From the job details page', max_length=200),
+        ),
+        migrations.AddField(
+            model_name='scrapedjob',
+            name='role_category',
+            field=models.CharField(blank=True, help_text='From the job details page', max_length=200),
+        ),
+        migrations.CreateModel(
+            name='JobFacet',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=30)),
+                ('value', models.CharField(max_length=200)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='facets', to='jobs.scrapedjob')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['name', 'value'], name='jobs_jobfac_name_a11e07_idx')],
+                'unique_together': {('job', 'name', 'value')},
+            },
+        ),
+        # AddField rebuilds jobs_scrapedjob on SQLite, which drops the FTS triggers
+        migrations.RunPython(restore_fts_triggers, migrations.RunPython.noop),
+        migrations.RunPython(backfill_facets, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 4.2.7 on 2026-10-19 08:36
+
+from django.db import migrations, models
+
+from jobs.fts import restore_fts_triggers
+
+
+def backfill_normalized(apps, schema_editor):
+    ScrapedJob = apps.get_model('jobs', 'ScrapedJob')
+    scraped_jobs = list(ScrapedJob.objects.only('id', 'salary', 'experience'))
+    if not scraped_jobs:
+        return
+
+    # Imported here so that loading migrations does not import pandas
+    from scraper.normalize import NORMALIZED_FIELDS, normalize_batch
+
+    for scraped_job, values in zip(scraped_jobs, normalize_batch(
+        [{'salary': job.salary, 'experience': job.experience} for job in scraped_jobs]
+    )):
+        for field, value in values.items():
+            setattr(scraped_job, field, value)
+    ScrapedJob.objects.bulk_update(scraped_jobs, NORMALIZED_FIELDS, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0003_job_facets'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='scrapedjob',
+            name='max_salary',
+            field=models.PositiveIntegerField(blank=True, db_index=True, help_text='Annual INR', null=True),
+        ),
+        migrations.AddField(
+            model_name='scrapedjob',
+            name='min_salary',
+            field=models.PositiveIntegerField(blank=True, db_index=True, help_text='Annual INR', null=True),
+        ),
+        migrations.RunPython(restore_fts_triggers, migrations.RunPython.noop),
+        migrations.RunPython(backfill_normalized, migrations.RunPython.noop),
+    ]
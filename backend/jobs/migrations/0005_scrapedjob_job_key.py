@@ -0,0 +1,51 @@
+# Generated by Django 4.2.7 on 2026-10-19 09:12
+
+from django.db import migrations, models
+
+from jobs.fts import restore_fts_triggers
+
+
+def backfill_job_keys(apps, schema_editor):
+    """Key existing listings and drop the older copies of repeated postings"""
+    from scraper.dedup import dedup_key
+
+    ScrapedJob = apps.get_model('jobs', 'ScrapedJob')
+    keep = {}
+    duplicates = []
+    for scraped_job in ScrapedJob.objects.order_by('-last_seen_at', '-id'):
+        scraped_job.job_key = dedup_key({
+            'job_url': scraped_job.job_url,
+            'job_title': scraped_job.job_title,
+            'company_name': scraped_job.company_name,
+            'location': scraped_job.location,
+        })
+        if scraped_job.job_key in keep:
+            duplicates.append(scraped_job.pk)
+        else:
+            keep[scraped_job.job_key] = scraped_job
+    ScrapedJob.objects.filter(pk__in=duplicates).delete()
+    ScrapedJob.objects.bulk_update(list(keep.values()), ['job_key'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0004_normalized_salary'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='scrapedjob',
+            name='job_key',
+            field=models.CharField(default='', help_text='scraper.dedup.dedup_key', max_length=40),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_job_keys, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='scrapedjob',
+            name='job_key',
+            field=models.CharField(help_text='scraper.dedup.dedup_key', max_length=40, unique=True),
+        ),
+        # Last, so the FTS rebuild also drops the rows deleted above
+        migrations.RunPython(restore_fts_triggers, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.7 on 2026-10-19 08:43
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+from jobs.fts import restore_fts_triggers
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0005_scrapedjob_job_key'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='scrapedjob',
+            name='duplicate_of',
+            field=models.ForeignKey(blank=True, help_text='Oldest listing this one is a near-duplicate of', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='near_duplicates', to='jobs.scrapedjob'),
+        ),
+        migrations.AddField(
+            model_name='scrapedjob',
+            name='minhash',
+            field=models.BinaryField(help_text='MinHash signature (see jobs.near_duplicates)', null=True),
+        ),
+        migrations.CreateModel(
+            name='JobLSHBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('bucket', models.BigIntegerField(db_index=True)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='lsh_buckets', to='jobs.scrapedjob')),
+            ],
+        ),
+        migrations.RunPython(restore_fts_triggers, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-19 08:48
+
+from django.db import migrations, models
+
+from jobs.fts import restore_fts_triggers
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0006_near_duplicates'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='scrapedjob',
+            name='industry_type',
+            field=models.CharField(blank=True, help_text='From the job details page', max_length=200),
+        ),
+        migrations.RunPython(restore_fts_triggers, migrations.RunPython.noop),
+    ]
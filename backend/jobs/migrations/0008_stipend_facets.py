@@ -0,0 +1,26 @@
+from django.db import migrations
+
+from jobs.facets import stipend
+
+
+def refresh_stipend_facets(apps, schema_editor):
+    ScrapedJob = apps.get_model('jobs', 'ScrapedJob')
+    JobFacet = apps.get_model('jobs', 'JobFacet')
+    JobFacet.objects.filter(name='stipend').delete()
+    facets = []
+    for scraped_job in ScrapedJob.objects.only('id', 'min_salary', 'max_salary').iterator():
+        bucket = stipend(scraped_job.min_salary, scraped_job.max_salary)
+        if bucket:
+            facets.append(JobFacet(job_id=scraped_job.pk, name='stipend', value=bucket))
+    JobFacet.objects.bulk_create(facets, batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0007_scrapedjob_industry_type'),
+    ]
+
+    operations = [
+        migrations.RunPython(refresh_stipend_facets, migrations.RunPython.noop),
+    ]
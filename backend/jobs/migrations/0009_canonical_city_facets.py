@@ -0,0 +1,27 @@
+from django.db import migrations
+
+from jobs.facets import cities
+
+
+def refresh_city_facets(apps, schema_editor):
+    ScrapedJob = apps.get_model('jobs', 'ScrapedJob')
+    JobFacet = apps.get_model('jobs', 'JobFacet')
+    JobFacet.objects.filter(name='city').delete()
+    facets = []
+    for scraped_job in ScrapedJob.objects.only('id', 'location').iterator():
+        facets.extend(
+            JobFacet(job_id=scraped_job.pk, name='city', value=city[:100])
+            for city in cities(scraped_job.location)
+        )
+    JobFacet.objects.bulk_create(facets, batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0008_stipend_facets'),
+    ]
+
+    operations = [
+        migrations.RunPython(refresh_city_facets, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,176 @@
+import hashlib
+import json
+
 from django.db import models
 
-# Models can be added here in the future for caching job data
-# Currently, jobs are scraped on-demand without storing in database
+from scraper.records import Job
+
+
+class SavedSearch(models.Model):
+    """A search definition that the crawl scheduler re-runs periodically"""
+    JOB_TYPE_CHOICES = [('job', 'Job'), ('internship', 'Internship')]
+
+    name = models.CharField(max_length=200, blank=True)
+    job_type = models.CharField(max_length=20, choices=JOB_TYPE_CHOICES, default='job')
+    keyword = models.CharField(max_length=200)
+    location = models.CharField(max_length=200)
+    experience = models.PositiveIntegerField(null=True, blank=True)
+    pages = models.PositiveIntegerField(default=1)
+    page_size = models.PositiveIntegerField(default=20)
+    interval_minutes = models.PositiveIntegerField(default=60)
+    freshness_minutes = models.PositiveIntegerField(
+        default=30,
+        help_text='Skip a run if results newer than this already exist'
+    )
+    is_active = models.BooleanField(default=True)
+    next_run_at = models.DateTimeField(null=True, blank=True, db_index=True)
+    last_run_at = models.DateTimeField(null=True, blank=True)
+    last_status = models.CharField(max_length=200, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['next_run_at', 'id']
+
+    def __str__(self):
+        return self.name or f"{self.keyword} in {self.location} ({self.job_type})"
+
+    def query_key(self, page=1):
+        """Cache key of the results produced by this search for a page"""
+        return SearchResult.build_query_key(
+            self.job_type, self.keyword, self.location, self.experience, page, self.page_size
+        )
+
+
+class SearchResult(models.Model):
+    """Jobs returned by one search page, persisted for reuse"""
+    saved_search = models.ForeignKey(
+        SavedSearch,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name='results'
+    )
+    query_key = models.CharField(max_length=64, db_index=True)
+    job_type = models.CharField(max_length=20)
+    keyword = models.CharField(max_length=200)
+    location = models.CharField(max_length=200)
+    experience = models.PositiveIntegerField(null=True, blank=True)
+    page = models.PositiveIntegerField(default=1)
+    page_size = models.PositiveIntegerField(default=20)
+    count = models.PositiveIntegerField(default=0)
+    data_source = models.CharField(max_length=50, blank=True)
+    jobs = models.JSONField(default=list)
+    pagination = models.JSONField(default=dict)
+    scraped_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        ordering = ['-scraped_at']
+
+    def __str__(self):
+        return f"{self.keyword} in {self.location} p{self.page} ({self.count} jobs)"
+
+    @staticmethod
+    def build_query_key(job_type, keyword, location, experience=None, page=1, page_size=20):
+        """
+        Build a stable key for a search query
+
+        Keyword and location are normalized so that trivially different
+        spellings ("Python Developer " vs "python developer") share results.
+        """
+        parts = [
+            (job_type or '').strip().lower(),
+            ' '.join((keyword or '').lower().split()),
+            ' '.join((location or '').lower().split()),
+            '' if experience is None else str(experience),
+            str(page),
+            str(page_size),
+        ]
+        return hashlib.sha256(json.dumps(parts).encode('utf-8')).hexdigest()
+
+
+class ScrapedJob(models.Model):
+    """
+    One scraped listing, kept for local full-text search (see jobs.search_index)
+
+    Listings are keyed by ``job_key`` (the naukri job id, see
+    scraper.dedup) and refreshed every time a search returns them, so the
+    same posting reached through different URLs is stored once. On SQLite the text columns are mirrored into the
+    ``jobs_scrapedjob_fts`` FTS5 table by triggers; migrations that alter this
+    table must restore them (see jobs.fts).
+    """
+    job_url = models.CharField(max_length=500, unique=True)
+    job_key = models.CharField(max_length=40, unique=True, help_text='scraper.dedup.dedup_key')
+    job_type = models.CharField(max_length=20, default='job', db_index=True)
+    job_title = models.CharField(max_length=300, blank=True)
+    company_name = models.CharField(max_length=200, blank=True)
+    company_logo = models.CharField(max_length=500, blank=True)
+    rating = models.CharField(max_length=20, blank=True)
+    reviews = models.CharField(max_length=50, blank=True)
+    experience = models.CharField(max_length=50, blank=True)
+    min_experience = models.PositiveIntegerField(null=True, blank=True)
+    max_experience = models.PositiveIntegerField(null=True, blank=True)
+    salary = models.CharField(max_length=100, blank=True)
+    min_salary = models.PositiveIntegerField(null=True, blank=True, db_index=True, help_text='Annual INR')
+    max_salary = models.PositiveIntegerField(null=True, blank=True, db_index=True, help_text='Annual INR')
+    location = models.CharField(max_length=300, blank=True)
+    job_description = models.TextField(blank=True)
+    tags = models.JSONField(default=list)
+    key_skills = models.JSONField(default=list)
+    job_post_date = models.CharField(max_length=50, blank=True)
+    department = models.CharField(max_length=200, blank=True, help_text='From the job details page')
+    role_category = models.CharField(max_length=200, blank=True, help_text='From the job details page')
+    industry_type = models.CharField(max_length=200, blank=True, help_text='From the job details page')
+    minhash = models.BinaryField(null=True, editable=False, help_text='MinHash signature (see jobs.near_duplicates)')
+    duplicate_of = models.ForeignKey(
+        'self', null=True, blank=True, on_delete=models.SET_NULL, related_name='near_duplicates',
+        help_text='Oldest listing this one is a near-duplicate of'
+    )
+    first_seen_at = models.DateTimeField(auto_now_add=True)
+    last_seen_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    class Meta:
+        ordering = ['-last_seen_at']
+
+    def __str__(self):
+        return f"{self.job_title} at {self.company_name}"
+
+    def to_record(self):
+        """Return the listing as a scraper.records.Job"""
+        return Job(
+            job_title=self.job_title,
+            company_name=self.company_name,
+            company_logo=self.company_logo,
+            rating=self.rating,
+            reviews=self.reviews,
+            experience=self.experience,
+            salary=self.salary,
+            location=self.location,
+            job_description=self.job_description,
+            tags=self.tags,
+            job_post_date=self.job_post_date,
+            job_url=self.job_url,
+        )
+
+
+class JobFacet(models.Model):
+    """One facet value of a scraped listing (see jobs.facets)"""
+    job = models.ForeignKey(ScrapedJob, on_delete=models.CASCADE, related_name='facets')
+    name = models.CharField(max_length=30)
+    value = models.CharField(max_length=200)
+
+    class Meta:
+        unique_together = [('job', 'name', 'value')]
+        indexes = [models.Index(fields=['name', 'value'])]
+
+    def __str__(self):
+        return f"{self.name}={self.value}"
+
+
+class JobLSHBucket(models.Model):
+    """One LSH band bucket of a listing's MinHash signature (see scraper.minhash)"""
+    job = models.ForeignKey(ScrapedJob, on_delete=models.CASCADE, related_name='lsh_buckets')
+    bucket = models.BigIntegerField(db_index=True)
 
+    def __str__(self):
+        return f"{self.job_id}:{self.bucket}"
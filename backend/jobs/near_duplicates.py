@@ -0,0 +1,186 @@
+"""
+Near-duplicate detection for indexed listings.
+
+Every listing written to the local index gets a MinHash signature of its
+title and description (scraper.minhash), stored on ``ScrapedJob.minhash``
+with one ``JobLSHBucket`` row per LSH band. A new listing is compared only
+with the listings sharing one of its buckets, and if one of them is at
+least ``NAUKRI_NEAR_DUP_THRESHOLD`` similar (default 0.7) the new listing's
+``duplicate_of`` points to the oldest listing of that group. Local search
+leaves such listings out unless asked for them.
+
+``cluster_corpus`` (``python manage.py cluster_duplicates``) signs every
+stored listing and regroups the whole corpus, e.g. after changing the
+threshold or on a database indexed before signatures existed.
+
+numpy is imported with this module, so callers on the request path import
+it on first use.
+"""
+import os
+
+from django.db import transaction
+
+from scraper.minhash import (
+    DEFAULT_THRESHOLD, band_keys, cluster, default_hasher, from_bytes, shingles, similarity, to_bytes
+)
+
+from .models import JobLSHBucket, ScrapedJob
+
+# Listings with fewer shingles than this (no description, a two-word
+# title) are too short to compare and are never marked as duplicates
+MIN_SHINGLES = 8
+
+
+def near_duplicate_threshold():
+    """Minimum estimated Jaccard similarity of near-duplicates (NAUKRI_NEAR_DUP_THRESHOLD)"""
+    return float(os.getenv('NAUKRI_NEAR_DUP_THRESHOLD', str(DEFAULT_THRESHOLD)))
+
+
+def _signature(job_title, description):
+    shingle_set = shingles(job_title, description)
+    if len(shingle_set) < MIN_SHINGLES:
+        return None
+    return default_hasher().signature(shingle_set)
+
+
+def link_near_duplicates(scraped_jobs, descriptions=None, threshold=None):
+    """
+    Sign listings, index their LSH buckets and link them to near-duplicates
+
+    Args:
+        scraped_jobs: Saved ScrapedJob rows (new or with a changed text)
+        descriptions: Optional dict of listing id to a fuller description
+            (the details page text) to sign instead of the stored one
+        threshold: Minimum similarity (default: near_duplicate_threshold())
+
+    Returns:
+        Number of listings linked to an older near-duplicate
+    """
+    threshold = near_duplicate_threshold() if threshold is None else threshold
+    descriptions = descriptions or {}
+    signed = []
+    for scraped_job in sorted(scraped_jobs, key=lambda job: job.pk):
+        sig = _signature(scraped_job.job_title, descriptions.get(scraped_job.pk) or scraped_job.job_description)
+        scraped_job.minhash = to_bytes(sig) if sig is not None else None
+        scraped_job.duplicate_of_id = None
+        if sig is not None:
+            signed.append((scraped_job, sig, band_keys(sig)))
+
+    ids = [scraped_job.pk for scraped_job in scraped_jobs]
+    candidates_by_bucket = {}
+    for job_id, bucket in JobLSHBucket.objects.filter(
+        bucket__in={bucket for _, _, buckets in signed for bucket in buckets}
+    ).exclude(job_id__in=ids).values_list('job_id', 'bucket'):
+        candidates_by_bucket.setdefault(bucket, set()).add(job_id)
+    stored = {
+        job.pk: (from_bytes(job.minhash), job.duplicate_of_id or job.pk)
+        for job in ScrapedJob.objects.filter(
+            pk__in={job_id for job_ids in candidates_by_bucket.values() for job_id in job_ids}
+        ).only('id', 'minhash', 'duplicate_of_id')
+        if job.minhash is not None
+    }
+
+    linked = 0
+    batch = {}
+    for scraped_job, sig, buckets in signed:
+        representatives = set()
+        for bucket in buckets:
+            for job_id in candidates_by_bucket.get(bucket, ()):
+                other_sig, representative = stored.get(job_id, (None, None))
+                if other_sig is not None and similarity(sig, other_sig) >= threshold:
+                    representatives.add(representative)
+            for other_sig, representative in batch.get(bucket, ()):
+                if similarity(sig, other_sig) >= threshold:
+                    representatives.add(representative)
+        representative = min(representatives, default=scraped_job.pk)
+        if representative < scraped_job.pk:
+            scraped_job.duplicate_of_id = representative
+            linked += 1
+        for bucket in buckets:
+            batch.setdefault(bucket, []).append((sig, representative))
+
+    with transaction.atomic():
+        ScrapedJob.objects.bulk_update(scraped_jobs, ['minhash', 'duplicate_of'])
+        JobLSHBucket.objects.filter(job_id__in=ids).delete()
+        JobLSHBucket.objects.bulk_create([
+            JobLSHBucket(job=scraped_job, bucket=bucket)
+            for scraped_job, _, buckets in signed
+            for bucket in buckets
+        ])
+    return linked
+
+
+def cluster_corpus(threshold=None, resign=False, dry_run=False, batch_size=2000):
+    """
+    Group every stored listing into near-duplicate clusters
+
+    Args:
+        threshold: Minimum similarity (default: near_duplicate_threshold())
+        resign: Recompute every signature, not only the missing ones
+        dry_run: Report the clusters without saving anything
+        batch_size: Listings loaded and written per query
+
+    Returns:
+        Dict with 'listings', 'signed' (signatures computed), 'clusters'
+        (groups of two or more) and 'duplicates' (listings linked to another)
+    """
+    threshold = near_duplicate_threshold() if threshold is None else threshold
+    signatures = []
+    new_signatures = {}
+    current = {}
+    queryset = ScrapedJob.objects.order_by('id').only(
+        'id', 'job_title', 'job_description', 'minhash', 'duplicate_of_id'
+    )
+    for scraped_job in queryset.iterator(chunk_size=batch_size):
+        current[scraped_job.pk] = scraped_job.duplicate_of_id
+        if scraped_job.minhash is not None and not resign:
+            signatures.append((scraped_job.pk, from_bytes(scraped_job.minhash)))
+            continue
+        sig = _signature(scraped_job.job_title, scraped_job.job_description)
+        new_signatures[scraped_job.pk] = sig
+        if sig is not None:
+            signatures.append((scraped_job.pk, sig))
+
+    groups = cluster(signatures, threshold)
+    sizes = {}
+    for representative in groups.values():
+        sizes[representative] = sizes.get(representative, 0) + 1
+    links = {
+        pk: (groups[pk] if groups.get(pk, pk) != pk else None)
+        for pk in current
+    }
+    stats = {
+        'listings': len(current),
+        'signed': len(new_signatures),
+        'clusters': sum(1 for size in sizes.values() if size > 1),
+        'duplicates': sum(1 for representative in links.values() if representative is not None),
+    }
+    if dry_run:
+        return stats
+
+    with transaction.atomic():
+        if new_signatures:
+            ScrapedJob.objects.bulk_update(
+                [
+                    ScrapedJob(pk=pk, minhash=to_bytes(sig) if sig is not None else None)
+                    for pk, sig in new_signatures.items()
+                ],
+                ['minhash'], batch_size=batch_size
+            )
+            JobLSHBucket.objects.filter(job_id__in=list(new_signatures)).delete()
+            JobLSHBucket.objects.bulk_create(
+                [
+                    JobLSHBucket(job_id=pk, bucket=bucket)
+                    for pk, sig in new_signatures.items() if sig is not None
+                    for bucket in band_keys(sig)
+                ],
+                batch_size=batch_size
+            )
+        ScrapedJob.objects.bulk_update(
+            [
+                ScrapedJob(pk=pk, duplicate_of_id=representative)
+                for pk, representative in links.items() if current[pk] != representative
+            ],
+            ['duplicate_of'], batch_size=batch_size
+        )
+    return stats
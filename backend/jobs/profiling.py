@@ -0,0 +1,162 @@
+"""
+Opt-in cProfile profiling of individual scrape requests.
+
+A search or details request runs under cProfile when it asks for it
+(``profile=1`` in the query string or payload, or an ``X-Profile: 1``
+header) and the caller is allowed to: a staff user, or a request carrying
+``X-Profile-Token`` equal to the ``PROFILING_TOKEN`` setting. Each profile is
+written to ``PROFILE_DIR`` as a ``.prof`` file (readable with pstats or
+snakeviz) plus a ``.json`` file describing the request.
+"""
+import cProfile
+import hmac
+import io
+import json
+import os
+import pstats
+import re
+import time
+import uuid
+from datetime import datetime
+
+from django.conf import settings
+
+
+PROFILE_ID_PATTERN = re.compile(r'^[0-9]{8}-[0-9]{6}-[a-z]+-[0-9a-f]{8}$')
+SORT_KEYS = ('cumulative', 'tottime', 'ncalls')
+
+
+def _profile_dir():
+    return settings.PROFILE_DIR
+
+
+def _is_truthy(value):
+    return str(value).lower() in ('1', 'true', 'yes')
+
+
+def profiling_requested(request):
+    """Check whether a request asks to be profiled"""
+    if _is_truthy(request.headers.get('X-Profile', '')):
+        return True
+    if _is_truthy(request.query_params.get('profile', '')):
+        return True
+    data = request.data if hasattr(request.data, 'get') else {}
+    return _is_truthy(data.get('profile', ''))
+
+
+def profiling_allowed(request):
+    """Check whether the caller may profile requests (staff user or profiling token)"""
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated and user.is_staff:
+        return True
+    token = settings.PROFILING_TOKEN
+    supplied = request.headers.get('X-Profile-Token', '')
+    return bool(token) and hmac.compare_digest(supplied.encode('utf-8'), token.encode('utf-8'))
+
+
+def run_profiled(label, func, *args, **kwargs):
+    """
+    Call a function under cProfile and store the profile
+
+    Args:
+        label: Short name of the operation (e.g. 'search' or 'details')
+        func: Function to call
+        *args, **kwargs: Passed to func; kwargs are recorded with the profile
+
+    Returns:
+        Tuple of (function result, profile id)
+    """
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    try:
+        result = profiler.runcall(func, *args, **kwargs)
+    finally:
+        elapsed = time.perf_counter() - start
+    profile_id = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{label}-{uuid.uuid4().hex[:8]}"
+
+    directory = _profile_dir()
+    os.makedirs(directory, exist_ok=True)
+    profiler.dump_stats(os.path.join(directory, f"{profile_id}.prof"))
+    with open(os.path.join(directory, f"{profile_id}.json"), 'w', encoding='utf-8') as f:
+        json.dump({
+            'id': profile_id,
+            'label': label,
+            'created_at': datetime.now().isoformat(),
+            'elapsed_ms': round(elapsed * 1000, 1),
+            'params': {name: value for name, value in kwargs.items() if _is_plain(value)},
+        }, f, indent=2)
+    return result, profile_id
+
+
+def _is_plain(value):
+    return value is None or isinstance(value, (str, int, float, bool))
+
+
+def list_profiles(limit=50):
+    """
+    Return the metadata of stored profiles, newest first
+
+    Args:
+        limit: Maximum number of profiles to return
+    """
+    directory = _profile_dir()
+    if not os.path.isdir(directory):
+        return []
+    profiles = []
+    for name in sorted(os.listdir(directory), reverse=True):
+        if not name.endswith('.json'):
+            continue
+        try:
+            with open(os.path.join(directory, name), 'r', encoding='utf-8') as f:
+                profiles.append(json.load(f))
+        except (OSError, ValueError):
+            continue
+        if len(profiles) >= limit:
+            break
+    return profiles
+
+
+def profile_path(profile_id):
+    """Return the .prof file of a profile, or None if the id is unknown"""
+    if not PROFILE_ID_PATTERN.match(profile_id or ''):
+        return None
+    path = os.path.join(_profile_dir(), f"{profile_id}.prof")
+    return path if os.path.exists(path) else None
+
+
+def top_hotspots(profile_id, limit=25, sort='cumulative'):
+    """
+    Return the most expensive functions of a stored profile
+
+    Args:
+        profile_id: Profile id returned by run_profiled
+        limit: Number of functions to return
+        sort: 'cumulative', 'tottime' or 'ncalls'
+
+    Returns:
+        List of dictionaries with 'function', 'file', 'line', 'ncalls',
+        'primitive_calls', 'tottime_ms' and 'cumtime_ms', or None if the
+        profile does not exist
+    """
+    path = profile_path(profile_id)
+    if path is None:
+        return None
+    if sort not in SORT_KEYS:
+        sort = 'cumulative'
+
+    stats = pstats.Stats(path, stream=io.StringIO())
+    index = {'cumulative': 3, 'tottime': 2, 'ncalls': 1}[sort]
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][index], reverse=True)
+
+    hotspots = []
+    for (filename, line, function), (primitive_calls, ncalls, tottime, cumtime, _) in rows[:limit]:
+        hotspots.append({
+            'function': function,
+            'file': filename,
+            'line': line,
+            'ncalls': ncalls,
+            'primitive_calls': primitive_calls,
+            'tottime_ms': round(tottime * 1000, 3),
+            'cumtime_ms': round(cumtime * 1000, 3),
+        })
+    return hotspots
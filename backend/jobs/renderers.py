@@ -0,0 +1,63 @@
+"""
+Fast JSON renderer for API responses.
+
+Search responses carry up to 100 jobs produced by our own scraper, so they
+are encoded directly instead of going through ``JobSerializer``: ``Job``
+records already guarantee their schema when they are built (see
+``scraper.records``). Encoding uses orjson when it is installed and falls
+back to the standard library otherwise.
+
+Encoding is the ``serialization`` stage of a request. It runs after the
+view has built the body, so its duration is reported in a
+``Server-Timing`` response header instead of ``debug_info.timings``.
+"""
+import json
+
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from scraper.records import Job
+from scraper.tracing import Tracer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
+
+_fallback_encoder = JSONEncoder()
+
+
+def _default(obj):
+    """Encode Job records, then anything DRF's encoder knows (lazy strings, Decimal, ...)"""
+    if isinstance(obj, Job):
+        return obj.to_dict()
+    return _fallback_encoder.default(obj)
+
+
+def dumps(data):
+    """Encode data (which may contain Job records) as UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data, default=_default)
+    return json.dumps(data, default=_default, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+class FastJSONRenderer(BaseRenderer):
+    """JSON renderer backed by orjson that serializes Job records natively"""
+
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        tracer = Tracer()
+        with tracer.span('serialization'):
+            content = dumps(data)
+        response = (renderer_context or {}).get('response')
+        if response is not None:
+            entry = f"serialization;dur={tracer.timings['serialization']}"
+            previous = response.get('Server-Timing')
+            response['Server-Timing'] = f'{previous}, {entry}' if previous else entry
+        return content
@@ -0,0 +1,182 @@
+"""
+Crawl scheduler for recurring saved searches.
+
+Saved searches are stored in the database. Each one is re-run every
+``interval_minutes`` (plus random jitter so that searches created together
+drift apart), with a global cap on how many scrapes run at the same time.
+Runs are skipped when results newer than ``freshness_minutes`` already exist.
+"""
+import random
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.db import close_old_connections
+from django.db.models import Q
+from django.utils import timezone
+
+from scraper.metrics import record_cache_lookup
+from scraper.naukri_service import get_naukri_data
+from scraper.records import jobs_to_dicts
+from .models import SavedSearch, SearchResult
+from .search_index import index_jobs, safe_index
+
+
+class CrawlScheduler:
+    """Dispatches due saved searches to a bounded pool of scrape workers"""
+
+    def __init__(self, max_concurrency=2, jitter_seconds=60, poll_seconds=15, log=print):
+        self.max_concurrency = max(1, max_concurrency)
+        self.jitter_seconds = max(0, jitter_seconds)
+        self.poll_seconds = max(1, poll_seconds)
+        self.log = log
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        self._in_flight = set()
+        self._lock = threading.Lock()
+
+    def next_run_time(self, saved_search, now=None):
+        """Compute the next run time for a search, applying jitter"""
+        now = now or timezone.now()
+        delay = saved_search.interval_minutes * 60
+        if self.jitter_seconds:
+            delay += random.uniform(-self.jitter_seconds, self.jitter_seconds)
+        return now + timedelta(seconds=max(delay, self.poll_seconds))
+
+    def due_searches(self, now=None):
+        """Return active saved searches whose next run time has passed"""
+        now = now or timezone.now()
+        return list(SavedSearch.objects.filter(is_active=True).filter(
+            Q(next_run_at__isnull=True) | Q(next_run_at__lte=now)
+        ))
+
+    def has_fresh_results(self, saved_search, now=None):
+        """Check whether the cached results of a search are still fresh"""
+        now = now or timezone.now()
+        fresh_after = now - timedelta(minutes=saved_search.freshness_minutes)
+        fresh = SearchResult.objects.filter(
+            query_key=saved_search.query_key(page=1),
+            scraped_at__gte=fresh_after
+        ).exists()
+        record_cache_lookup('saved_search', fresh)
+        return fresh
+
+    def dispatch_due(self):
+        """
+        Submit every due search that is not already running
+
+        Returns:
+            Number of searches submitted to the worker pool
+        """
+        now = timezone.now()
+        submitted = 0
+
+        for saved_search in self.due_searches(now):
+            with self._lock:
+                if saved_search.pk in self._in_flight:
+                    continue
+
+            if self.has_fresh_results(saved_search, now):
+                saved_search.next_run_at = self.next_run_time(saved_search, now)
+                saved_search.last_status = 'skipped: cached results are fresh'
+                saved_search.save(update_fields=['next_run_at', 'last_status', 'updated_at'])
+                self.log(f"Skipping '{saved_search}' (fresh results cached)")
+                continue
+
+            with self._lock:
+                self._in_flight.add(saved_search.pk)
+            self._executor.submit(self._run_search, saved_search.pk)
+            submitted += 1
+
+        return submitted
+
+    def run_forever(self):
+        """Poll for due searches until interrupted"""
+        self.log(
+            f"Crawl scheduler started (concurrency={self.max_concurrency}, "
+            f"jitter={self.jitter_seconds}s, poll={self.poll_seconds}s)"
+        )
+        try:
+            while True:
+                self.dispatch_due()
+                time.sleep(self.poll_seconds)
+        finally:
+            self.shutdown()
+
+    def run_once(self):
+        """Dispatch all due searches and wait for them to finish"""
+        submitted = self.dispatch_due()
+        self.shutdown()
+        return submitted
+
+    def shutdown(self):
+        """Wait for running scrapes to finish"""
+        self._executor.shutdown(wait=True)
+
+    def _run_search(self, saved_search_id):
+        """Scrape every page of a saved search and persist the results"""
+        close_old_connections()
+        saved_search = None
+        try:
+            saved_search = SavedSearch.objects.get(pk=saved_search_id)
+            self.log(f"Running '{saved_search}'")
+            total_jobs = 0
+            status = 'ok'
+
+            for page in range(1, saved_search.pages + 1):
+                result = get_naukri_data(
+                    task_type='search',
+                    job_type=saved_search.job_type,
+                    keyword=saved_search.keyword,
+                    location=saved_search.location,
+                    experience=saved_search.experience,
+                    page=page,
+                    page_size=saved_search.page_size,
+                    headless=True
+                )
+
+                if not result.get('success'):
+                    status = f"error: {result.get('message') or result.get('error')}"[:200]
+                    break
+
+                jobs = jobs_to_dicts(result.get('jobs', []))
+                SearchResult.objects.create(
+                    saved_search=saved_search,
+                    query_key=saved_search.query_key(page=page),
+                    job_type=saved_search.job_type,
+                    keyword=saved_search.keyword,
+                    location=saved_search.location,
+                    experience=saved_search.experience,
+                    page=page,
+                    page_size=saved_search.page_size,
+                    count=len(jobs),
+                    data_source=result.get('metadata', {}).get('data_source', ''),
+                    jobs=jobs,
+                    pagination=result.get('pagination', {})
+                )
+                safe_index(index_jobs, jobs, saved_search.job_type)
+                total_jobs += len(jobs)
+
+                if not result.get('pagination', {}).get('has_next'):
+                    break
+
+            now = timezone.now()
+            saved_search.last_run_at = now
+            saved_search.next_run_at = self.next_run_time(saved_search, now)
+            saved_search.last_status = status
+            saved_search.save(update_fields=['last_run_at', 'next_run_at', 'last_status', 'updated_at'])
+            self.log(f"Finished '{saved_search}': {total_jobs} jobs ({status})")
+
+        except Exception as e:
+            traceback.print_exc()
+            # Push the search back so a persistent failure doesn't spin every poll
+            SavedSearch.objects.filter(pk=saved_search_id).update(
+                next_run_at=self.next_run_time(saved_search, timezone.now()) if saved_search else None,
+                last_status=f"error: {e}"[:200]
+            )
+        finally:
+            with self._lock:
+                self._in_flight.discard(saved_search_id)
+            close_old_connections()
+
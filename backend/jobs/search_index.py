@@ -0,0 +1,416 @@
+"""
+Local full-text index over scraped listings.
+
+Every successful search (API or crawl scheduler) upserts its listings into
+``ScrapedJob``; details requests add the key skills, department and role
+category. Facet values (``jobs.facets``) are stored alongside as
+``JobFacet`` rows, so facet counts and filters cover every stored listing
+that matches a query, not one page of it. On SQLite the title,
+company, description, tags and key skills are indexed in the
+``jobs_scrapedjob_fts`` FTS5 table (created by migration 0002) and results
+are ranked with BM25, weighting title matches highest. Where FTS5 is not
+available the same queries run as LIKE filters ordered by recency.
+Reposts of a role are linked to its oldest copy (``jobs.near_duplicates``)
+and left out of results and counts by default.
+"""
+import re
+import time
+import traceback
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from scraper.dedup import dedup_key, job_id_from_url
+from scraper.metrics import histogram
+from .facets import FACET_NAMES, canonical_city, compute_facets
+from .fts import FTS_TABLE
+from .models import JobFacet, ScrapedJob
+
+# BM25 column weights: job_title, company_name, job_description, tags, key_skills
+BM25_WEIGHTS = (10.0, 2.0, 1.0, 5.0, 5.0)
+
+# Locations that mean "anywhere" on Naukri
+ANY_LOCATION = frozenset(('', 'india', 'anywhere', 'all'))
+
+LOCAL_SEARCH_DURATION = histogram(
+    'naukri_local_search_duration_seconds',
+    'Local index query latency in seconds',
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1)
+)
+
+_UPDATE_FIELDS = (
+    'job_type', 'job_title', 'company_name', 'company_logo', 'rating', 'reviews', 'experience',
+    'min_experience', 'max_experience', 'salary', 'min_salary', 'max_salary', 'location',
+    'job_description', 'tags', 'job_post_date'
+)
+
+# ORDER BY clauses of the sort options; 'relevance' is BM25 (recency without FTS5)
+SORT_ORDERS = {
+    'recent': 'j.last_seen_at DESC',
+    'salary_desc': 'j.max_salary IS NULL, j.max_salary DESC',
+    'salary_asc': 'j.min_salary IS NULL, j.min_salary ASC',
+    'experience_asc': 'j.min_experience IS NULL, j.min_experience ASC',
+    'experience_desc': 'j.max_experience IS NULL, j.max_experience DESC',
+}
+
+_fts_available = None
+
+
+def fts_available():
+    """Check (once per process) whether the FTS5 index table exists"""
+    global _fts_available
+    if _fts_available is None:
+        _fts_available = FTS_TABLE in connection.introspection.table_names()
+    return _fts_available
+
+
+def _search_terms(keyword):
+    return re.findall(r'\w+', (keyword or '').lower())
+
+
+def _match_expression(terms):
+    """FTS5 query requiring every term, each as a prefix ("pyth"* matches python)"""
+    return ' '.join(f'"{term}"*' for term in terms)
+
+
+def _apply_fields(scraped_job, job, job_type, normalized):
+    scraped_job.job_type = job_type
+    scraped_job.job_title = job.get('job_title') or ''
+    scraped_job.company_name = job.get('company_name') or ''
+    scraped_job.company_logo = job.get('company_logo') or ''
+    scraped_job.rating = job.get('rating') or ''
+    scraped_job.reviews = job.get('reviews') or ''
+    scraped_job.experience = job.get('experience') or ''
+    scraped_job.salary = job.get('salary') or ''
+    for field, value in normalized.items():
+        setattr(scraped_job, field, value)
+    scraped_job.location = job.get('location') or ''
+    scraped_job.job_description = job.get('job_description') or ''
+    scraped_job.tags = list(job.get('tags') or ())
+    scraped_job.job_post_date = job.get('job_post_date') or ''
+
+
+def _refresh_facets(scraped_jobs):
+    """Replace the stored facet values of listings"""
+    JobFacet.objects.filter(job__in=scraped_jobs).delete()
+    JobFacet.objects.bulk_create(
+        [
+            JobFacet(job=scraped_job, name=name, value=value)
+            for scraped_job in scraped_jobs
+            for name, value in compute_facets(scraped_job)
+        ],
+        ignore_conflicts=True
+    )
+
+
+def index_jobs(jobs, job_type='job'):
+    """
+    Insert or refresh listings (and their facets) in the local index
+
+    Listings are matched on their dedup key (scraper.dedup.dedup_key), so a
+    posting returned by several pages or queries, or under another URL, is
+    stored once. An existing listing keeps the URL it was first stored with.
+
+    Args:
+        jobs: Job records or job dictionaries; entries without a job_url are skipped
+        job_type: 'job' or 'internship'
+
+    Returns:
+        Number of distinct listings written
+    """
+    by_key = {}
+    for job in jobs:
+        url = (job.get('job_url') or '').strip()
+        if url and len(url) <= 500:
+            by_key.setdefault(dedup_key(job), (url, job))
+    if not by_key:
+        return 0
+
+    # pandas and numpy are imported on first use, keeping them out of Django startup
+    from scraper.normalize import normalize_batch
+    from .near_duplicates import link_near_duplicates
+    normalized = normalize_batch([job for _, job in by_key.values()])
+
+    with transaction.atomic():
+        existing = ScrapedJob.objects.in_bulk(list(by_key), field_name='job_key')
+        created = []
+        changed = []
+        for (key, (url, job)), values in zip(by_key.items(), normalized):
+            scraped_job = existing.get(key)
+            if scraped_job is None:
+                scraped_job = ScrapedJob(job_url=url, job_key=key)
+                _apply_fields(scraped_job, job, job_type, values)
+                created.append(scraped_job)
+                continue
+            before = [getattr(scraped_job, field) for field in _UPDATE_FIELDS]
+            _apply_fields(scraped_job, job, job_type, values)
+            if before != [getattr(scraped_job, field) for field in _UPDATE_FIELDS]:
+                changed.append(scraped_job)
+
+        # Unchanged listings only get last_seen_at bumped, which leaves the
+        # FTS rows alone (the update trigger watches the indexed columns)
+        if existing:
+            ScrapedJob.objects.filter(pk__in=[job.pk for job in existing.values()]).update(
+                last_seen_at=timezone.now()
+            )
+        if changed:
+            ScrapedJob.objects.bulk_update(changed, _UPDATE_FIELDS)
+        if created:
+            ScrapedJob.objects.bulk_create(created, ignore_conflicts=True)
+            # SQLite does not return primary keys with ignore_conflicts
+            created = list(ScrapedJob.objects.filter(job_key__in=[job.job_key for job in created]))
+        if changed or created:
+            _refresh_facets(changed + created)
+            link_near_duplicates(changed + created)
+
+    return len(by_key)
+
+
+def index_job_details(job_url, job_details):
+    """
+    Add the key skills, department, role category and industry of a details page
+
+    The full description is also stored if the listing has none.
+
+    Returns:
+        True if an indexed listing was updated
+    """
+    job_url = (job_url or '').strip()
+    scraped_job = ScrapedJob.objects.filter(job_url=job_url).first()
+    if scraped_job is None:
+        # The same posting may be stored under another URL
+        job_id = job_id_from_url(job_url)
+        if not job_id:
+            return False
+        scraped_job = ScrapedJob.objects.filter(job_key=f'id:{job_id}').first()
+        if scraped_job is None:
+            return False
+    scraped_job.key_skills = list(job_details.get('key_skills') or [])
+    scraped_job.department = (job_details.get('department') or '')[:200]
+    scraped_job.role_category = (job_details.get('role_category') or '')[:200]
+    scraped_job.industry_type = (job_details.get('industry_type') or '')[:200]
+    if not scraped_job.job_description:
+        scraped_job.job_description = job_details.get('job_description_content') or ''
+    from .near_duplicates import link_near_duplicates
+    with transaction.atomic():
+        scraped_job.save(update_fields=[
+            'key_skills', 'department', 'role_category', 'industry_type', 'job_description', 'last_seen_at'
+        ])
+        _refresh_facets([scraped_job])
+        # The full description makes a more reliable signature than the snippet
+        link_near_duplicates(
+            [scraped_job], descriptions={scraped_job.pk: job_details.get('job_description_content')}
+        )
+    return True
+
+
+def safe_index(func, *args, **kwargs):
+    """Run an index update without letting a failure break the caller's response"""
+    try:
+        return func(*args, **kwargs)
+    except Exception:
+        traceback.print_exc()
+        return None
+
+
+def _query(terms, job_type, location, experience, facet_filters, skip_facet=None, salary_range=(None, None),
+           include_duplicates=False):
+    """
+    Build the FROM/WHERE clause selecting the listings that match a query
+
+    Args:
+        terms: Search words
+        job_type, location, experience: Query filters (see search_local)
+        facet_filters: Dict of facet name to selected values; a listing must
+            have one of the selected values of every filtered facet
+        skip_facet: Facet whose filter is left out (for its own counts)
+        salary_range: (min_salary, max_salary) in annual INR; either may be None
+        include_duplicates: Also match listings marked as near-duplicates
+
+    Returns:
+        Tuple of (SQL from 'FROM' on, parameters, ORDER BY expression, engine)
+    """
+    conditions = []
+    params = []
+
+    if terms and fts_available():
+        engine = 'fts5'
+        # CROSS JOIN keeps the FTS match as the outer loop; otherwise SQLite
+        # may walk the job_type index and probe the FTS table once per listing
+        source = f'{FTS_TABLE} CROSS JOIN jobs_scrapedjob j ON j.id = {FTS_TABLE}.rowid'
+        conditions.append(f'{FTS_TABLE} MATCH %s')
+        params.append(_match_expression(terms))
+        order_by = f"bm25({FTS_TABLE}, {', '.join(str(weight) for weight in BM25_WEIGHTS)})"
+    else:
+        engine = 'like'
+        source = 'jobs_scrapedjob j'
+        for term in terms:
+            conditions.append(
+                '(LOWER(j.job_title) LIKE %s OR LOWER(j.company_name) LIKE %s OR LOWER(j.job_description) LIKE %s '
+                'OR LOWER(j.tags) LIKE %s OR LOWER(j.key_skills) LIKE %s)'
+            )
+            params.extend([f'%{term}%'] * 5)
+        order_by = 'j.last_seen_at DESC'
+
+    if not include_duplicates:
+        conditions.append('j.duplicate_of_id IS NULL')
+    if job_type:
+        conditions.append('j.job_type = %s')
+        params.append(job_type)
+    location = ' '.join((location or '').lower().split())
+    if location not in ANY_LOCATION:
+        # The city facet holds canonical names, so "bangalore" also finds "Bengaluru"
+        conditions.append(
+            "(LOWER(j.location) LIKE %s OR j.id IN "
+            "(SELECT job_id FROM jobs_jobfacet WHERE name = 'city' AND LOWER(value) = %s))"
+        )
+        params.extend([f'%{location}%', canonical_city(location).lower()])
+    if experience is not None:
+        conditions.append(
+            '(j.min_experience IS NULL OR '
+            '(j.min_experience <= %s AND (j.max_experience IS NULL OR j.max_experience >= %s)))'
+        )
+        params.extend([experience, experience])
+    # Salary bounds keep listings whose range overlaps; undisclosed salaries are left out
+    min_salary, max_salary = salary_range
+    if min_salary is not None:
+        conditions.append('j.max_salary >= %s')
+        params.append(min_salary)
+    if max_salary is not None:
+        conditions.append('j.min_salary <= %s')
+        params.append(max_salary)
+
+    for name, values in (facet_filters or {}).items():
+        if not values or name == skip_facet:
+            continue
+        if name == 'city':
+            values = sorted({canonical_city(value) for value in values})
+        placeholders = ', '.join(['%s'] * len(values))
+        conditions.append(
+            f'j.id IN (SELECT job_id FROM jobs_jobfacet WHERE name = %s AND value IN ({placeholders}))'
+        )
+        params.append(name)
+        params.extend(values)
+
+    where = ' AND '.join(conditions) or '1 = 1'
+    return f'FROM {source} WHERE {where}', params, order_by, engine
+
+
+def _count_facets(cursor, names, query_sql, query_params):
+    cursor.execute(
+        f'SELECT name, value, COUNT(*) FROM jobs_jobfacet '
+        f"WHERE name IN ({', '.join(['%s'] * len(names))}) AND job_id IN (SELECT j.id {query_sql}) "
+        f'GROUP BY name, value',
+        list(names) + query_params
+    )
+    return cursor.fetchall()
+
+
+def facet_counts(keyword, location=None, experience=None, job_type=None, filters=None,
+                 min_salary=None, max_salary=None, include_duplicates=False):
+    """
+    Count the listings per facet value for a query
+
+    Counts of a facet apply every filter except the facet's own, so that
+    selecting "Remote" still shows how many On-site listings there are.
+
+    Args:
+        keyword, location, experience, job_type: The query (see search_local)
+        filters: Dict of facet name to selected values
+        min_salary, max_salary: Annual salary bounds in INR
+        include_duplicates: Also count listings marked as near-duplicates
+
+    Returns:
+        Dict of facet name to a list of {'value', 'count'} dicts, most
+        frequent first
+    """
+    terms = _search_terms(keyword)
+    filters = {name: values for name, values in (filters or {}).items() if values}
+    salary_range = (min_salary, max_salary)
+    rows = []
+
+    with connection.cursor() as cursor:
+        # Facets without a filter of their own share one query
+        unfiltered = [name for name in FACET_NAMES if name not in filters]
+        if unfiltered:
+            query_sql, query_params, _, _ = _query(
+                terms, job_type, location, experience, filters, salary_range=salary_range,
+                include_duplicates=include_duplicates
+            )
+            rows.extend(_count_facets(cursor, unfiltered, query_sql, query_params))
+        for name in FACET_NAMES:
+            if name in filters:
+                query_sql, query_params, _, _ = _query(
+                    terms, job_type, location, experience, filters, skip_facet=name, salary_range=salary_range,
+                    include_duplicates=include_duplicates
+                )
+                rows.extend(_count_facets(cursor, [name], query_sql, query_params))
+
+    facets = {name: [] for name in FACET_NAMES}
+    for name, value, count in rows:
+        facets[name].append({'value': value, 'count': count})
+    for values in facets.values():
+        values.sort(key=lambda item: (-item['count'], item['value']))
+    return facets
+
+
+def search_local(keyword, location=None, experience=None, job_type=None, page=1, page_size=20,
+                 filters=None, with_facets=False, min_salary=None, max_salary=None, sort='relevance',
+                 include_duplicates=False):
+    """
+    Search the local index
+
+    Args:
+        keyword: Words to match; every word must match (as a prefix)
+        location: Substring of the listing location, or a city under any of its
+            names ("bangalore" matches "Bengaluru"); 'india' or empty matches all
+        experience: Years of experience the listing's range must include
+        job_type: 'job' or 'internship' (optional)
+        page: Page number (1-based)
+        page_size: Listings per page
+        filters: Dict of facet name to selected values (see jobs.facets.FACET_NAMES)
+        with_facets: Also return facet counts for the query
+        min_salary, max_salary: Annual salary bounds in INR; listings whose
+            salary range overlaps them match, undisclosed salaries do not
+        sort: 'relevance' (default) or one of SORT_ORDERS
+        include_duplicates: Also return listings marked as near-duplicates of
+            an older listing (see jobs.near_duplicates)
+
+    Returns:
+        Dict with 'jobs' (Job records in rank order), 'total', 'engine'
+        ('fts5' or 'like'), 'took_ms' and, if requested, 'facets'
+    """
+    start = time.perf_counter()
+    terms = _search_terms(keyword)
+    salary_range = (min_salary, max_salary)
+    query_sql, params, order_by, engine = _query(
+        terms, job_type, location, experience, filters, salary_range=salary_range,
+        include_duplicates=include_duplicates
+    )
+    order_by = f"{SORT_ORDERS.get(sort, order_by)}, j.id"
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT COUNT(*) {query_sql}', params)
+        total = cursor.fetchone()[0]
+        cursor.execute(
+            f'SELECT j.id {query_sql} ORDER BY {order_by} LIMIT %s OFFSET %s',
+            params + [page_size, (page - 1) * page_size]
+        )
+        ids = [row[0] for row in cursor.fetchall()]
+
+    rows = ScrapedJob.objects.in_bulk(ids)
+    result = {
+        'jobs': [rows[pk].to_record() for pk in ids if pk in rows],
+        'total': total,
+        'engine': engine,
+    }
+    if with_facets:
+        result['facets'] = facet_counts(
+            keyword, location, experience, job_type, filters, min_salary=min_salary, max_salary=max_salary,
+            include_duplicates=include_duplicates
+        )
+
+    elapsed = time.perf_counter() - start
+    LOCAL_SEARCH_DURATION.observe(elapsed)
+    result['took_ms'] = round(elapsed * 1000, 2)
+    return result
@@ -3,9 +3,11 @@ Serializers for job data
 """
 from rest_framework import serializers
 
+from .search_index import SORT_ORDERS
+
 
 class JobSerializer(serializers.Serializer):
-    """Serializer for job data"""
+    """Serializer for job data (scraper.records.Job records or job dictionaries)"""
     job_title = serializers.CharField(required=False, allow_blank=True)
     company_name = serializers.CharField(required=False, allow_blank=True)
     company_logo = serializers.URLField(required=False, allow_blank=True)
@@ -35,4 +37,38 @@ class JobSearchSerializer(serializers.Serializer):
     experience = serializers.IntegerField(required=True, min_value=0)
     page = serializers.IntegerField(required=False, min_value=1, default=1)
     page_size = serializers.IntegerField(required=False, min_value=1, max_value=100, default=20)
+    engine = serializers.ChoiceField(
+        choices=[('browser', 'Browser first'), ('api', 'API first')],
+        required=False,
+        default='browser'
+    )
+
 
+class LocalSearchSerializer(serializers.Serializer):
+    """Serializer for local index search request"""
+    job_type = serializers.ChoiceField(
+        choices=[('job', 'Job'), ('internship', 'Internship')],
+        required=False,
+        default='job'
+    )
+    keyword = serializers.CharField(required=True, max_length=200)
+    location = serializers.CharField(required=False, allow_blank=True, max_length=200, default='')
+    experience = serializers.IntegerField(required=False, min_value=0, allow_null=True, default=None)
+    page = serializers.IntegerField(required=False, min_value=1, default=1)
+    page_size = serializers.IntegerField(required=False, min_value=1, max_value=100, default=20)
+    min_salary = serializers.IntegerField(required=False, min_value=0, allow_null=True, default=None)
+    max_salary = serializers.IntegerField(required=False, min_value=0, allow_null=True, default=None)
+    sort = serializers.ChoiceField(
+        choices=['relevance'] + list(SORT_ORDERS),
+        required=False,
+        default='relevance'
+    )
+    include_duplicates = serializers.BooleanField(required=False, default=False)
+    top_up = serializers.BooleanField(required=False, default=False)
+    min_results = serializers.IntegerField(required=False, min_value=1, max_value=100, allow_null=True, default=None)
+    # Facet filters (repeat the parameter to select several values)
+    department = serializers.ListField(child=serializers.CharField(max_length=200), required=False, default=list)
+    role_category = serializers.ListField(child=serializers.CharField(max_length=200), required=False, default=list)
+    stipend = serializers.ListField(child=serializers.CharField(max_length=200), required=False, default=list)
+    work_mode = serializers.ListField(child=serializers.CharField(max_length=200), required=False, default=list)
+    city = serializers.ListField(child=serializers.CharField(max_length=200), required=False, default=list)
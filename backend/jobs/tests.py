@@ -0,0 +1,81 @@
+import json
+import os
+
+from django.conf import settings
+from django.test import TestCase
+
+from scraper.naukri_scraper import NaukriScraper
+
+from .facets import canonical_city
+from .models import JobFacet, ScrapedJob
+from .search_index import facet_counts, index_jobs, search_local
+
+FIXTURES_DIR = os.path.join(settings.BASE_DIR, 'benchmarks', 'fixtures')
+
+
+def load_api_jobs(filename='api-930c0c8c7eb9.json'):
+    """Parse a bundled search API fixture the way the scraper does"""
+    with open(os.path.join(FIXTURES_DIR, filename), encoding='utf-8') as f:
+        job_details = json.load(f)['jobDetails']
+    return NaukriScraper(browser=False)._parse_api_job_data(job_details)
+
+
+class ApiListingIndexTests(TestCase):
+    """API listings indexed through index_jobs"""
+
+    def test_placeholders_fill_experience_salary_and_location(self):
+        jobs = load_api_jobs()
+        self.assertEqual((jobs[0].experience, jobs[0].salary, jobs[0].location), ('0-2 Yrs', '3-6 Lacs PA', 'Bengaluru'))
+
+    def test_indexed_listings_have_numeric_bounds(self):
+        jobs = load_api_jobs()
+        self.assertEqual(index_jobs(jobs), len(jobs))
+
+        disclosed = ScrapedJob.objects.exclude(salary__icontains='not disclosed')
+        self.assertTrue(disclosed.exists())
+        for scraped_job in disclosed:
+            self.assertIsInstance(scraped_job.min_salary, int, scraped_job.salary)
+            self.assertIsInstance(scraped_job.max_salary, int, scraped_job.salary)
+            self.assertLessEqual(scraped_job.min_salary, scraped_job.max_salary)
+        for scraped_job in ScrapedJob.objects.all():
+            self.assertIsInstance(scraped_job.min_experience, int, scraped_job.experience)
+
+        first = ScrapedJob.objects.get(job_url=jobs[0].job_url)
+        self.assertEqual((first.min_salary, first.max_salary), (300000, 600000))
+        self.assertEqual((first.min_experience, first.max_experience), (0, 2))
+
+
+class CityFacetTests(TestCase):
+    """City facets and the location filter"""
+
+    def setUp(self):
+        index_jobs(load_api_jobs())
+
+    def test_city_facets_hold_only_places(self):
+        cities = set(JobFacet.objects.filter(name='city').values_list('value', flat=True))
+        self.assertTrue(cities)
+        for city in cities:
+            self.assertNotRegex(city.lower(), r'\d|yrs|lacs|lpa|disclosed|remote')
+
+    def test_canonical_city(self):
+        self.assertEqual(canonical_city(' bangalore '), 'Bengaluru')
+        self.assertEqual(canonical_city('Bangalore/Bengaluru'), 'Bengaluru')
+        self.assertEqual(canonical_city('Gurgaon'), 'Gurugram')
+        self.assertEqual(canonical_city('Noida'), 'Noida')
+
+    def test_location_matches_alternate_city_names(self):
+        stored = search_local('python', location='bengaluru')['total']
+        self.assertTrue(stored)
+        self.assertEqual(search_local('python', location='bangalore')['total'], stored)
+        self.assertEqual(facet_counts('python', 'bangalore')['city'][0]['value'], 'Bengaluru')
+
+
+class RendererTests(TestCase):
+    """FastJSONRenderer"""
+
+    def test_serialization_time_in_server_timing_header(self):
+        index_jobs(load_api_jobs())
+        response = self.client.get('/api/jobs/local-search/', {'keyword': 'python'})
+        self.assertEqual(response.status_code, 200)
+        self.assertRegex(response['Server-Timing'], r'^serialization;dur=\d+(\.\d+)?$')
+        self.assertTrue(json.loads(response.content)['jobs'])
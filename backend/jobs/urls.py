@@ -7,5 +7,8 @@ from . import views
 urlpatterns = [
     path('jobs/search/', views.search_jobs, name='search_jobs'),
     path('jobs/details/', views.job_details, name='job_details'),
+    path('jobs/local-search/', views.local_search, name='local_search'),
+    path('jobs/profiles/', views.profiles, name='profiles'),
+    path('jobs/profiles/<str:profile_id>/', views.profile_hotspots, name='profile_hotspots'),
 ]
 
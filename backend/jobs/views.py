@@ -1,27 +1,75 @@
 """
 API views for job scraping
 """
+import hashlib
+
+from django.http import HttpResponse, JsonResponse
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework import status
-from .serializers import JobSearchSerializer, JobSerializer
+from .caching import conditional_response, not_modified_response
+from .models import SearchResult
+from .profiling import list_profiles, profiling_allowed, profiling_requested, run_profiled, top_hotspots
+from .facets import FACET_NAMES
+from .search_index import facet_counts, index_job_details, index_jobs, safe_index, search_local
+from .serializers import JobSearchSerializer, LocalSearchSerializer
 from scraper.naukri_service import get_naukri_data
+from scraper.metrics import render_metrics
+from scraper.warmup import warmup_status
 
 
-@api_view(['POST'])
+def _profiling_denied(request):
+    """Return a 403 response if the request asks for profiling it may not use"""
+    if profiling_requested(request) and not profiling_allowed(request):
+        return Response(
+            {
+                'success': False,
+                'error': 'Profiling not allowed',
+                'message': 'profile=1 requires a staff user or a valid X-Profile-Token header'
+            },
+            status=status.HTTP_403_FORBIDDEN
+        )
+    return None
+
+
+def _run_scrape(request, label, **params):
+    """
+    Call get_naukri_data, under cProfile when the request opts in
+
+    Returns:
+        Tuple of (service result, profile id or None)
+    """
+    if profiling_requested(request):
+        return run_profiled(label, get_naukri_data, **params)
+    return get_naukri_data(**params), None
+
+
+@api_view(['GET', 'POST'])
 def search_jobs(request):
     """
     Search and scrape jobs from Naukri.com
     
-    Expected payload:
+    Expected payload (POST body, or the same fields as GET query parameters):
     {
         "job_type": "job" or "internship",
         "keyword": "web development",
         "location": "india",
-        "experience": 1
+        "experience": 1,
+        "engine": "browser" or "api" (optional, default "browser")
     }
+    
+    Responses carry a content-hash ETag. A GET with a matching
+    If-None-Match gets a 304 without scraping while the ETag is cached.
+    
+    Add "profile": 1 (or ?profile=1) to run the scrape under cProfile; the
+    profile id is returned in metadata.profile_id.
     """
-    serializer = JobSearchSerializer(data=request.data)
+    denied = _profiling_denied(request)
+    if denied:
+        return denied
+    
+    payload = request.query_params if request.method == 'GET' else request.data
+    serializer = JobSearchSerializer(data=payload)
     
     if not serializer.is_valid():
         return Response(
@@ -39,8 +87,23 @@ def search_jobs(request):
     page = validated_data.get('page', 1)
     page_size = validated_data.get('page_size', 20)
     
+    query_key = SearchResult.build_query_key(
+        validated_data['job_type'],
+        validated_data['keyword'],
+        validated_data['location'],
+        validated_data.get('experience'),
+        page,
+        page_size
+    )
+    if not profiling_requested(request):
+        not_modified = not_modified_response(request, 'search', query_key)
+        if not_modified:
+            return not_modified
+    
     # Call the standalone service function
-    result = get_naukri_data(
+    result, profile_id = _run_scrape(
+        request,
+        'search',
         task_type='search',
         job_type=validated_data['job_type'],
         keyword=validated_data['keyword'],
@@ -48,7 +111,8 @@ def search_jobs(request):
         experience=validated_data.get('experience'),
         page=page,
         page_size=page_size,
-        headless=True
+        headless=True,
+        engine=validated_data['engine']
     )
     
     # Handle error response
@@ -62,20 +126,39 @@ def search_jobs(request):
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
     
-    # Serialize job data using Django serializer
+    # Job records are encoded directly by FastJSONRenderer; their schema is
+    # enforced when the scraper builds them, so JobSerializer is not needed
     jobs = result.get('jobs', [])
-    job_serializer = JobSerializer(jobs, many=True)
+    safe_index(index_jobs, jobs, validated_data['job_type'])
+    
+    metadata = result.get('metadata', {})
+    if profile_id:
+        metadata['profile_id'] = profile_id
+    
+    # Facet counts cover every indexed listing matching the query, not just this page
+    facets = safe_index(
+        facet_counts,
+        validated_data['keyword'],
+        validated_data['location'],
+        validated_data.get('experience'),
+        validated_data['job_type']
+    ) or {}
     
     # Build response with serialized data
     response_data = {
         'success': True,
         'count': result.get('count', 0),
-        'jobs': job_serializer.data,
+        'jobs': jobs,
         'pagination': result.get('pagination', {}),
-        'metadata': result.get('metadata', {})
+        'facets': facets,
+        'metadata': metadata
     }
     
-    return Response(response_data, status=status.HTTP_200_OK)
+    # The ETag covers the jobs, pagination and facets, not the per-request metadata
+    return conditional_response(
+        request, 'search', query_key, response_data,
+        {'jobs': jobs, 'pagination': response_data['pagination'], 'facets': facets}
+    )
 
 
 @api_view(['GET'])
@@ -85,7 +168,15 @@ def job_details(request):
     
     Query parameters:
     - url: The job detail URL from Naukri.com (required)
+    - profile: Set to 1 to run the scrape under cProfile (staff or token only)
+    
+    Responses carry a content-hash ETag. A matching If-None-Match gets a 304
+    without scraping while the ETag is cached.
     """
+    denied = _profiling_denied(request)
+    if denied:
+        return denied
+    
     job_url = request.query_params.get('url', None)
     
     if not job_url:
@@ -98,8 +189,16 @@ def job_details(request):
             status=status.HTTP_400_BAD_REQUEST
         )
     
+    url_key = hashlib.sha256(job_url.strip().encode('utf-8')).hexdigest()
+    if not profiling_requested(request):
+        not_modified = not_modified_response(request, 'details', url_key)
+        if not_modified:
+            return not_modified
+    
     # Call the standalone service function
-    result = get_naukri_data(
+    result, profile_id = _run_scrape(
+        request,
+        'details',
         task_type='details',
         job_url=job_url,
         headless=True
@@ -116,9 +215,196 @@ def job_details(request):
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
     
+    metadata = result.get('metadata', {})
+    if profile_id:
+        metadata['profile_id'] = profile_id
+    
+    job_details = result.get('job_details', {})
+    safe_index(index_job_details, job_url, job_details)
+    
     # Return successful response
+    return conditional_response(
+        request, 'details', url_key,
+        {
+            'success': True,
+            'job_details': job_details,
+            'metadata': metadata
+        },
+        job_details
+    )
+
+
+@api_view(['GET'])
+def local_search(request):
+    """
+    Search previously scraped jobs in the local full-text index
+    
+    Query parameters:
+    - keyword: Words to match in title, company, description, tags and key skills (required)
+    - location: Location substring; 'india' or empty matches everywhere
+    - experience: Years of experience the listing's range must include
+    - job_type: 'job' (default) or 'internship'
+    - page, page_size: Pagination (default: 1, 20)
+    - top_up: Set to true to run a live scrape when the page has fewer than
+      min_results listings (default: page_size), indexing what it finds
+    - min_salary, max_salary: Annual salary bounds in INR (listings whose
+      normalized salary range overlaps them)
+    - sort: 'relevance' (default), 'recent', 'salary_desc', 'salary_asc',
+      'experience_asc' or 'experience_desc'
+    - department, role_category, stipend, work_mode, city: Facet filters;
+      repeat a parameter to match any of several values
+    - include_duplicates: Set to true to keep listings marked as
+      near-duplicates of an older listing (hidden by default)
+    
+    The response includes facet counts over every indexed listing that
+    matches the query.
+    """
+    serializer = LocalSearchSerializer(data=request.query_params)
+    
+    if not serializer.is_valid():
+        return Response(
+            {
+                'success': False,
+                'error': 'Invalid request data',
+                'details': serializer.errors
+            },
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    params = serializer.validated_data
+    page = params['page']
+    page_size = params['page_size']
+    query = {
+        'keyword': params['keyword'],
+        'location': params['location'],
+        'experience': params['experience'],
+        'job_type': params['job_type'],
+        'page': page,
+        'page_size': page_size,
+        'filters': {name: params[name] for name in FACET_NAMES if params[name]},
+        'with_facets': True,
+        'min_salary': params['min_salary'],
+        'max_salary': params['max_salary'],
+        'sort': params['sort'],
+        'include_duplicates': params['include_duplicates'],
+    }
+    
+    found = search_local(**query)
+    topped_up = False
+    top_up_error = None
+    
+    min_results = params['min_results'] or page_size
+    if params['top_up'] and len(found['jobs']) < min_results:
+        result = get_naukri_data(
+            task_type='search',
+            job_type=params['job_type'],
+            keyword=params['keyword'],
+            location=params['location'] or 'india',
+            experience=params['experience'],
+            page=page,
+            page_size=page_size,
+            headless=True
+        )
+        if result.get('success'):
+            safe_index(index_jobs, result.get('jobs', []), params['job_type'])
+            found = search_local(**query)
+            topped_up = True
+        else:
+            top_up_error = result.get('message') or result.get('error')
+    
+    total = found['total']
+    total_pages = (total + page_size - 1) // page_size
+    metadata = {
+        'data_source': 'local_index',
+        'engine': found['engine'],
+        'took_ms': found['took_ms'],
+        'topped_up': topped_up,
+    }
+    if top_up_error:
+        metadata['top_up_error'] = top_up_error
+    
     return Response({
         'success': True,
-        'job_details': result.get('job_details', {})
-    }, status=status.HTTP_200_OK)
+        'count': len(found['jobs']),
+        'jobs': found['jobs'],
+        'pagination': {
+            'current_page': page,
+            'page_size': page_size,
+            'has_next': page < total_pages,
+            'has_previous': page > 1,
+            'total_pages': total_pages,
+            'total_jobs': total
+        },
+        'facets': found['facets'],
+        'metadata': metadata
+    })
+
+
+@api_view(['GET'])
+def profiles(request):
+    """
+    List stored request profiles, newest first (staff or token only)
+    
+    Query parameters:
+    - limit: Maximum number of profiles (default: 50)
+    """
+    if not profiling_allowed(request):
+        return Response(
+            {'success': False, 'error': 'Profiling not allowed'},
+            status=status.HTTP_403_FORBIDDEN
+        )
+    try:
+        limit = int(request.query_params.get('limit', 50))
+    except ValueError:
+        limit = 50
+    return Response({'success': True, 'profiles': list_profiles(limit=limit)})
 
+
+@api_view(['GET'])
+def profile_hotspots(request, profile_id):
+    """
+    Top hotspots of a stored profile (staff or token only)
+    
+    Query parameters:
+    - limit: Number of functions (default: 25)
+    - sort: 'cumulative' (default), 'tottime' or 'ncalls'
+    """
+    if not profiling_allowed(request):
+        return Response(
+            {'success': False, 'error': 'Profiling not allowed'},
+            status=status.HTTP_403_FORBIDDEN
+        )
+    try:
+        limit = int(request.query_params.get('limit', 25))
+    except ValueError:
+        limit = 25
+    hotspots = top_hotspots(profile_id, limit=limit, sort=request.query_params.get('sort', 'cumulative'))
+    if hotspots is None:
+        return Response(
+            {'success': False, 'error': 'Profile not found', 'message': f"No profile with id '{profile_id}'"},
+            status=status.HTTP_404_NOT_FOUND
+        )
+    return Response({'success': True, 'profile_id': profile_id, 'hotspots': hotspots})
+
+
+def metrics(request):
+    """
+    Expose process metrics in the Prometheus text format
+
+    Includes search/details latency histograms by data source, API fallback
+    and field extraction failure counters, live browser and in-flight scrape
+    gauges, cache hit ratios, rate limits and circuit breaker states.
+    """
+    return HttpResponse(render_metrics(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
+def readiness(request):
+    """
+    Report whether this worker has finished warming up
+
+    Returns 200 once warmup is complete (or was not configured) and 503 while
+    it is still running. The body lists the warmup steps, their duration in
+    milliseconds, the number of pooled browsers and any errors.
+    """
+    state = warmup_status()
+    return JsonResponse(state, status=200 if state['ready'] else 503)
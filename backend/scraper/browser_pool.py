@@ -0,0 +1,144 @@
+"""
+Pool of pre-started browsers shared by the scrapes of one process.
+
+Starting Chrome and attaching the WebDriver takes seconds, so a worker can
+launch browsers ahead of time (see ``scraper.warmup``) and every scrape
+borrows one instead of paying the cold start. Borrowed browsers go back to
+the pool if they still respond and have not reached ``max_uses``; otherwise
+they are closed. When the pool is empty, scrapes start their own browser as
+before.
+
+Configuration (environment variables):
+    NAUKRI_BROWSER_POOL_SIZE      Browsers started by warmup (default: 1)
+    NAUKRI_BROWSER_MAX_USES       Scrapes per browser before it is replaced (default: 50)
+"""
+import atexit
+import os
+import threading
+
+from .metrics import gauge
+from .tracing import Tracer
+
+
+POOL_IDLE = gauge(
+    'naukri_browser_pool_idle',
+    'Pre-started browsers waiting in the pool'
+)
+
+
+class BrowserPool:
+    """Idle NaukriScraper instances with a running browser"""
+
+    def __init__(self, size=None, max_uses=None):
+        """
+        Args:
+            size: Number of browsers to keep (default: NAUKRI_BROWSER_POOL_SIZE or 1)
+            max_uses: Scrapes per browser before it is closed
+                (default: NAUKRI_BROWSER_MAX_USES or 50)
+        """
+        self.size = size if size is not None else int(os.getenv('NAUKRI_BROWSER_POOL_SIZE', '1'))
+        self.max_uses = max_uses if max_uses is not None else int(os.getenv('NAUKRI_BROWSER_MAX_USES', '50'))
+        self._idle = []
+        self._uses = {}
+        self._lock = threading.Lock()
+
+    def fill(self, headless=True, base_url=None, prime=True, log=None):
+        """
+        Start browsers until the pool holds ``size`` of them
+
+        Args:
+            headless: Whether to run the browsers headless
+            base_url: Site root the browsers will scrape
+            prime: Load the home page first to pick up session cookies
+            log: Optional callable receiving progress messages
+
+        Returns:
+            Number of browsers started
+        """
+        from .naukri_scraper import NaukriScraper
+
+        started = 0
+        while self.idle_count() < self.size:
+            scraper = NaukriScraper(headless=headless, base_url=base_url)
+            if prime:
+                try:
+                    if not scraper.prime_session() and log:
+                        log('Session priming hit a block page')
+                except Exception as e:
+                    if log:
+                        log(f"Session priming failed: {e}")
+            self._put(scraper)
+            started += 1
+        return started
+
+    def acquire(self, headless=True, base_url=None):
+        """
+        Borrow an idle browser matching the requested settings
+
+        Returns:
+            NaukriScraper with a fresh tracer, or None if none is available
+        """
+        from .naukri_scraper import DEFAULT_BASE_URL
+
+        wanted = (base_url or os.getenv('NAUKRI_BASE_URL') or DEFAULT_BASE_URL).rstrip('/')
+        with self._lock:
+            for index, scraper in enumerate(self._idle):
+                if scraper.base_url == wanted and scraper.headless == headless:
+                    del self._idle[index]
+                    POOL_IDLE.set(len(self._idle))
+                    break
+            else:
+                return None
+        scraper.tracer = Tracer()
+        return scraper
+
+    def release(self, scraper):
+        """Return a borrowed (or newly started) browser, closing it if it is worn out or full"""
+        with self._lock:
+            uses = self._uses.pop(id(scraper), 0) + 1
+            keep = uses < self.max_uses and len(self._idle) < self.size
+        if keep and scraper.is_alive():
+            self._put(scraper, uses)
+        else:
+            scraper.close()
+
+    def idle_count(self):
+        with self._lock:
+            return len(self._idle)
+
+    def close_all(self):
+        """Close every idle browser"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+            self._uses.clear()
+            POOL_IDLE.set(0)
+        for scraper in idle:
+            try:
+                scraper.close()
+            except Exception:
+                pass
+
+    def _put(self, scraper, uses=0):
+        with self._lock:
+            self._idle.append(scraper)
+            self._uses[id(scraper)] = uses
+            POOL_IDLE.set(len(self._idle))
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool():
+    """Return the process-wide browser pool"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool()
+        return _pool
+
+
+@atexit.register
+def _close_pool_at_exit():
+    if _pool is not None:
+        _pool.close_all()
@@ -0,0 +1,173 @@
+"""
+On-disk checkpoint journal of a bulk crawl.
+
+A bulk crawl (``scrape_jobs.py --queries``) records its progress in a small
+SQLite file after every page: the queries and their settings, the last
+page scraped and whether each query is finished, the dedup keys written so
+far, the listings whose details page has not been fetched yet and, for
+outputs that are only complete at the end (JSON, Parquet), the listings
+themselves. Each page is committed in one
+transaction, so after a crash ``--resume`` continues with the next page of
+every unfinished query without re-fetching completed ones.
+"""
+import json
+import sqlite3
+
+from .records import encode_job
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
+
+def _dumps(value):
+    if orjson is not None:
+        return orjson.dumps(value, default=encode_job).decode('utf-8')
+    return json.dumps(value, default=encode_job, ensure_ascii=False)
+
+
+def _loads(text):
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
+
+class CrawlJournal:
+    """
+    Checkpoint journal of one crawl
+
+    Args:
+        path: SQLite file; created if missing
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._db = sqlite3.connect(path, timeout=30)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS queries (
+                query_id INTEGER PRIMARY KEY,
+                spec TEXT NOT NULL,
+                last_page INTEGER NOT NULL DEFAULT 0,
+                done INTEGER NOT NULL DEFAULT 0,
+                stats TEXT
+            );
+            CREATE TABLE IF NOT EXISTS seen (key TEXT PRIMARY KEY);
+            CREATE TABLE IF NOT EXISTS jobs (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                query_id INTEGER NOT NULL,
+                data TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS pending_details (
+                url TEXT PRIMARY KEY,
+                query_id INTEGER NOT NULL,
+                data TEXT NOT NULL
+            );
+        """)
+        self._db.commit()
+
+    @property
+    def started(self):
+        """Whether the journal holds a crawl"""
+        return self._db.execute("SELECT 1 FROM meta WHERE name = 'settings'").fetchone() is not None
+
+    def start(self, settings, queries):
+        """
+        Record a new crawl, replacing anything the journal held
+
+        Args:
+            settings: JSON-serializable run settings (output, format, ...)
+            queries: Query dicts, in order
+        """
+        with self._db:
+            for table in ('meta', 'queries', 'seen', 'jobs', 'pending_details'):
+                self._db.execute(f'DELETE FROM {table}')
+            self._db.execute("INSERT INTO meta (name, value) VALUES ('settings', ?)", (_dumps(settings),))
+            self._db.executemany(
+                'INSERT INTO queries (query_id, spec) VALUES (?, ?)',
+                [(query_id, _dumps(query)) for query_id, query in enumerate(queries)]
+            )
+
+    def settings(self):
+        row = self._db.execute("SELECT value FROM meta WHERE name = 'settings'").fetchone()
+        return _loads(row[0]) if row else None
+
+    def queries(self):
+        """
+        Returns:
+            List of (query, last_page, done, stats) in query order
+        """
+        return [
+            (_loads(spec), last_page, bool(done), _loads(stats) if stats else None)
+            for spec, last_page, done, stats in self._db.execute(
+                'SELECT spec, last_page, done, stats FROM queries ORDER BY query_id'
+            )
+        ]
+
+    def seen_keys(self):
+        """Dedup keys of every listing written so far"""
+        return {row[0] for row in self._db.execute('SELECT key FROM seen')}
+
+    def stored_jobs(self):
+        """Listings kept in the journal, as (query_id, job dict) in write order"""
+        for query_id, data in self._db.execute('SELECT query_id, data FROM jobs ORDER BY seq'):
+            yield query_id, _loads(data)
+
+    def record_page(self, query_id, page, keys, done, stats, jobs=None, detail_jobs=()):
+        """
+        Commit the outcome of one page
+
+        Args:
+            query_id: Index of the query
+            page: Page just scraped
+            keys: Dedup keys of the listings written from it
+            done: Whether the query is finished
+            stats: The query's statistics so far
+            jobs: Listings to keep in the journal (for outputs written at the end)
+            detail_jobs: Listings whose details page still has to be fetched
+                (they are written once it is)
+        """
+        with self._db:
+            self._db.execute(
+                'UPDATE queries SET last_page = ?, done = ?, stats = ? WHERE query_id = ?',
+                (page, int(done), _dumps(stats), query_id)
+            )
+            self._db.executemany('INSERT OR IGNORE INTO seen (key) VALUES (?)', [(key,) for key in keys])
+            if jobs:
+                self._db.executemany(
+                    'INSERT INTO jobs (query_id, data) VALUES (?, ?)',
+                    [(query_id, _dumps(job)) for job in jobs]
+                )
+            if detail_jobs:
+                self._db.executemany(
+                    'INSERT OR IGNORE INTO pending_details (url, query_id, data) VALUES (?, ?, ?)',
+                    [(job['job_url'], query_id, _dumps(job)) for job in detail_jobs]
+                )
+
+    def pending_details(self):
+        """Listings whose details have not been fetched yet, as (query_id, job dict)"""
+        return [
+            (query_id, _loads(data))
+            for query_id, data in self._db.execute('SELECT query_id, data FROM pending_details ORDER BY rowid')
+        ]
+
+    def complete_details(self, url, query_id, stats=None, record=None):
+        """
+        Commit a listing whose details were fetched and written
+
+        Args:
+            url: Job URL of the listing
+            query_id: Index of its query
+            stats: The query's statistics so far
+            record: Listing with its details to keep in the journal (for
+                outputs written at the end)
+        """
+        with self._db:
+            self._db.execute('DELETE FROM pending_details WHERE url = ?', (url,))
+            if stats is not None:
+                self._db.execute('UPDATE queries SET stats = ? WHERE query_id = ?', (_dumps(stats), query_id))
+            if record is not None:
+                self._db.execute('INSERT INTO jobs (query_id, data) VALUES (?, ?)', (query_id, _dumps(record)))
+
+    def close(self):
+        self._db.close()
@@ -0,0 +1,132 @@
+"""
+Circuit breakers for the scraping strategies.
+
+When naukri.com changes its DOM the browser strategy fails on every request,
+and each request pays the full page load and container wait before falling
+back to the API. A breaker counts consecutive failures per strategy
+('browser', and 'api' for the JSON API, which can be blocked too); once the
+threshold is hit it opens and callers skip the strategy entirely. After
+``reset_timeout`` seconds it half-opens and lets a single trial request
+through: success closes the breaker, failure opens it again.
+"""
+import os
+import threading
+import time
+
+
+BREAKER_FAILURE_THRESHOLD = int(os.getenv('NAUKRI_BREAKER_THRESHOLD', '3'))
+BREAKER_RESET_SECONDS = float(os.getenv('NAUKRI_BREAKER_RESET_SECONDS', '300'))
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one scraping strategy"""
+
+    def __init__(self, name, failure_threshold=BREAKER_FAILURE_THRESHOLD, reset_timeout=BREAKER_RESET_SECONDS):
+        """
+        Args:
+            name: Strategy name, e.g. 'browser'
+            failure_threshold: Consecutive failures that open the breaker
+            reset_timeout: Seconds the breaker stays open before a trial request
+        """
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+        self.total_successes = 0
+        self.total_failures = 0
+        self.total_short_circuits = 0
+
+    @property
+    def state(self):
+        """Current state: 'closed', 'open' or 'half_open'"""
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def _maybe_half_open(self):
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+            self._trial_in_flight = False
+
+    def allow_request(self):
+        """
+        Check whether the strategy may be attempted now
+
+        Returns:
+            True if the caller should try the strategy, False to skip it
+        """
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            self.total_short_circuits += 1
+            return False
+
+    def record_success(self):
+        """Record a successful attempt and close the breaker"""
+        with self._lock:
+            self.total_successes += 1
+            self._consecutive_failures = 0
+            self._state = CLOSED
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        """Record a failed attempt, opening the breaker at the threshold"""
+        with self._lock:
+            self.total_failures += 1
+            self._consecutive_failures += 1
+            if self._state == HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+    def release(self):
+        """End an attempt whose outcome says nothing about the strategy"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def snapshot(self):
+        """Return the breaker state as a plain dictionary"""
+        with self._lock:
+            self._maybe_half_open()
+            return {
+                'state': self._state,
+                'consecutive_failures': self._consecutive_failures,
+                'total_successes': self.total_successes,
+                'total_failures': self.total_failures,
+                'total_short_circuits': self.total_short_circuits,
+            }
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(name):
+    """Return the shared breaker for a strategy"""
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(name)
+            _breakers[name] = breaker
+        return breaker
+
+
+def circuit_breaker_metrics():
+    """Return a snapshot of every breaker, keyed by strategy name"""
+    with _breakers_lock:
+        breakers = dict(_breakers)
+    return {name: breaker.snapshot() for name, breaker in breakers.items()}
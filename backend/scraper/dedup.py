@@ -0,0 +1,150 @@
+"""
+Job deduplication across pages, queries and scraping paths.
+
+The same posting appears on several result pages, under several keywords
+and with slightly different URLs depending on whether it came from the
+search page or the JSON API (tracking parameters, relative vs absolute
+URLs, a different slug). Every naukri job URL ends with the numeric job id
+(``/job-listings-python-developer-infosys-bengaluru-0-to-3-years-100000007919``),
+so ``dedup_key`` keys a listing on that id and falls back to a fingerprint
+of its normalized title, company and location when the URL has none.
+
+``SeenStore`` is a persistent set of keys in SQLite, shared by processes
+through file locking, so bulk crawls can skip listings an earlier run
+already produced.
+"""
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from urllib.parse import urlsplit
+
+# The job id is the run of digits at the end of the URL path
+_JOB_ID = re.compile(r'(?:^|[-/])(\d{6,})/?$')
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+
+def job_id_from_url(url):
+    """
+    Parse the naukri job id from a job URL (jdURL, jobUrl or a card link)
+
+    Returns:
+        The id as a string, or None if the URL has none
+    """
+    if not url:
+        return None
+    match = _JOB_ID.search(urlsplit(url.strip()).path)
+    return match.group(1) if match else None
+
+
+def _normalize(text):
+    return ' '.join(_NON_ALNUM.sub(' ', (text or '').lower()).split())
+
+
+def fingerprint(job_title, company_name, location):
+    """Hash of the normalized title, company and location of a listing"""
+    parts = '|'.join(_normalize(part) for part in (job_title, company_name, location))
+    return hashlib.sha1(parts.encode('utf-8')).hexdigest()[:20]
+
+
+def dedup_key(job):
+    """
+    Stable identity of a listing
+
+    Args:
+        job: Job record or job dictionary
+
+    Returns:
+        'id:<naukri job id>' or, for URLs without an id, 'fp:<fingerprint>'
+    """
+    job_id = job_id_from_url(job.get('job_url'))
+    if job_id:
+        return f'id:{job_id}'
+    return 'fp:' + fingerprint(job.get('job_title'), job.get('company_name'), job.get('location'))
+
+
+def dedupe(jobs):
+    """Drop repeated listings from a batch, keeping the first occurrence"""
+    seen = set()
+    unique = []
+    for job in jobs:
+        key = dedup_key(job)
+        if key not in seen:
+            seen.add(key)
+            unique.append(job)
+    return unique
+
+
+class SeenStore:
+    """
+    Persistent set of dedup keys backed by SQLite
+
+    Safe to share between threads; worker processes each open their own
+    store on the same file.
+    """
+
+    def __init__(self, path=':memory:'):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        if path != ':memory:':
+            self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS seen_jobs ('
+            'key TEXT PRIMARY KEY, first_seen REAL NOT NULL, last_seen REAL NOT NULL)'
+        )
+        self._db.commit()
+
+    def __contains__(self, key):
+        with self._lock:
+            row = self._db.execute('SELECT 1 FROM seen_jobs WHERE key = ?', (key,)).fetchone()
+        return row is not None
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM seen_jobs').fetchone()[0]
+
+    def add_many(self, keys):
+        """
+        Record keys as seen
+
+        Returns:
+            The keys that were not seen before, in input order
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return []
+        now = time.time()
+        with self._lock, self._db:
+            known = set()
+            # Stay under SQLite's bound parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                known.update(
+                    row[0] for row in self._db.execute(
+                        f"SELECT key FROM seen_jobs WHERE key IN ({', '.join('?' * len(chunk))})", chunk
+                    )
+                )
+            self._db.executemany(
+                'INSERT INTO seen_jobs (key, first_seen, last_seen) VALUES (?, ?, ?) '
+                'ON CONFLICT(key) DO UPDATE SET last_seen = excluded.last_seen',
+                [(key, now, now) for key in keys]
+            )
+        return [key for key in keys if key not in known]
+
+    def filter_new(self, jobs):
+        """
+        Keep only listings not seen before (in this batch or earlier) and record them
+
+        Returns:
+            Tuple of (new jobs, number of duplicates dropped)
+        """
+        unique = dedupe(jobs)
+        new_keys = set(self.add_many(dedup_key(job) for job in unique))
+        new_jobs = [job for job in unique if dedup_key(job) in new_keys]
+        return new_jobs, len(jobs) - len(new_jobs)
+
+    def close(self):
+        with self._lock:
+            self._db.close()
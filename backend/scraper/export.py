@@ -0,0 +1,308 @@
+"""
+Streaming export of scraped listings.
+
+``JSONLWriter`` writes one JSON object per line (JSON Lines / NDJSON) as
+listings arrive instead of building one document at the end, so a long
+crawl uses constant memory, a crash keeps everything written so far, and
+the file can be inspected (``tail -f``, ``zcat | wc -l``) while the crawl
+runs. Paths ending in ``.gz`` are gzip-compressed on the fly; each flush
+ends a deflate block so everything written up to it can be decompressed.
+
+``read_jsonl`` reads such files back, plain or gzip, and ``repair_jsonl``
+cuts a file left by a crash back to its last complete line so that a
+resumed crawl can append to it.
+
+``ParquetWriter`` writes the same listings as a columnar Parquet file for
+analytics, in row groups of ``row_group_size`` listings: memory stays
+bounded, but the file is only readable once closed (the footer is written
+last). Repetitive labels (company, location, salary, department...) are
+Arrow dictionary columns, read back as pandas categoricals, and every
+string column is dictionary-encoded in the file where that pays off.
+Each row group's salary and experience labels are normalized with
+``scraper.normalize``. pyarrow is optional and imported on first use.
+"""
+import gzip
+import json
+import os
+import time
+import zlib
+
+from .records import JOB_FIELDS, Job, encode_job
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
+
+# Errors of gzip streams cut off mid-write
+_TRUNCATED_GZIP = (EOFError, zlib.error, gzip.BadGzipFile)
+
+
+def _encode_line(record):
+    if orjson is not None:
+        return orjson.dumps(record, default=encode_job) + b'\n'
+    return (json.dumps(record, default=encode_job, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+def is_gzip_path(path):
+    return str(path).lower().endswith('.gz')
+
+
+class JSONLWriter:
+    """
+    Append records (Job records or dictionaries) to a JSON Lines file
+
+    Args:
+        path: Output file; gzip-compressed if it ends in .gz (or compress=True)
+        compress: Force gzip on or off
+        append: Add to an existing file instead of replacing it (a new gzip
+            member is started, which gzip readers handle transparently)
+        flush_every: Flush after this many records...
+        flush_seconds: ...or when this long has passed since the last flush
+    """
+
+    def __init__(self, path, compress=None, append=False, flush_every=100, flush_seconds=5.0):
+        self.path = path
+        self.compress = is_gzip_path(path) if compress is None else compress
+        self.flush_every = flush_every
+        self.flush_seconds = flush_seconds
+        self.count = 0
+        mode = 'ab' if append else 'wb'
+        self._raw = open(path, mode)
+        self._file = gzip.GzipFile(fileobj=self._raw, mode=mode) if self.compress else self._raw
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def write(self, record):
+        """Write one record"""
+        self._file.write(_encode_line(record))
+        self.count += 1
+        self._pending += 1
+        if self._pending >= self.flush_every or time.monotonic() - self._last_flush >= self.flush_seconds:
+            self.flush()
+
+    def write_many(self, records):
+        """Write records in order; returns how many were written"""
+        written = 0
+        for record in records:
+            self.write(record)
+            written += 1
+        return written
+
+    def flush(self):
+        """Push buffered lines to disk (a sync flush on gzip files)"""
+        self._file.flush()
+        if self._file is not self._raw:
+            self._raw.flush()
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def close(self):
+        if self._raw.closed:
+            return
+        self._file.close()
+        if self._file is not self._raw:
+            self._raw.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def repair_jsonl(path):
+    """
+    Cut a JSON Lines file (plain or .gz) back to its last complete line
+
+    Appending to a file that ends in a half-written line (or a half-written
+    gzip block) would corrupt the next record, so a crawl resuming into an
+    existing file repairs it first. Missing files are left alone.
+    """
+    if not os.path.exists(path):
+        return
+    if is_gzip_path(path):
+        # A cut-off gzip member cannot be appended to; copy the intact lines
+        repaired = f"{path}.repair"
+        with gzip.open(path, 'rb') as source, gzip.open(repaired, 'wb') as target:
+            try:
+                for line in source:
+                    if not line.endswith(b'\n'):
+                        break
+                    target.write(line)
+            except _TRUNCATED_GZIP:
+                pass
+        os.replace(repaired, path)
+        return
+    with open(path, 'r+b') as f:
+        end = f.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            start = max(0, position - 65536)
+            f.seek(start)
+            chunk = f.read(position - start)
+            newline = chunk.rfind(b'\n')
+            if newline != -1:
+                position = start + newline + 1
+                break
+            position = start
+        if position != end:
+            f.truncate(position)
+
+
+def read_jsonl(path, as_jobs=False):
+    """
+    Iterate over the records of a JSON Lines file (plain or .gz)
+
+    A truncated last line (a crawl killed mid-write) is skipped.
+
+    Args:
+        path: File written by JSONLWriter
+        as_jobs: Yield Job records instead of dictionaries
+
+    Yields:
+        One dictionary (or Job) per line
+    """
+    opener = gzip.open if is_gzip_path(path) else open
+    with opener(path, 'rb') as lines:
+        while True:
+            try:
+                line = lines.readline()
+            except _TRUNCATED_GZIP:
+                # gzip stream cut off by a crash
+                return
+            if not line.endswith(b'\n'):
+                return
+            line = line.strip()
+            if not line:
+                continue
+            record = orjson.loads(line) if orjson is not None else json.loads(line)
+            yield Job.from_dict(record) if as_jobs else record
+
+
+# Parquet columns besides JOB_FIELDS: the index's job type, the normalized
+# salary/experience ranges, details-page fields and index timestamps
+DETAIL_FIELDS = ('department', 'role_category', 'industry_type', 'key_skills')
+EXPORT_FIELDS = JOB_FIELDS + (
+    'job_type', 'min_salary', 'max_salary', 'min_experience', 'max_experience',
+) + DETAIL_FIELDS + ('first_seen_at', 'last_seen_at')
+
+# Low-cardinality text columns stored as Arrow dictionaries
+CATEGORICAL_FIELDS = frozenset((
+    'company_name', 'rating', 'reviews', 'experience', 'salary', 'location', 'job_post_date',
+    'job_type', 'department', 'role_category', 'industry_type'
+))
+_LIST_FIELDS = frozenset(('tags', 'key_skills'))
+_INT_FIELDS = frozenset(('min_salary', 'max_salary', 'min_experience', 'max_experience'))
+_TIME_FIELDS = frozenset(('first_seen_at', 'last_seen_at'))
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("Parquet export needs pyarrow (pip install pyarrow)")
+    return pyarrow, pyarrow.parquet
+
+
+def parquet_schema():
+    """Arrow schema of exported listings (see EXPORT_FIELDS)"""
+    pa, _ = _pyarrow()
+    types = []
+    for name in EXPORT_FIELDS:
+        if name in _LIST_FIELDS:
+            types.append((name, pa.list_(pa.string())))
+        elif name in _INT_FIELDS:
+            types.append((name, pa.int64()))
+        elif name in _TIME_FIELDS:
+            types.append((name, pa.timestamp('us', tz='UTC')))
+        elif name in CATEGORICAL_FIELDS:
+            types.append((name, pa.dictionary(pa.int32(), pa.string())))
+        else:
+            types.append((name, pa.string()))
+    return pa.schema(types)
+
+
+class ParquetWriter:
+    """
+    Write listings (Job records or dictionaries) to a Parquet file in row groups
+
+    Args:
+        path: Output file
+        row_group_size: Listings per row group (and buffered in memory)
+        compression: Parquet codec ('zstd', 'snappy', 'gzip' or 'none')
+        normalize: Fill min/max salary and experience from the labels
+            (for Job records, which do not carry them)
+        job_type: Job type of listings that do not carry one
+    """
+
+    def __init__(self, path, row_group_size=50000, compression='zstd', normalize=True, job_type=None):
+        pa, pq = _pyarrow()
+        self.path = path
+        self.row_group_size = row_group_size
+        self.normalize = normalize
+        self.job_type = job_type
+        self.count = 0
+        self._pa = pa
+        self._schema = parquet_schema()
+        self._writer = pq.ParquetWriter(path, self._schema, compression=compression, use_dictionary=True)
+        self._rows = []
+
+    def write(self, record):
+        """Buffer one record, writing a row group when the buffer is full"""
+        self._rows.append(record)
+        self.count += 1
+        if len(self._rows) >= self.row_group_size:
+            self.flush()
+
+    def write_many(self, records):
+        """Write records in order; returns how many were written"""
+        written = 0
+        for record in records:
+            self.write(record)
+            written += 1
+        return written
+
+    def flush(self):
+        """Write the buffered records as one row group"""
+        if not self._rows:
+            return
+        rows, self._rows = self._rows, []
+        columns = {name: [] for name in EXPORT_FIELDS}
+        for record in rows:
+            for name in EXPORT_FIELDS:
+                value = record.get(name)
+                if name in _LIST_FIELDS:
+                    value = list(value or ())
+                elif name in _INT_FIELDS or name in _TIME_FIELDS:
+                    value = value if value != '' else None
+                else:
+                    value = '' if value is None else value
+                columns[name].append(value)
+        if self.job_type:
+            columns['job_type'] = [value or self.job_type for value in columns['job_type']]
+        if self.normalize:
+            from .normalize import NORMALIZED_FIELDS, normalize_batch
+            normalized = normalize_batch(rows)
+            for name in NORMALIZED_FIELDS:
+                columns[name] = [
+                    current if current is not None else values[name]
+                    for current, values in zip(columns[name], normalized)
+                ]
+        table = self._pa.Table.from_pydict(columns, schema=self._schema)
+        self._writer.write_table(table, row_group_size=len(rows))
+
+    def close(self):
+        if self._writer is None:
+            return
+        self.flush()
+        self._writer.close()
+        self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,312 @@
+"""
+In-process metrics in the Prometheus text exposition format.
+
+Counters, gauges and histograms are kept in memory and rendered by the
+``/metrics`` endpoint; no external service or client library is needed.
+Values are per process, so with several gunicorn workers each scrape of
+``/metrics`` reports the worker that served it.
+"""
+import math
+import threading
+
+from .tracing import add_timing_listener
+
+
+DEFAULT_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labelnames, values, extra=None):
+    pairs = list(zip(labelnames, values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _format_value(value):
+    if value == math.inf:
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric:
+    """Base class: a named metric family with optional labels"""
+
+    metric_type = 'untyped'
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            # Unlabelled metrics are exported from the start, not after the first update
+            self._values[()] = self._initial_value()
+
+    def _initial_value(self):
+        return 0
+
+    def _key(self, labels):
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+            if not self.labelnames:
+                self._values[()] = self._initial_value()
+
+    def render(self):
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.metric_type}",
+        ]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.extend(self._render_sample(key, value))
+        return lines
+
+    def _render_sample(self, key, value):
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"]
+
+
+class Counter(Metric):
+    """Monotonically increasing count"""
+
+    metric_type = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+
+class Gauge(Metric):
+    """Value that can go up and down"""
+
+    metric_type = 'gauge'
+
+    def set(self, value, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+    def value(self, **labels):
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+
+class Histogram(Metric):
+    """Distribution of observed values in cumulative buckets"""
+
+    metric_type = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        super().__init__(name, documentation, labelnames)
+
+    def _initial_value(self):
+        return {'counts': [0] * len(self.buckets), 'sum': 0.0, 'count': 0}
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = self._initial_value()
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state['counts'][index] += 1
+                    break
+            state['sum'] += value
+            state['count'] += 1
+
+    def _render_sample(self, key, state):
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, state['counts']):
+            cumulative += count
+            labels = _format_labels(self.labelnames, key, ('le', _format_value(bound)))
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        labels = _format_labels(self.labelnames, key)
+        lines.append(f"{self.name}_sum{labels} {_format_value(round(state['sum'], 6))}")
+        lines.append(f"{self.name}_count{labels} {state['count']}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metrics plus collectors that refresh gauges on render"""
+
+    def __init__(self):
+        self._metrics = {}
+        self._collectors = []
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def add_collector(self, collector):
+        """Register a callable run before every render (e.g. to set gauges)"""
+        with self._lock:
+            if collector not in self._collectors:
+                self._collectors.append(collector)
+
+    def render(self):
+        """Render every metric in the Prometheus text format"""
+        with self._lock:
+            collectors = list(self._collectors)
+            metrics = list(self._metrics.values())
+        for collector in collectors:
+            try:
+                collector()
+            except Exception:
+                pass
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = MetricsRegistry()
+
+
+def counter(name, documentation, labelnames=()):
+    return REGISTRY.register(Counter(name, documentation, labelnames))
+
+
+def gauge(name, documentation, labelnames=()):
+    return REGISTRY.register(Gauge(name, documentation, labelnames))
+
+
+def histogram(name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+    return REGISTRY.register(Histogram(name, documentation, labelnames, buckets))
+
+
+# --- Scraper metrics ---
+
+SEARCH_DURATION = histogram(
+    'naukri_search_duration_seconds',
+    'Time to answer a job search, by data source',
+    ['data_source']
+)
+DETAILS_DURATION = histogram(
+    'naukri_details_duration_seconds',
+    'Time to scrape a job detail page, by outcome',
+    ['outcome']
+)
+STAGE_DURATION = histogram(
+    'naukri_stage_duration_seconds',
+    'Time spent in each scraping stage',
+    ['stage'],
+    buckets=(0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+)
+FALLBACKS = counter(
+    'naukri_api_fallback_total',
+    'Searches answered by the API after browser scraping failed'
+)
+FIELD_EXTRACTION_FAILURES = counter(
+    'naukri_field_extraction_failures_total',
+    'Fields that could not be extracted, by page type and field',
+    ['page', 'field']
+)
+LIVE_BROWSERS = gauge(
+    'naukri_live_browsers',
+    'Chrome instances currently running'
+)
+INFLIGHT_SCRAPES = gauge(
+    'naukri_inflight_scrapes',
+    'Scrape operations currently running, by task type',
+    ['task_type']
+)
+CACHE_REQUESTS = counter(
+    'naukri_cache_requests_total',
+    'Cache lookups, by cache and result (hit or miss)',
+    ['cache', 'result']
+)
+CACHE_HIT_RATIO = gauge(
+    'naukri_cache_hit_ratio',
+    'Fraction of cache lookups that were hits',
+    ['cache']
+)
+RATE_LIMIT = gauge(
+    'naukri_rate_limit_requests_per_second',
+    'Current adaptive rate limit, by host',
+    ['host']
+)
+RATE_LIMIT_BLOCKS = gauge(
+    'naukri_rate_limit_blocks',
+    'Block signals (429/403, captcha or empty pages) seen, by host',
+    ['host']
+)
+CIRCUIT_OPEN = gauge(
+    'naukri_circuit_breaker_open',
+    'Whether the breaker of a scraping strategy is open (1) or not (0)',
+    ['strategy']
+)
+
+
+def record_cache_lookup(cache, hit):
+    """Count a cache lookup as a hit or a miss"""
+    CACHE_REQUESTS.inc(cache=cache, result='hit' if hit else 'miss')
+
+
+def _collect_cache_ratios():
+    with CACHE_REQUESTS._lock:
+        totals = {}
+        for (cache, result), count in CACHE_REQUESTS._values.items():
+            hits, lookups = totals.get(cache, (0, 0))
+            totals[cache] = (hits + (count if result == 'hit' else 0), lookups + count)
+    for cache, (hits, lookups) in totals.items():
+        CACHE_HIT_RATIO.set(round(hits / lookups, 4) if lookups else 0, cache=cache)
+
+
+def _collect_rate_limits():
+    from .rate_limiter import rate_limiter_metrics
+    for host, snapshot in rate_limiter_metrics().items():
+        RATE_LIMIT.set(snapshot['current_rate'], host=host)
+        RATE_LIMIT_BLOCKS.set(snapshot['total_blocks'], host=host)
+
+
+def _collect_circuit_breakers():
+    from .circuit_breaker import OPEN, circuit_breaker_metrics
+    for strategy, snapshot in circuit_breaker_metrics().items():
+        CIRCUIT_OPEN.set(1 if snapshot['state'] == OPEN else 0, strategy=strategy)
+
+
+def _observe_stage(stage, milliseconds):
+    STAGE_DURATION.observe(milliseconds / 1000.0, stage=stage)
+
+
+REGISTRY.add_collector(_collect_cache_ratios)
+REGISTRY.add_collector(_collect_rate_limits)
+REGISTRY.add_collector(_collect_circuit_breakers)
+add_timing_listener(_observe_stage)
+
+
+def render_metrics():
+    """Render all scraper metrics in the Prometheus text format"""
+    return REGISTRY.render()
@@ -0,0 +1,184 @@
+"""
+MinHash signatures and LSH banding for near-duplicate listings.
+
+Recruiters repost a role under a new job id with a few words changed, which
+exact keys (scraper.dedup) cannot catch. A listing is reduced to a set of
+shingles (word 3-grams of its description plus the words of its title) and
+then to a MinHash signature of ``NUM_PERM`` values; the fraction of equal
+values between two signatures estimates the Jaccard similarity of their
+shingle sets.
+
+For lookup the signature is cut into ``BANDS`` bands of ``ROWS`` values and
+each band is hashed to a bucket. Listings sharing any bucket are candidates,
+so a lookup costs one index probe per band instead of a comparison with
+every stored listing. With 20 bands of 6 rows, pairs at 0.7 similarity
+share a bucket with probability 0.92 (0.998 at 0.8), pairs at 0.3 with
+probability 0.015; candidates are then checked against ``threshold`` on
+the full signature. Two changed words already cost a 30-word snippet a
+third of its 3-grams, hence the fairly low default threshold; full
+descriptions score much higher.
+"""
+import hashlib
+import re
+import zlib
+
+import numpy as np
+
+NUM_PERM = 120
+BANDS = 20
+ROWS = NUM_PERM // BANDS
+DEFAULT_THRESHOLD = 0.7
+SHINGLE_SIZE = 3
+
+# Universal hashing (a * x + b) mod p over 32-bit shingle hashes
+_PRIME = (1 << 61) - 1
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_WORD = re.compile(r'\w+')
+
+
+def shingles(job_title, description, size=SHINGLE_SIZE):
+    """
+    Shingle set of a listing
+
+    Args:
+        job_title: Listing title; each word is a shingle
+        description: Description text; each run of ``size`` words is a shingle
+
+    Returns:
+        Set of strings (empty if there is no text)
+    """
+    words = _WORD.findall((description or '').lower())
+    result = {' '.join(words[i:i + size]) for i in range(max(len(words) - size + 1, 0))}
+    if 0 < len(words) < size:
+        result.add(' '.join(words))
+    result.update(f't:{word}' for word in _WORD.findall((job_title or '').lower()))
+    return result
+
+
+class MinHasher:
+    """MinHash signatures with a fixed, seeded set of permutations"""
+
+    def __init__(self, num_perm=NUM_PERM, seed=1):
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        # a, b < 2**31 keep a * x + b (x < 2**32) inside uint64
+        self._a = rng.randint(1, 1 << 31, size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, 1 << 31, size=num_perm).astype(np.uint64)
+
+    def signature(self, shingle_set):
+        """
+        MinHash signature of a shingle set
+
+        Returns:
+            uint32 array of num_perm values (all 0xffffffff for an empty set)
+        """
+        if not shingle_set:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint32)
+        hashes = np.fromiter(
+            (zlib.crc32(shingle.encode('utf-8')) for shingle in shingle_set),
+            dtype=np.uint64, count=len(shingle_set)
+        )
+        permuted = (np.outer(hashes, self._a) + self._b) % np.uint64(_PRIME) & _MAX_HASH
+        return permuted.min(axis=0).astype(np.uint32)
+
+
+_default_hasher = None
+
+
+def default_hasher():
+    """The process-wide MinHasher every stored signature is computed with"""
+    global _default_hasher
+    if _default_hasher is None:
+        _default_hasher = MinHasher()
+    return _default_hasher
+
+
+def signature(job_title, description):
+    """MinHash signature of a listing's title and description"""
+    return default_hasher().signature(shingles(job_title, description))
+
+
+def similarity(signature_a, signature_b):
+    """Estimated Jaccard similarity of two signatures"""
+    return float(np.mean(signature_a == signature_b))
+
+
+def band_keys(sig, bands=BANDS):
+    """
+    LSH bucket keys of a signature, one per band
+
+    Keys are signed 64-bit ints (they fit a BigIntegerField) and include the
+    band number, so equal rows in different bands do not collide.
+    """
+    rows = len(sig) // bands
+    keys = []
+    for band in range(bands):
+        digest = hashlib.blake2b(
+            sig[band * rows:(band + 1) * rows].tobytes(), digest_size=8, key=band.to_bytes(2, 'big')
+        ).digest()
+        keys.append(int.from_bytes(digest, 'big', signed=True))
+    return keys
+
+
+def to_bytes(sig):
+    """Signature as bytes for storage"""
+    return sig.astype('<u4').tobytes()
+
+
+def from_bytes(data):
+    """Signature stored with to_bytes"""
+    return np.frombuffer(bytes(data), dtype='<u4').astype(np.uint32)
+
+
+class LSHIndex:
+    """In-memory LSH index of signatures, for batch clustering"""
+
+    def __init__(self, bands=BANDS):
+        self.bands = bands
+        self._buckets = {}
+        self._signatures = {}
+
+    def __len__(self):
+        return len(self._signatures)
+
+    def query(self, sig, threshold=DEFAULT_THRESHOLD):
+        """Keys of indexed signatures at least ``threshold`` similar to ``sig``"""
+        candidates = set()
+        for bucket in band_keys(sig, self.bands):
+            candidates.update(self._buckets.get(bucket, ()))
+        return [key for key in candidates if similarity(sig, self._signatures[key]) >= threshold]
+
+    def insert(self, key, sig):
+        self._signatures[key] = sig
+        for bucket in band_keys(sig, self.bands):
+            self._buckets.setdefault(bucket, []).append(key)
+
+
+def cluster(signatures, threshold=DEFAULT_THRESHOLD, bands=BANDS):
+    """
+    Group near-duplicate signatures
+
+    Args:
+        signatures: Iterable of (key, signature) pairs; keys must be orderable
+        threshold: Minimum estimated Jaccard similarity of a duplicate pair
+
+    Returns:
+        Dictionary of key to the smallest key of its cluster
+    """
+    parent = {}
+
+    def find(key):
+        while parent[key] != key:
+            parent[key] = parent[parent[key]]
+            key = parent[key]
+        return key
+
+    index = LSHIndex(bands)
+    for key, sig in signatures:
+        parent[key] = key
+        for match in index.query(sig, threshold):
+            root, other = find(key), find(match)
+            if root != other:
+                parent[max(root, other)] = min(root, other)
+        index.insert(key, sig)
+    return {key: find(key) for key in parent}
@@ -17,13 +17,188 @@ import requests
 import json
 import random
 import string
+import threading
+from .rate_limiter import get_rate_limiter, looks_blocked
+from .circuit_breaker import get_circuit_breaker
+from .selector_registry import get_selector_registry
+from .tracing import Tracer
+from .metrics import LIVE_BROWSERS
+from .records import Job
+
+
+# Site root; override with NAUKRI_BASE_URL or base_url= to point at a replay server
+DEFAULT_BASE_URL = 'https://www.naukri.com'
+
+# Job card fields extracted through the selector registry
+CARD_FIELDS = [
+    'job_title', 'job_url', 'company_logo', 'company_name', 'rating', 'reviews',
+    'experience', 'salary', 'location', 'job_description', 'tags', 'job_post_date'
+]
+
+# Container XPath that matched last, per page layout (job / internship)
+_container_variant_by_layout = {}
+
+
+# Resolved chromedriver path, shared by every scraper in the process
+_chromedriver_path = None
+_chromedriver_lock = threading.Lock()
+
+
+def resolve_chromedriver():
+    """
+    Return the path of the chromedriver executable, installing it on first use
+
+    The path is resolved once per process; later browsers reuse it instead of
+    clearing the webdriver-manager cache and downloading again.
+    """
+    global _chromedriver_path
+    with _chromedriver_lock:
+        if _chromedriver_path and os.path.exists(_chromedriver_path):
+            return _chromedriver_path
+        _chromedriver_path = _install_chromedriver()
+        return _chromedriver_path
+
+
+def _install_chromedriver():
+    """Install chromedriver with webdriver-manager and locate the executable"""
+    # Clear cache and get fresh driver (once per process, see resolve_chromedriver)
+    driver_cache_path = os.path.expanduser('~/.wdm/drivers/chromedriver')
+    if os.path.exists(driver_cache_path):
+        try:
+            shutil.rmtree(driver_cache_path)
+        except Exception as e:
+            pass
+    
+    # Install ChromeDriver
+    initial_path = ChromeDriverManager().install()
+    
+    # ChromeDriverManager sometimes returns wrong file (like THIRD_PARTY_NOTICES.chromedriver)
+    # Always search for the actual chromedriver executable
+    driver_dir = os.path.dirname(initial_path)
+    driver_path = None
+    
+    # Helper function to check if a path is the actual chromedriver executable
+    def is_valid_chromedriver(path):
+        if not os.path.exists(path):
+            return False
+        # Check if it's a text file (wrong file)
+        if 'THIRD_PARTY' in path or 'LICENSE' in path or 'NOTICES' in path:
+            return False
+        # Check file size (chromedriver is > 10MB, text files are < 1MB)
+        try:
+            size = os.path.getsize(path)
+            if size < 1000000:  # Less than 1MB is likely not the executable
+                return False
+            # Check if it's actually a binary file (not a text file)
+            with open(path, 'rb') as f:
+                first_bytes = f.read(4)
+                # Text files start with readable ASCII, binaries don't
+                if first_bytes.startswith(b'#!/') or first_bytes.startswith(b'# '):
+                    # Could be a shell script, check more
+                    if b'THIRD_PARTY' in f.read(100):
+                        return False
+            return os.path.isfile(path)
+        except:
+            return False
+    
+    # First, check if the returned path is correct
+    if is_valid_chromedriver(initial_path):
+        driver_path = initial_path
+    else:
+        # Search in the same directory as the returned path
+        same_dir_path = os.path.join(driver_dir, 'chromedriver')
+        if is_valid_chromedriver(same_dir_path):
+            driver_path = same_dir_path
+        else:
+            # Search in subdirectories (common on macOS ARM64)
+            if os.path.exists(driver_dir):
+                # Check immediate subdirectories first
+                for item in os.listdir(driver_dir):
+                    item_path = os.path.join(driver_dir, item)
+                    if os.path.isdir(item_path):
+                        # Check for chromedriver in this subdirectory
+                        chromedriver_path = os.path.join(item_path, 'chromedriver')
+                        if is_valid_chromedriver(chromedriver_path):
+                            driver_path = chromedriver_path
+                            break
+                        # Also check nested subdirectories (macOS ARM64 structure)
+                        for subitem in os.listdir(item_path):
+                            subitem_path = os.path.join(item_path, subitem)
+                            if os.path.isdir(subitem_path):
+                                nested_chromedriver = os.path.join(subitem_path, 'chromedriver')
+                                if is_valid_chromedriver(nested_chromedriver):
+                                    driver_path = nested_chromedriver
+                                    break
+                            elif subitem == 'chromedriver':
+                                if is_valid_chromedriver(subitem_path):
+                                    driver_path = subitem_path
+                                    break
+                        if driver_path:
+                            break
+            
+            # If still not found, do recursive search
+            if not driver_path and os.path.exists(driver_cache_path):
+                def find_chromedriver_recursive(directory):
+                    for root, dirs, files in os.walk(directory):
+                        for file in files:
+                            if file == 'chromedriver' and 'THIRD_PARTY' not in root and 'LICENSE' not in root:
+                                full_path = os.path.join(root, file)
+                                if is_valid_chromedriver(full_path):
+                                    return full_path
+                    return None
+                
+                driver_path = find_chromedriver_recursive(driver_cache_path)
+    
+    if not driver_path:
+        raise Exception(f"Could not find valid chromedriver executable. Searched in: {driver_dir}")
+    
+    # Verify the driver path exists and make it executable if needed
+    if not os.path.exists(driver_path):
+        raise Exception(f"ChromeDriver not found at {driver_path}")
+    
+    # Ensure it's executable
+    if not os.access(driver_path, os.X_OK):
+        try:
+            os.chmod(driver_path, 0o755)
+        except Exception as e:
+            pass
+    
+    return driver_path
 
 
 class NaukriScraper:
     """Scraper for naukri.com job listings"""
     
-    def __init__(self, headless=True):
-        """Initialize the scraper with Chrome WebDriver"""
+    def __init__(self, headless=True, base_url=None, browser=True, tracer=None, debugging_port=None):
+        """
+        Initialize the scraper with Chrome WebDriver
+        
+        Args:
+            headless: Whether to run browser in headless mode
+            base_url: Site root to scrape instead of https://www.naukri.com
+                (e.g. a local replay server); defaults to NAUKRI_BASE_URL
+            browser: Whether to launch Chrome. Without a browser only the API
+                and HTML parsing methods can be used.
+            tracer: Tracer collecting per-stage timings (a new one by default)
+            debugging_port: Chrome remote debugging port; defaults to
+                NAUKRI_DEBUGGING_PORT or 0 (a free port), so several browsers
+                can run side by side
+        """
+        self.base_url = (base_url or os.getenv('NAUKRI_BASE_URL') or DEFAULT_BASE_URL).rstrip('/')
+        self.headless = headless
+        self.driver = None
+        self.wait = None
+        self.tracer = tracer or Tracer()
+        if debugging_port is None:
+            debugging_port = int(os.getenv('NAUKRI_DEBUGGING_PORT', '0'))
+        self.debugging_port = debugging_port
+        
+        if browser:
+            with self.tracer.span('driver_init'):
+                self._start_browser(headless)
+    
+    def _start_browser(self, headless):
+        """Launch Chrome and attach the WebDriver"""
         chrome_options = Options()
         if headless:
             chrome_options.add_argument('--headless')
@@ -31,118 +206,18 @@ class NaukriScraper:
         chrome_options.add_argument('--disable-dev-shm-usage')
         chrome_options.add_argument('--disable-blink-features=AutomationControlled')
         chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--remote-debugging-port=9222')
+        chrome_options.add_argument(f'--remote-debugging-port={self.debugging_port}')
         chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
         
         # Initialize ChromeDriver with better error handling
         try:
-            # Clear cache and get fresh driver
-            driver_cache_path = os.path.expanduser('~/.wdm/drivers/chromedriver')
-            if os.path.exists(driver_cache_path):
-                try:
-                    shutil.rmtree(driver_cache_path)
-                except Exception as e:
-                    pass
-            
-            # Install ChromeDriver
-            initial_path = ChromeDriverManager().install()
-            
-            # ChromeDriverManager sometimes returns wrong file (like THIRD_PARTY_NOTICES.chromedriver)
-            # Always search for the actual chromedriver executable
-            driver_dir = os.path.dirname(initial_path)
-            driver_path = None
-            
-            # Helper function to check if a path is the actual chromedriver executable
-            def is_valid_chromedriver(path):
-                if not os.path.exists(path):
-                    return False
-                # Check if it's a text file (wrong file)
-                if 'THIRD_PARTY' in path or 'LICENSE' in path or 'NOTICES' in path:
-                    return False
-                # Check file size (chromedriver is > 10MB, text files are < 1MB)
-                try:
-                    size = os.path.getsize(path)
-                    if size < 1000000:  # Less than 1MB is likely not the executable
-                        return False
-                    # Check if it's actually a binary file (not a text file)
-                    with open(path, 'rb') as f:
-                        first_bytes = f.read(4)
-                        # Text files start with readable ASCII, binaries don't
-                        if first_bytes.startswith(b'#!/') or first_bytes.startswith(b'# '):
-                            # Could be a shell script, check more
-                            if b'THIRD_PARTY' in f.read(100):
-                                return False
-                    return os.path.isfile(path)
-                except:
-                    return False
-            
-            # First, check if the returned path is correct
-            if is_valid_chromedriver(initial_path):
-                driver_path = initial_path
-            else:
-                # Search in the same directory as the returned path
-                same_dir_path = os.path.join(driver_dir, 'chromedriver')
-                if is_valid_chromedriver(same_dir_path):
-                    driver_path = same_dir_path
-                else:
-                    # Search in subdirectories (common on macOS ARM64)
-                    if os.path.exists(driver_dir):
-                        # Check immediate subdirectories first
-                        for item in os.listdir(driver_dir):
-                            item_path = os.path.join(driver_dir, item)
-                            if os.path.isdir(item_path):
-                                # Check for chromedriver in this subdirectory
-                                chromedriver_path = os.path.join(item_path, 'chromedriver')
-                                if is_valid_chromedriver(chromedriver_path):
-                                    driver_path = chromedriver_path
-                                    break
-                                # Also check nested subdirectories (macOS ARM64 structure)
-                                for subitem in os.listdir(item_path):
-                                    subitem_path = os.path.join(item_path, subitem)
-                                    if os.path.isdir(subitem_path):
-                                        nested_chromedriver = os.path.join(subitem_path, 'chromedriver')
-                                        if is_valid_chromedriver(nested_chromedriver):
-                                            driver_path = nested_chromedriver
-                                            break
-                                    elif subitem == 'chromedriver':
-                                        if is_valid_chromedriver(subitem_path):
-                                            driver_path = subitem_path
-                                            break
-                                if driver_path:
-                                    break
-                    
-                    # If still not found, do recursive search
-                    if not driver_path and os.path.exists(driver_cache_path):
-                        def find_chromedriver_recursive(directory):
-                            for root, dirs, files in os.walk(directory):
-                                for file in files:
-                                    if file == 'chromedriver' and 'THIRD_PARTY' not in root and 'LICENSE' not in root:
-                                        full_path = os.path.join(root, file)
-                                        if is_valid_chromedriver(full_path):
-                                            return full_path
-                            return None
-                        
-                        driver_path = find_chromedriver_recursive(driver_cache_path)
-            
-            if not driver_path:
-                raise Exception(f"Could not find valid chromedriver executable. Searched in: {driver_dir}")
-            
-            # Verify the driver path exists and make it executable if needed
-            if not os.path.exists(driver_path):
-                raise Exception(f"ChromeDriver not found at {driver_path}")
-            
-            # Ensure it's executable
-            if not os.access(driver_path, os.X_OK):
-                try:
-                    os.chmod(driver_path, 0o755)
-                except Exception as e:
-                    pass
+            driver_path = resolve_chromedriver()
             
             # Add additional Chrome options to help with connection issues
             chrome_options.add_argument('--no-sandbox')
             chrome_options.add_argument('--disable-dev-shm-usage')
             chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('--remote-debugging-port=9222')
+            chrome_options.add_argument(f'--remote-debugging-port={self.debugging_port}')
             
             service = Service(driver_path)
             try:
@@ -155,6 +230,7 @@ class NaukriScraper:
                     self.driver = webdriver.Chrome(service=service, options=chrome_options)
                 else:
                     raise
+            LIVE_BROWSERS.inc()
             self.driver.set_page_load_timeout(30)  # 30 second timeout
             self.wait = WebDriverWait(self.driver, 20)
             
@@ -163,6 +239,135 @@ class NaukriScraper:
             traceback.print_exc()
             raise Exception(f"Failed to initialize ChromeDriver. Make sure Chrome browser is installed. Error: {str(e)}")
     
+    def _navigate(self, url):
+        """
+        Load a page in the browser through the shared per-host rate limiter
+        
+        Args:
+            url: Page URL to load
+        
+        Returns:
+            True if the loaded page looks like a captcha or empty page
+        """
+        limiter = get_rate_limiter(url)
+        limiter.acquire()
+        start = time.monotonic()
+        blocked = False
+        loaded = False
+        try:
+            with self.tracer.span('navigation'):
+                self.driver.get(url)
+            loaded = True
+            try:
+                visible_text = self.driver.execute_script(
+                    "return document.body ? (document.body.innerText || '').slice(0, 5000) : '';"
+                )
+                blocked = looks_blocked(visible_text)
+            except:
+                pass
+        finally:
+            limiter.record(latency=time.monotonic() - start, blocked=blocked, failed=not loaded)
+        return blocked
+    
+    def _http_get(self, session, url, **kwargs):
+        """
+        Send a GET request through the shared per-host rate limiter
+        
+        Args:
+            session: requests.Session to send the request with
+            url: Request URL
+            **kwargs: Extra arguments passed to session.get
+        
+        Returns:
+            requests.Response object
+        """
+        limiter = get_rate_limiter(url)
+        limiter.acquire()
+        start = time.monotonic()
+        response = None
+        try:
+            response = session.get(url, **kwargs)
+            return response
+        finally:
+            if response is None:
+                limiter.record(latency=time.monotonic() - start, failed=True)
+            else:
+                blocked = False
+                if response.status_code == 200:
+                    content_type = response.headers.get('content-type', '')
+                    blocked = 'json' not in content_type and looks_blocked(response.text)
+                limiter.record(
+                    status_code=response.status_code,
+                    latency=time.monotonic() - start,
+                    blocked=blocked,
+                    retry_after=response.headers.get('retry-after')
+                )
+    
+    def _wait_for_container(self, layout, timeout=5):
+        """
+        Wait for any of the job cards container variants to appear
+        
+        All variants are combined into a single XPath union so a miss costs one
+        timeout instead of one per variant. The variant that matched is
+        remembered per layout and checked first on later requests.
+        
+        Args:
+            layout: Page layout key ('job' or 'internship')
+            timeout: Seconds to wait for the container
+        
+        Returns:
+            The XPath of the matching container variant, or None on timeout
+        """
+        registry = get_selector_registry()
+        candidates = registry.variants('search_container')
+        preferred = _container_variant_by_layout.get(layout)
+        if preferred in candidates:
+            candidates.remove(preferred)
+            candidates.insert(0, preferred)
+        
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.2).until(
+                EC.presence_of_element_located((By.XPATH, ' | '.join(candidates)))
+            )
+        except:
+            registry.record_field('search_container', False)
+            return None
+        
+        variant, _ = registry.resolve(
+            'search_container',
+            lambda xpath: bool(self.driver.find_elements(By.XPATH, xpath)),
+            variants=candidates
+        )
+        if variant:
+            _container_variant_by_layout[layout] = variant
+        return variant
+    
+    def _api_fallback(self, metadata, job_type, keyword, location, experience, max_jobs, page):
+        """
+        Fill metadata from the API path after browser scraping failed
+        
+        Returns:
+            List of jobs from the API, or None if the API returned nothing
+        """
+        api_jobs, api_metadata = self.scrape_jobs_via_api(job_type, keyword, location, experience, max_jobs, page)
+        if api_jobs and len(api_jobs) > 0:
+            metadata['source'] = 'api_fallback'
+            metadata['debug_info']['api_fallback_used'] = True
+            metadata['debug_info'].update(api_metadata.get('debug_info', {}))
+            return api_jobs
+        return None
+    
+    def rebase_url(self, url):
+        """
+        Point an absolute naukri.com URL at the configured base URL
+        
+        Lets detail URLs collected from live results be replayed against a
+        local server. URLs are returned unchanged when no override is set.
+        """
+        if self.base_url != DEFAULT_BASE_URL and url.startswith(DEFAULT_BASE_URL):
+            return self.base_url + url[len(DEFAULT_BASE_URL):]
+        return url
+    
     def build_url(self, job_type, keyword, location, experience=None):
         """
         Build Naukri.com search URL from parameters
@@ -182,9 +387,9 @@ class NaukriScraper:
         
         # Build base URL - correct format for internships
         if job_type.lower() == 'internship':
-            base_url = f"https://www.naukri.com/{keyword_formatted}-internship-jobs-in-{location_formatted}"
+            search_url = f"{self.base_url}/{keyword_formatted}-internship-jobs-in-{location_formatted}"
         else:
-            base_url = f"https://www.naukri.com/{keyword_formatted}-jobs-in-{location_formatted}"
+            search_url = f"{self.base_url}/{keyword_formatted}-jobs-in-{location_formatted}"
         
         # Add query parameters
         params = {
@@ -202,7 +407,7 @@ class NaukriScraper:
             params['naukriCampus'] = 'true'
         
         query_string = urllib.parse.urlencode(params)
-        full_url = f"{base_url}?{query_string}"
+        full_url = f"{search_url}?{query_string}"
         
         return full_url
     
@@ -219,7 +424,44 @@ class NaukriScraper:
             page: Page number for pagination (default: 1)
         
         Returns:
-            Tuple of (list of job dictionaries, metadata dict with 'source' and 'debug_info')
+            Tuple of (list of Job records, metadata dict with 'source' and 'debug_info')
+        """
+        browser_breaker = get_circuit_breaker('browser')
+        
+        if not browser_breaker.allow_request():
+            # Browser scraping keeps failing (e.g. DOM changed) - go straight to the API
+            jobs, metadata = self.scrape_jobs_via_api(job_type, keyword, location, experience, max_jobs, page)
+            metadata['debug_info']['scraping_attempted'] = False
+            metadata['debug_info']['circuit_breaker'] = browser_breaker.snapshot()
+            metadata['debug_info']['timings'] = self.tracer.as_dict()
+            return jobs, metadata
+        
+        try:
+            jobs, metadata = self._scrape_jobs_with_browser(job_type, keyword, location, experience, max_jobs, page)
+        except:
+            browser_breaker.record_failure()
+            raise
+        
+        debug_info = metadata['debug_info']
+        if debug_info.get('scraping_success'):
+            browser_breaker.record_success()
+        elif debug_info.get('api_fallback_used'):
+            browser_breaker.record_failure()
+        else:
+            # Neither strategy found jobs - most likely the query has no results
+            browser_breaker.release()
+        debug_info['circuit_breaker'] = browser_breaker.snapshot()
+        debug_info['api_circuit_breaker'] = get_circuit_breaker('api').snapshot()
+        debug_info['timings'] = self.tracer.as_dict()
+        
+        return jobs, metadata
+    
+    def _scrape_jobs_with_browser(self, job_type, keyword, location, experience, max_jobs, page):
+        """
+        Scrape a search page with the browser, falling back to the API
+        
+        Returns:
+            Tuple of (list of Job records, metadata dict with 'source' and 'debug_info')
         """
         # For web scraping, append page number to URL if page > 1
         if page > 1:
@@ -239,110 +481,71 @@ class NaukriScraper:
         }
         
         try:
-            self.driver.get(url)
+            if self._navigate(url):
+                metadata['debug_info']['scraping_errors'].append("Search page looks blocked (captcha or empty page)")
+                api_jobs = self._api_fallback(metadata, job_type, keyword, location, experience, max_jobs, page)
+                if api_jobs:
+                    return api_jobs, metadata
+                return [], metadata
+            
             # Reduced initial wait time - wait for specific element instead
-            time.sleep(2)  # Reduced from 5 seconds
+            with self.tracer.span('navigation'):
+                time.sleep(2)  # Reduced from 5 seconds
             
             # Handle popups or modals if they appear (non-blocking)
-            try:
-                popup_selectors = [
-                    "//button[contains(text(), 'Close')]",
-                    "//button[contains(text(), 'Skip')]",
-                    "//span[contains(@class, 'close')]",
-                    "//div[contains(@class, 'closeIcon')]"
-                ]
-                for selector in popup_selectors:
-                    try:
-                        popup = self.driver.find_element(By.XPATH, selector)
-                        if popup and popup.is_displayed():
-                            popup.click()
-                            time.sleep(0.5)
-                            break
-                    except:
-                        continue
-            except:
-                pass  # No popup found
-            
-            # Wait for job cards container to load with reduced timeout
-            container_xpaths = [
-                "/html/body/div[1]/div/main/div[1]/div[2]/div[2]/div/div[1]",
-                "//div[contains(@class, 'srp-jobtuple-wrapper')]",
-                "//div[contains(@class, 'jobTuple')]"
-            ]
-            
-            container_found = False
-            short_wait = WebDriverWait(self.driver, 5)  # Reduced from 20 seconds
-            for xpath in container_xpaths:
+            with self.tracer.span('popup_handling'):
                 try:
-                    short_wait.until(
-                        EC.presence_of_element_located((By.XPATH, xpath))
-                    )
-                    container_found = True
-                    break
+                    popup_selectors = [
+                        "//button[contains(text(), 'Close')]",
+                        "//button[contains(text(), 'Skip')]",
+                        "//span[contains(@class, 'close')]",
+                        "//div[contains(@class, 'closeIcon')]"
+                    ]
+                    for selector in popup_selectors:
+                        try:
+                            popup = self.driver.find_element(By.XPATH, selector)
+                            if popup and popup.is_displayed():
+                                popup.click()
+                                time.sleep(0.5)
+                                break
+                        except:
+                            continue
                 except:
-                    continue
+                    pass  # No popup found
+            
+            # Wait once for whichever job cards container variant appears first
+            with self.tracer.span('container_wait'):
+                container_variant = self._wait_for_container(layout=job_type.lower())
+            container_found = container_variant is not None
+            metadata['debug_info']['container_variant'] = container_variant
             
             if not container_found:
                 error_msg = "Job cards container not found - scraping failed"
                 metadata['debug_info']['scraping_errors'].append(error_msg)
                 # Try API fallback
-                api_jobs, api_metadata = self.scrape_jobs_via_api(job_type, keyword, location, experience, max_jobs)
-                if api_jobs and len(api_jobs) > 0:
-                    metadata['source'] = 'api_fallback'
-                    metadata['debug_info']['api_fallback_used'] = True
-                    metadata['debug_info'].update(api_metadata.get('debug_info', {}))
+                api_jobs = self._api_fallback(metadata, job_type, keyword, location, experience, max_jobs, page)
+                if api_jobs:
                     return api_jobs, metadata
                 return [], metadata
             
             # Quick scroll to load content (no wait needed)
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)  # Reduced from 3 seconds
-            
-            jobs = []
-            card_index = 1
+            with self.tracer.span('scroll'):
+                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                time.sleep(1)  # Reduced from 3 seconds
             
-            # Extract job cards using the provided XPath structure
-            while len(jobs) < max_jobs:
-                card_xpath = f"/html/body/div[1]/div/main/div[1]/div[2]/div[2]/div/div[1]/div[{card_index}]"
-                
-                try:
-                    card_element = self.driver.find_element(By.XPATH, card_xpath)
-                    
-                    job_data = self._extract_job_data(card_element, card_index)
-                    
-                    if job_data and job_data.get('job_title'):  # Only add if we got valid data
-                        jobs.append(job_data)
-                    
-                    card_index += 1
-                except Exception as e:
-                    # Try alternative XPath or move to next
-                    try:
-                        alt_xpath = f"/html/body/div[1]/div/main/div[1]/div[2]/div[2]/div/div[{card_index}]/div"
-                        card_element = self.driver.find_element(By.XPATH, alt_xpath)
-                        job_data = self._extract_job_data(card_element, card_index)
-                        if job_data and job_data.get('job_title'):
-                            jobs.append(job_data)
-                        card_index += 1
-                    except:
-                        # No more cards found
-                        if card_index > 10:  # Safety check
-                            break
-                        card_index += 1
-                        if card_index > 50:  # Safety limit
-                            break
+            with self.tracer.span('extraction'):
+                jobs = self._extract_job_cards(max_jobs)
             
             # Mark scraping as successful if we got jobs
             if len(jobs) > 0:
                 metadata['debug_info']['scraping_success'] = True
+                metadata['debug_info']['rate_limit'] = get_rate_limiter(url).snapshot()
                 return jobs, metadata
             
             # If scraping returned no jobs, try API fallback
             metadata['debug_info']['scraping_errors'].append("No jobs found in scraping results")
-            api_jobs, api_metadata = self.scrape_jobs_via_api(job_type, keyword, location, experience, max_jobs, page)
-            if api_jobs and len(api_jobs) > 0:
-                metadata['source'] = 'api_fallback'
-                metadata['debug_info']['api_fallback_used'] = True
-                metadata['debug_info'].update(api_metadata.get('debug_info', {}))
+            api_jobs = self._api_fallback(metadata, job_type, keyword, location, experience, max_jobs, page)
+            if api_jobs:
                 return api_jobs, metadata
             return jobs, metadata
             
@@ -354,11 +557,8 @@ class NaukriScraper:
             
             # Try API as fallback even on error
             try:
-                api_jobs, api_metadata = self.scrape_jobs_via_api(job_type, keyword, location, experience, max_jobs, page)
-                if api_jobs and len(api_jobs) > 0:
-                    metadata['source'] = 'api_fallback'
-                    metadata['debug_info']['api_fallback_used'] = True
-                    metadata['debug_info'].update(api_metadata.get('debug_info', {}))
+                api_jobs = self._api_fallback(metadata, job_type, keyword, location, experience, max_jobs, page)
+                if api_jobs:
                     return api_jobs, metadata
             except Exception as api_error:
                 api_error_msg = f"API fallback also failed: {str(api_error)}"
@@ -366,6 +566,49 @@ class NaukriScraper:
             
             return [], metadata
     
+    def _extract_job_cards(self, max_jobs):
+        """
+        Extract job cards from the search results page currently loaded
+        
+        Args:
+            max_jobs: Maximum number of jobs to extract
+        
+        Returns:
+            List of Job records
+        """
+        jobs = []
+        card_index = 1
+        found_card = False
+        registry = get_selector_registry()
+        
+        # Extract job cards using the card XPath variants from the registry
+        while len(jobs) < max_jobs and card_index <= 50:  # Safety limit
+            # The lookup past the last card always misses, so only a page
+            # without any card counts as a failure (below)
+            _, card_element = registry.resolve(
+                'search_card',
+                lambda xpath: next(iter(self.driver.find_elements(By.XPATH, xpath.format(index=card_index))), None),
+                optional=True
+            )
+            
+            if card_element is None:
+                # No more cards found
+                if card_index > 10:  # Safety check
+                    break
+                card_index += 1
+                continue
+            
+            found_card = True
+            job = self._extract_job_data(card_element, card_index)
+            if job.job_title:  # Only add if we got valid data
+                jobs.append(job)
+            card_index += 1
+        
+        if not found_card:
+            registry.record_field('search_card', False)
+        registry.save()
+        return jobs
+    
     def build_api_url(self, job_type, keyword, location, experience=None, page_no=1):
         """
         Build Naukri.com API URL from parameters
@@ -414,7 +657,7 @@ class NaukriScraper:
         params['sid'] = ''.join(random.choices(string.digits, k=16))
         
         query_string = urllib.parse.urlencode(params)
-        api_url = f"https://www.naukri.com/jobapi/v3/search?{query_string}"
+        api_url = f"{self.base_url}/jobapi/v3/search?{query_string}"
         
         return api_url
     
@@ -423,6 +666,9 @@ class NaukriScraper:
         Scrape jobs using Naukri.com API endpoint (fallback method)
         Uses cookies from Selenium session if available
         
+        The request goes through the 'api' circuit breaker: while the API keeps
+        failing (blocked, erroring) it is skipped and no jobs are returned.
+        
         Args:
             job_type: 'job' or 'internship'
             keyword: Job search keyword
@@ -432,7 +678,44 @@ class NaukriScraper:
             page: Page number for pagination (default: 1)
         
         Returns:
-            Tuple of (list of job dictionaries, metadata dict with 'source' and 'debug_info')
+            Tuple of (list of Job records, metadata dict with 'source' and 'debug_info')
+        """
+        api_breaker = get_circuit_breaker('api')
+        
+        if not api_breaker.allow_request():
+            metadata = {
+                'source': 'api',
+                'debug_info': {
+                    'api_attempted': False,
+                    'api_success': False,
+                    'api_errors': ['API circuit breaker is open'],
+                    'current_page': page,
+                    'api_circuit_breaker': api_breaker.snapshot()
+                }
+            }
+            return [], metadata
+        
+        try:
+            jobs, metadata = self._request_jobs_via_api(job_type, keyword, location, experience, max_jobs, page)
+        except:
+            api_breaker.record_failure()
+            raise
+        
+        # An answered request (even without results) means the API works
+        if metadata['debug_info'].get('api_errors'):
+            api_breaker.record_failure()
+        else:
+            api_breaker.record_success()
+        metadata['debug_info']['api_circuit_breaker'] = api_breaker.snapshot()
+        
+        return jobs, metadata
+    
+    def _request_jobs_via_api(self, job_type, keyword, location, experience, max_jobs, page):
+        """
+        Request one page of jobs from the API
+        
+        Returns:
+            Tuple of (list of Job records, metadata dict with 'source' and 'debug_info')
         """
         metadata = {
             'source': 'api',
@@ -477,11 +760,14 @@ class NaukriScraper:
             if cookies:
                 session.cookies.update(cookies)
             
-            response = session.get(api_url, headers=headers, timeout=10)
+            with self.tracer.span('api_request'):
+                response = self._http_get(session, api_url, headers=headers, timeout=10)
             metadata['debug_info']['api_status_code'] = response.status_code
+            metadata['debug_info']['rate_limit'] = get_rate_limiter(api_url).snapshot()
             
             if response.status_code == 200:
-                data = response.json()
+                with self.tracer.span('json_parse'):
+                    data = response.json()
                 no_of_jobs = data.get('noOfJobs', 0)
                 metadata['debug_info']['api_response_jobs_count'] = no_of_jobs
                 metadata['debug_info']['total_jobs_available'] = no_of_jobs
@@ -496,7 +782,8 @@ class NaukriScraper:
                         break
                 
                 if job_data_list:
-                    jobs = self._parse_api_job_data(job_data_list, max_jobs)
+                    with self.tracer.span('extraction'):
+                        jobs = self._parse_api_job_data(job_data_list, max_jobs)
                     if jobs:
                         metadata['debug_info']['api_success'] = True
                         return jobs, metadata
@@ -509,7 +796,8 @@ class NaukriScraper:
                             if isinstance(value, list) and len(value) > 0:
                                 # Check if first item looks like job data
                                 if isinstance(value[0], dict) and ('title' in value[0] or 'jobTitle' in value[0]):
-                                    jobs = self._parse_api_job_data(value, max_jobs)
+                                    with self.tracer.span('extraction'):
+                                        jobs = self._parse_api_job_data(value, max_jobs)
                                     if jobs:
                                         metadata['debug_info']['api_success'] = True
                                         return jobs, metadata
@@ -536,62 +824,57 @@ class NaukriScraper:
             max_jobs: Maximum number of jobs to return
         
         Returns:
-            List of job dictionaries in our format
+            List of Job records
         """
         jobs = []
         
         for job_detail in job_details_list[:max_jobs]:
             try:
-                job_data = {
-                    'job_title': '',
-                    'company_name': '',
-                    'company_logo': '',
-                    'rating': '',
-                    'reviews': '',
-                    'experience': '',
-                    'salary': '',
-                    'location': '',
-                    'job_description': '',
-                    'tags': [],
-                    'job_post_date': '',
-                    'job_url': ''
-                }
+                job = Job()
                 
                 # Extract job title
                 if 'title' in job_detail:
-                    job_data['job_title'] = job_detail['title']
+                    job.job_title = job_detail['title']
                 elif 'jobTitle' in job_detail:
-                    job_data['job_title'] = job_detail['jobTitle']
+                    job.job_title = job_detail['jobTitle']
                 
                 # Extract company name
                 if 'companyName' in job_detail:
-                    job_data['company_name'] = job_detail['companyName']
+                    job.company_name = job_detail['companyName']
                 elif 'company' in job_detail and isinstance(job_detail['company'], dict):
-                    job_data['company_name'] = job_detail['company'].get('name', '')
+                    job.company_name = job_detail['company'].get('name', '')
                 
                 # Extract company logo
                 if 'companyLogo' in job_detail:
-                    job_data['company_logo'] = job_detail['companyLogo']
+                    job.company_logo = job_detail['companyLogo']
                 elif 'company' in job_detail and isinstance(job_detail['company'], dict):
-                    job_data['company_logo'] = job_detail['company'].get('logo', '')
+                    job.company_logo = job_detail['company'].get('logo', '')
                 
-                # Extract location
+                # Extract location, experience and salary from the typed
+                # placeholders (untyped labels are taken as places)
                 if 'placeholders' in job_detail and isinstance(job_detail['placeholders'], list):
                     location_parts = []
                     for placeholder in job_detail['placeholders']:
-                        if isinstance(placeholder, dict) and 'label' in placeholder:
+                        if not isinstance(placeholder, dict) or not placeholder.get('label'):
+                            continue
+                        placeholder_type = placeholder.get('type', 'location')
+                        if placeholder_type == 'experience':
+                            job.experience = placeholder['label']
+                        elif placeholder_type == 'salary':
+                            job.salary = placeholder['label']
+                        elif placeholder_type == 'location':
                             location_parts.append(placeholder['label'])
                     if location_parts:
-                        job_data['location'] = ', '.join(location_parts)
+                        job.location = ', '.join(location_parts)
                 
                 # Extract experience
                 if 'workExp' in job_detail and isinstance(job_detail['workExp'], dict):
                     min_exp = job_detail['workExp'].get('minExp', '')
                     max_exp = job_detail['workExp'].get('maxExp', '')
                     if min_exp and max_exp:
-                        job_data['experience'] = f"{min_exp}-{max_exp} Yrs"
+                        job.experience = f"{min_exp}-{max_exp} Yrs"
                     elif min_exp:
-                        job_data['experience'] = f"{min_exp}+ Yrs"
+                        job.experience = f"{min_exp}+ Yrs"
                 
                 # Extract salary
                 if 'salaryDetail' in job_detail:
@@ -599,49 +882,49 @@ class NaukriScraper:
                     if isinstance(salary_detail, dict):
                         salary_label = salary_detail.get('label', '')
                         if salary_label:
-                            job_data['salary'] = salary_label
+                            job.salary = salary_label
                 
                 # Extract job description
                 if 'description' in job_detail:
                     desc = job_detail['description']
                     if isinstance(desc, str):
-                        job_data['job_description'] = desc[:500]  # Limit description length
+                        job.job_description = desc[:500]  # Limit description length
                 
                 # Extract tags/skills
                 if 'tagsAndSkills' in job_detail:
                     tags = job_detail['tagsAndSkills']
                     if isinstance(tags, list):
-                        job_data['tags'] = [tag.get('label', tag) if isinstance(tag, dict) else str(tag) for tag in tags[:5]]
+                        job.tags = [tag.get('label', tag) if isinstance(tag, dict) else str(tag) for tag in tags[:5]]
                 
                 # Extract job post date
                 if 'createdDate' in job_detail:
-                    job_data['job_post_date'] = job_detail['createdDate']
+                    job.job_post_date = job_detail['createdDate']
                 elif 'postedDate' in job_detail:
-                    job_data['job_post_date'] = job_detail['postedDate']
+                    job.job_post_date = job_detail['postedDate']
                 
                 # Extract job URL
                 if 'jobUrl' in job_detail:
                     job_url = job_detail['jobUrl']
                     if job_url:
                         if job_url.startswith('/'):
-                            job_url = f"https://www.naukri.com{job_url}"
-                        job_data['job_url'] = job_url
+                            job_url = f"{self.base_url}{job_url}"
+                        job.job_url = job_url
                 elif 'applyUrl' in job_detail:
                     job_url = job_detail['applyUrl']
                     if job_url:
                         if job_url.startswith('/'):
-                            job_url = f"https://www.naukri.com{job_url}"
-                        job_data['job_url'] = job_url
+                            job_url = f"{self.base_url}{job_url}"
+                        job.job_url = job_url
                 elif 'jdURL' in job_detail:
                     job_url = job_detail['jdURL']
                     if job_url:
                         if job_url.startswith('/'):
-                            job_url = f"https://www.naukri.com{job_url}"
-                        job_data['job_url'] = job_url
+                            job_url = f"{self.base_url}{job_url}"
+                        job.job_url = job_url
                 
                 # Only add if we have at least a job title
-                if job_data['job_title']:
-                    jobs.append(job_data)
+                if job.job_title:
+                    jobs.append(job)
                     
             except Exception as e:
                 pass
@@ -650,194 +933,62 @@ class NaukriScraper:
         return jobs
     
     def _extract_job_data(self, card_element, card_index):
-        """Extract data from a single job card element"""
-        job_data = {
-            'job_title': '',
-            'company_name': '',
-            'company_logo': '',
-            'rating': '',
-            'reviews': '',
-            'experience': '',
-            'salary': '',
-            'location': '',
-            'job_description': '',
-            'tags': [],
-            'job_post_date': '',
-            'job_url': ''
-        }
+        """Extract data from a single job card element into a Job record"""
+        job = Job()
         
-        try:
-            # Row 1: Job title, company name, company logo
-            try:
-                title_element = card_element.find_element(By.XPATH, ".//div[1]/h2")
-                job_data['job_title'] = title_element.text.strip()
-                # Try to get job URL from title link
-                try:
-                    title_link = title_element.find_element(By.XPATH, ".//a")
-                    job_url = title_link.get_attribute('href')
-                    if job_url:
-                        # Convert relative URLs to absolute
-                        if job_url.startswith('/'):
-                            job_url = f"https://www.naukri.com{job_url}"
-                        job_data['job_url'] = job_url
-                except:
-                    pass
-            except:
-                # Try alternative
-                try:
-                    title_element = card_element.find_element(By.XPATH, ".//h2")
-                    job_data['job_title'] = title_element.text.strip()
-                    # Try to get job URL from title link
-                    try:
-                        title_link = title_element.find_element(By.XPATH, ".//a")
-                        job_url = title_link.get_attribute('href')
-                        if job_url:
-                            if job_url.startswith('/'):
-                                job_url = f"https://www.naukri.com{job_url}"
-                            job_data['job_url'] = job_url
-                    except:
-                        pass
-                except:
-                    pass
-            
-            # Also try to get URL from card wrapper or any link in the card
-            if not job_data.get('job_url'):
-                try:
-                    # Try to find any link that looks like a job detail link
-                    card_link = card_element.find_element(By.XPATH, ".//a[contains(@href, 'job-listings') or contains(@href, '/jobs/')]")
-                    job_url = card_link.get_attribute('href')
-                    if job_url:
-                        if job_url.startswith('/'):
-                            job_url = f"https://www.naukri.com{job_url}"
-                        job_data['job_url'] = job_url
-                except:
-                    pass
-            
-            try:
-                logo_element = card_element.find_element(By.XPATH, ".//div[1]/span/img")
-                job_data['company_logo'] = logo_element.get_attribute('src') or ''
-            except:
-                # Try alternative
-                try:
-                    logo_element = card_element.find_element(By.XPATH, ".//span/img")
-                    job_data['company_logo'] = logo_element.get_attribute('src') or ''
-                except:
-                    pass
-            
-            try:
-                # Company name is in div[2]/span/a[1] according to XPath structure
-                company_link = card_element.find_element(By.XPATH, ".//div[2]/span/a[1]")
-                job_data['company_name'] = company_link.text.strip()
-            except:
-                # Try alternative locations
-                try:
-                    company_link = card_element.find_element(By.XPATH, ".//div[1]/span/a[1]")
-                    job_data['company_name'] = company_link.text.strip()
-                except:
-                    try:
-                        # Try getting from span text
-                        company_span = card_element.find_element(By.XPATH, ".//div[1]/span")
-                        company_text = company_span.text.strip()
-                        lines = [line.strip() for line in company_text.split('\n') if line.strip()]
-                        if lines:
-                            job_data['company_name'] = lines[0]
-                    except:
-                        pass
-            
-            # Row 2: Rating and reviews
-            try:
-                rating_element = card_element.find_element(By.XPATH, ".//div[2]/span/a[2]/span[2]")
-                job_data['rating'] = rating_element.text.strip()
-            except:
-                # Try alternative paths
-                try:
-                    rating_element = card_element.find_element(By.XPATH, ".//span[contains(@class, 'rating') or contains(text(), '.')]")
-                    job_data['rating'] = rating_element.text.strip()
-                except:
-                    pass
-            
-            try:
-                reviews_element = card_element.find_element(By.XPATH, ".//div[2]/span/a[3]")
-                job_data['reviews'] = reviews_element.text.strip()
-            except:
-                pass
-            
-            # Row 3: Experience, Salary, Location
-            try:
-                exp_element = card_element.find_element(By.XPATH, ".//div[3]/div/span[1]/span/span")
-                job_data['experience'] = exp_element.text.strip()
-            except:
-                # Try alternative
-                try:
-                    exp_element = card_element.find_element(By.XPATH, ".//span[contains(text(), 'Yrs') or contains(text(), 'Experience')]")
-                    job_data['experience'] = exp_element.text.strip()
-                except:
-                    pass
-            
-            try:
-                salary_element = card_element.find_element(By.XPATH, ".//div[3]/div/span[2]/span/span")
-                job_data['salary'] = salary_element.text.strip()
-            except:
-                # Try alternative
-                try:
-                    salary_element = card_element.find_element(By.XPATH, ".//span[contains(text(), 'Lakhs') or contains(text(), 'LPA')]")
-                    job_data['salary'] = salary_element.text.strip()
-                except:
-                    pass
-            
-            try:
-                loc_element = card_element.find_element(By.XPATH, ".//div[3]/div/span[3]/span/span")
-                job_data['location'] = loc_element.text.strip()
-            except:
-                # Try alternative
-                try:
-                    loc_element = card_element.find_element(By.XPATH, ".//span[contains(@class, 'loc') or contains(text(), 'Location')]")
-                    job_data['location'] = loc_element.text.strip()
-                except:
-                    pass
-            
-            # Row 4: Job description
-            try:
-                desc_element = card_element.find_element(By.XPATH, ".//div[4]/span")
-                job_data['job_description'] = desc_element.text.strip()
-            except:
-                # Try alternative
-                try:
-                    desc_element = card_element.find_element(By.XPATH, ".//span[contains(@class, 'desc') or contains(@class, 'job-desc')]")
-                    job_data['job_description'] = desc_element.text.strip()
-                except:
-                    pass
-            
-            # Row 5: Tags
-            try:
-                tags_list = card_element.find_element(By.XPATH, ".//div[5]/ul")
-                tag_items = tags_list.find_elements(By.TAG_NAME, "li")
-                job_data['tags'] = [tag.text.strip() for tag in tag_items if tag.text.strip()]
-            except:
-                # Try alternative
-                try:
-                    tags_list = card_element.find_element(By.XPATH, ".//ul")
-                    tag_items = tags_list.find_elements(By.TAG_NAME, "li")
-                    job_data['tags'] = [tag.text.strip() for tag in tag_items if tag.text.strip()][:5]  # Limit to 5 tags
-                except:
-                    pass
-            
-            # Row 6: Job post date
+        registry = get_selector_registry()
+        
+        for field in CARD_FIELDS:
+            spec = registry.spec(field)
             try:
-                date_element = card_element.find_element(By.XPATH, ".//div[6]/span[1]")
-                job_data['job_post_date'] = date_element.text.strip()
-            except:
-                # Try alternative
-                try:
-                    date_element = card_element.find_element(By.XPATH, ".//span[contains(text(), 'ago') or contains(text(), 'Posted')]")
-                    job_data['job_post_date'] = date_element.text.strip()
-                except:
-                    pass
-            
-        except Exception as e:
-            pass
+                _, value = registry.resolve(
+                    field,
+                    lambda xpath: self._read_selector(card_element, xpath, spec)
+                )
+            except Exception as e:
+                # Card went stale or the browser dropped - keep what we have
+                break
+            if value:
+                setattr(job, field, value)
+        
+        # Convert relative URLs to absolute
+        if job.job_url.startswith('/'):
+            job.job_url = f"{self.base_url}{job.job_url}"
+        
+        return job
+    
+    def _read_selector(self, element, xpath, spec):
+        """
+        Read the value a selector points at inside an element
+        
+        Args:
+            element: WebElement to search within
+            xpath: Relative XPath of the selector variant
+            spec: Field declaration from the selector registry
+        
+        Returns:
+            String (or list of strings for 'multiple' fields), empty on miss
+        """
+        matches = element.find_elements(By.XPATH, xpath)
+        if not matches:
+            return [] if spec.get('multiple') else ''
+        
+        attribute = spec.get('attribute', 'text')
+        
+        if spec.get('multiple'):
+            values = [match.text.strip() for match in matches]
+            values = [value for value in values if value]
+            limit = spec.get('limit')
+            return values[:limit] if limit else values
+        
+        if attribute == 'text':
+            value = matches[0].text.strip()
+        else:
+            value = (matches[0].get_attribute(attribute) or '').strip()
         
-        return job_data
+        if spec.get('first_line') and value:
+            value = value.split('\n', 1)[0].strip()
+        return value
     
     def scrape_job_details(self, job_url):
         """
@@ -849,7 +1000,32 @@ class NaukriScraper:
         Returns:
             Dictionary with all job detail fields
         """
-        job_details = {
+        try:
+            self._navigate(self.rebase_url(job_url))
+            
+            with self.tracer.span('render_wait'):
+                # Wait for basic page load
+                try:
+                    WebDriverWait(self.driver, 10).until(
+                        lambda driver: driver.execute_script('return document.readyState') == 'complete'
+                    )
+                except:
+                    pass
+            
+                time.sleep(3)  # Allow dynamic content (React/Angular) to render
+            
+            with self.tracer.span('extraction'):
+                return self.parse_job_details(self.driver.page_source)
+        
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+        
+        return self._empty_job_details()
+    
+    def _empty_job_details(self):
+        """Return a job details dictionary with every field empty"""
+        return {
             'header_title': '',
             'company_title': '',
             'company_logo': '',
@@ -883,285 +1059,304 @@ class NaukriScraper:
             'company_info_header': '',
             'company_address': {'label': '', 'address': ''}
         }
+    
+    def parse_job_details(self, page_source):
+        """
+        Parse the HTML of a job detail page
+        
+        Args:
+            page_source: HTML of the job detail page
         
+        Returns:
+            Dictionary with all job detail fields
+        """
+        job_details = self._empty_job_details()
+        
+        # --- USE BEAUTIFULSOUP FOR ROBUST PARSING ---
+        soup = BeautifulSoup(page_source, 'html.parser')
+        
+        # Helper to safely clean text
+        def clean(text):
+            return text.strip() if text else ''
+        
+        # 1. Header Information (Title, Company, Exp, Loc)
         try:
-            self.driver.get(job_url)
+            # Job Title
+            h1 = soup.find('h1')
+            if h1: job_details['header_title'] = clean(h1.get_text())
             
-            # Wait for basic page load
-            try:
-                WebDriverWait(self.driver, 10).until(
-                    lambda driver: driver.execute_script('return document.readyState') == 'complete'
-                )
-            except:
-                pass
+            # Company Name (look for 'company' in class name or first link in header)
+            comp_link = soup.find('a', class_=lambda x: x and 'company' in x.lower())
+            if not comp_link:
+                # Fallback: Look for the rating star's parent/sibling which usually holds the company name
+                rating_star = soup.find('i', class_=lambda x: x and 'naukicon-rating' in x)
+                if rating_star:
+                    comp_link = rating_star.find_parent('a')
+            if comp_link: job_details['company_title'] = clean(comp_link.get_text())
             
-            time.sleep(3)  # Allow dynamic content (React/Angular) to render
+            # Experience (look for calendar/exp icon or text 'years')
+            exp_icon = soup.find('i', class_=lambda x: x and 'experience' in x.lower())
+            if exp_icon and exp_icon.parent:
+                job_details['experience'] = clean(exp_icon.parent.get_text())
             
-            # --- USE BEAUTIFULSOUP FOR ROBUST PARSING ---
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            # Location (look for location icon)
+            loc_icon = soup.find('i', class_=lambda x: x and 'location' in x.lower())
+            if loc_icon and loc_icon.parent:
+                job_details['location'] = clean(loc_icon.parent.get_text())
+                
+            # Salary (look for salary icon)
+            sal_icon = soup.find('i', class_=lambda x: x and 'salary' in x.lower())
+            if sal_icon and sal_icon.parent:
+                job_details['salary'] = clean(sal_icon.parent.get_text())
             
-            # Helper to safely clean text
-            def clean(text):
-                return text.strip() if text else ''
+            # Stats (Posted, Openings, Applicants)
+            # Look for spans containing specific keywords
+            all_spans = soup.find_all('span')
+            for span in all_spans:
+                text = clean(span.get_text()).lower()
+                if 'posted:' in text or 'ago' in text:
+                    # Only keep if it's short (likely a date)
+                    if len(text) < 30: job_details['posted'] = clean(span.get_text())
+                elif 'openings:' in text:
+                    job_details['openings'] = clean(span.get_text().replace('Openings:', ''))
+                elif 'applicants:' in text:
+                    job_details['applicants'] = clean(span.get_text().replace('Applicants:', ''))
+        except Exception as e:
+            pass
+        
+        # 2. Job Description (The most critical part)
+        try:
+            # Priority 1: The standard 'dang-inner-html' class
+            desc_div = soup.find(class_='dang-inner-html')
+            if desc_div:
+                desc_text = clean(desc_div.get_text(separator='\n'))
+            else:
+                # Priority 2: Find header "Job description" and get the container's text
+                # We look for the text strictly to avoid false positives
+                headers = soup.find_all(lambda tag: tag.name in ['h2', 'h3', 'h4', 'div'] and tag.text and 'job description' in tag.text.lower())
+                desc_text = ''
+                for header in headers:
+                    # Ensure it's a visible header, not a hidden script
+                    if header.parent.name != 'script':
+                        # Get the section containing this header
+                        section = header.find_parent('section') or header.find_parent('div', class_=lambda x: x and 'job-desc' in x)
+                        if section:
+                            full_text = clean(section.get_text(separator='\n'))
+                            header_text = clean(header.get_text())
+                            # Strip header from content
+                            if full_text.lower().startswith(header_text.lower()):
+                                desc_text = full_text[len(header_text):].strip()
+                            else:
+                                desc_text = full_text
+                            break
             
-            # 1. Header Information (Title, Company, Exp, Loc)
-            try:
-                # Job Title
-                h1 = soup.find('h1')
-                if h1: job_details['header_title'] = clean(h1.get_text())
-                
-                # Company Name (look for 'company' in class name or first link in header)
-                comp_link = soup.find('a', class_=lambda x: x and 'company' in x.lower())
-                if not comp_link:
-                    # Fallback: Look for the rating star's parent/sibling which usually holds the company name
-                    rating_star = soup.find('i', class_=lambda x: x and 'naukicon-rating' in x)
-                    if rating_star:
-                        comp_link = rating_star.find_parent('a')
-                if comp_link: job_details['company_title'] = clean(comp_link.get_text())
+            # Clean description: Remove structured data sections that are extracted separately
+            if desc_text:
+                lines = desc_text.split('\n')
+                cleaned_lines = []
+                skip_until_next_section = False
                 
-                # Experience (look for calendar/exp icon or text 'years')
-                exp_icon = soup.find('i', class_=lambda x: x and 'experience' in x.lower())
-                if exp_icon and exp_icon.parent:
-                    job_details['experience'] = clean(exp_icon.parent.get_text())
+                # Patterns to identify structured data sections
+                skip_patterns = [
+                    'role:', 'industry type:', 'department:', 'employment type:', 
+                    'role category:', 'education', 'ug:', 'pg:', 'key skills',
+                    'additional details'
+                ]
                 
-                # Location (look for location icon)
-                loc_icon = soup.find('i', class_=lambda x: x and 'location' in x.lower())
-                if loc_icon and loc_icon.parent:
-                    job_details['location'] = clean(loc_icon.parent.get_text())
+                for line in lines:
+                    line_original = line
+                    line_lower = line.lower().strip()
+                    line_stripped = line.strip()
                     
-                # Salary (look for salary icon)
-                sal_icon = soup.find('i', class_=lambda x: x and 'salary' in x.lower())
-                if sal_icon and sal_icon.parent:
-                    job_details['salary'] = clean(sal_icon.parent.get_text())
-                
-                # Stats (Posted, Openings, Applicants)
-                # Look for spans containing specific keywords
-                all_spans = soup.find_all('span')
-                for span in all_spans:
-                    text = clean(span.get_text()).lower()
-                    if 'posted:' in text or 'ago' in text:
-                        # Only keep if it's short (likely a date)
-                        if len(text) < 30: job_details['posted'] = clean(span.get_text())
-                    elif 'openings:' in text:
-                        job_details['openings'] = clean(span.get_text().replace('Openings:', ''))
-                    elif 'applicants:' in text:
-                        job_details['applicants'] = clean(span.get_text().replace('Applicants:', ''))
-            except Exception as e:
-                pass
-            
-            # 2. Job Description (The most critical part)
-            try:
-                # Priority 1: The standard 'dang-inner-html' class
-                desc_div = soup.find(class_='dang-inner-html')
-                if desc_div:
-                    desc_text = clean(desc_div.get_text(separator='\n'))
-                else:
-                    # Priority 2: Find header "Job description" and get the container's text
-                    # We look for the text strictly to avoid false positives
-                    headers = soup.find_all(lambda tag: tag.name in ['h2', 'h3', 'h4', 'div'] and tag.text and 'job description' in tag.text.lower())
-                    desc_text = ''
-                    for header in headers:
-                        # Ensure it's a visible header, not a hidden script
-                        if header.parent.name != 'script':
-                            # Get the section containing this header
-                            section = header.find_parent('section') or header.find_parent('div', class_=lambda x: x and 'job-desc' in x)
-                            if section:
-                                full_text = clean(section.get_text(separator='\n'))
-                                header_text = clean(header.get_text())
-                                # Strip header from content
-                                if full_text.lower().startswith(header_text.lower()):
-                                    desc_text = full_text[len(header_text):].strip()
-                                else:
-                                    desc_text = full_text
-                                break
-                
-                # Clean description: Remove structured data sections that are extracted separately
-                if desc_text:
-                    lines = desc_text.split('\n')
-                    cleaned_lines = []
-                    skip_until_next_section = False
+                    # Skip empty lines if we're in skip mode
+                    if skip_until_next_section and not line_stripped:
+                        continue
                     
-                    # Patterns to identify structured data sections
-                    skip_patterns = [
-                        'role:', 'industry type:', 'department:', 'employment type:', 
-                        'role category:', 'education', 'ug:', 'pg:', 'key skills',
-                        'additional details'
-                    ]
+                    # Check if this line starts a section we want to skip
+                    should_skip = any(line_lower.startswith(pattern) for pattern in skip_patterns)
                     
-                    for line in lines:
-                        line_original = line
-                        line_lower = line.lower().strip()
-                        line_stripped = line.strip()
-                        
-                        # Skip empty lines if we're in skip mode
-                        if skip_until_next_section and not line_stripped:
+                    if should_skip:
+                        skip_until_next_section = True
+                        continue
+                    
+                    # Stop skipping when we hit a new major section (usually empty line or new heading)
+                    if skip_until_next_section:
+                        # Check if it's still structured data (has colons with known patterns)
+                        if ':' in line and any(pattern in line_lower for pattern in ['role', 'industry', 'department', 'employment', 'category', 'education', 'ug', 'pg', 'key skills']):
                             continue
-                        
-                        # Check if this line starts a section we want to skip
-                        should_skip = any(line_lower.startswith(pattern) for pattern in skip_patterns)
-                        
-                        if should_skip:
-                            skip_until_next_section = True
+                        # If we hit a line that doesn't look like structured data, stop skipping
+                        if line_stripped and not (':' in line and len(line_stripped) < 50):
+                            skip_until_next_section = False
+                        else:
                             continue
-                        
-                        # Stop skipping when we hit a new major section (usually empty line or new heading)
-                        if skip_until_next_section:
-                            # Check if it's still structured data (has colons with known patterns)
-                            if ':' in line and any(pattern in line_lower for pattern in ['role', 'industry', 'department', 'employment', 'category', 'education', 'ug', 'pg', 'key skills']):
-                                continue
-                            # If we hit a line that doesn't look like structured data, stop skipping
-                            if line_stripped and not (':' in line and len(line_stripped) < 50):
-                                skip_until_next_section = False
-                            else:
+                    
+                    # Skip lines that look like structured data (contain labels with colons)
+                    if ':' in line:
+                        # Check if it's a label-value pair (like "Role: Something")
+                        parts = line.split(':', 1)
+                        if len(parts) == 2:
+                            label_part = parts[0].lower().strip()
+                            if any(pattern in label_part for pattern in ['role', 'industry', 'department', 'employment', 'category', 'education', 'ug', 'pg', 'key skills', 'additional']):
                                 continue
-                        
-                        # Skip lines that look like structured data (contain labels with colons)
-                        if ':' in line:
-                            # Check if it's a label-value pair (like "Role: Something")
-                            parts = line.split(':', 1)
-                            if len(parts) == 2:
-                                label_part = parts[0].lower().strip()
-                                if any(pattern in label_part for pattern in ['role', 'industry', 'department', 'employment', 'category', 'education', 'ug', 'pg', 'key skills', 'additional']):
-                                    continue
-                        
-                        # Skip lines that are just labels or very short structured data
-                        if len(line_stripped) < 3:
-                            continue
-                        
-                        cleaned_lines.append(line_original)
                     
-                    # Join and clean up multiple empty lines
-                    cleaned_text = '\n'.join(cleaned_lines)
-                    # Remove multiple consecutive newlines
-                    import re
-                    cleaned_text = re.sub(r'\n{3,}', '\n\n', cleaned_text)
-                    job_details['job_description_content'] = cleaned_text.strip()
-            except Exception as e:
-                pass
-            
-            # 3. Key Skills
-            try:
-                # Find "Key Skills" header
-                skills_header = soup.find(lambda tag: tag.text and 'key skills' in tag.text.lower() and tag.name in ['h2', 'div', 'span'])
-                if skills_header:
-                    # Look at siblings or parent's siblings
-                    # Skills are usually links (a) or spans with specific styling
-                    container = skills_header.find_parent('div') or skills_header.find_parent('section')
-                    if container:
-                        # Extract all text from 'a' tags or 'span' tags that seem like pills
-                        # Heuristic: Short text, not the header itself
-                        candidates = container.find_all(['a', 'span'])
-                        skills = []
-                        for tag in candidates:
-                            txt = clean(tag.get_text())
-                            # Filter noise: Exclude empty, header text, and "suggested" labels
-                            if txt and len(txt) < 40 and 'key skills' not in txt.lower() and 'suggested' not in txt.lower():
-                                skills.append(txt)
-                        job_details['key_skills'] = list(set(skills))  # Remove duplicates
-            except Exception as e:
-                pass
-            
-            # 4. Other Details (Role, Industry, etc.) via Label Search
-            try:
-                def find_detail(label_pattern):
-                    # Find a label containing the text (e.g. "Role:")
-                    label = soup.find(lambda tag: tag.text and label_pattern.lower() in tag.text.lower() and len(tag.text) < 50)
-                    if label:
-                        # Strategy A: The value is the next sibling
-                        value = label.find_next_sibling()
-                        if value:
-                            text = clean(value.get_text())
-                            # Remove label pattern from value if it's included
+                    # Skip lines that are just labels or very short structured data
+                    if len(line_stripped) < 3:
+                        continue
+                    
+                    cleaned_lines.append(line_original)
+                
+                # Join and clean up multiple empty lines
+                cleaned_text = '\n'.join(cleaned_lines)
+                # Remove multiple consecutive newlines
+                import re
+                cleaned_text = re.sub(r'\n{3,}', '\n\n', cleaned_text)
+                job_details['job_description_content'] = cleaned_text.strip()
+        except Exception as e:
+            pass
+        
+        # 3. Key Skills
+        try:
+            # Find "Key Skills" header
+            skills_header = soup.find(lambda tag: tag.text and 'key skills' in tag.text.lower() and tag.name in ['h2', 'div', 'span'])
+            if skills_header:
+                # Look at siblings or parent's siblings
+                # Skills are usually links (a) or spans with specific styling
+                container = skills_header.find_parent('div') or skills_header.find_parent('section')
+                if container:
+                    # Extract all text from 'a' tags or 'span' tags that seem like pills
+                    # Heuristic: Short text, not the header itself
+                    candidates = container.find_all(['a', 'span'])
+                    skills = []
+                    for tag in candidates:
+                        txt = clean(tag.get_text())
+                        # Filter noise: Exclude empty, header text, and "suggested" labels
+                        if txt and len(txt) < 40 and 'key skills' not in txt.lower() and 'suggested' not in txt.lower():
+                            skills.append(txt)
+                    job_details['key_skills'] = list(set(skills))  # Remove duplicates
+        except Exception as e:
+            pass
+        
+        # 4. Other Details (Role, Industry, etc.) via Label Search
+        try:
+            def find_detail(label_pattern):
+                # Find a label containing the text (e.g. "Role:")
+                label = soup.find(lambda tag: tag.text and label_pattern.lower() in tag.text.lower() and len(tag.text) < 50)
+                if label:
+                    # Strategy A: The value is the next sibling
+                    value = label.find_next_sibling()
+                    if value:
+                        text = clean(value.get_text())
+                        # Remove label pattern from value if it's included
+                        text = text.replace(f'{label_pattern}:', '').replace(f'{label_pattern}', '').strip()
+                        # Remove trailing commas
+                        text = text.rstrip(',').strip()
+                        return text
+                    
+                    # Strategy B: The value is inside the parent's next sibling (common in grid layouts)
+                    if label.parent:
+                        next_container = label.parent.find_next_sibling()
+                        if next_container:
+                            text = clean(next_container.get_text())
                             text = text.replace(f'{label_pattern}:', '').replace(f'{label_pattern}', '').strip()
-                            # Remove trailing commas
                             text = text.rstrip(',').strip()
                             return text
                         
-                        # Strategy B: The value is inside the parent's next sibling (common in grid layouts)
-                        if label.parent:
-                            next_container = label.parent.find_next_sibling()
-                            if next_container:
-                                text = clean(next_container.get_text())
-                                text = text.replace(f'{label_pattern}:', '').replace(f'{label_pattern}', '').strip()
-                                text = text.rstrip(',').strip()
-                                return text
-                            
-                            # Strategy C: Text node immediately following the label
-                            if label.next_sibling:
-                                text = clean(str(label.next_sibling))
-                                text = text.replace(f'{label_pattern}:', '').replace(f'{label_pattern}', '').strip()
-                                text = text.rstrip(',').strip()
-                                return text
-                    return ''
-                
-                job_details['role'] = find_detail('Role')
-                job_details['industry_type'] = find_detail('Industry Type')
-                job_details['department'] = find_detail('Department')
-                job_details['employment_type'] = find_detail('Employment Type')
-                job_details['role_category'] = find_detail('Role Category')
-                
-                # Education - look for specific education section
-                edu_section = soup.find(lambda tag: tag.text and 'education' in tag.text.lower() and tag.name in ['h2', 'h3', 'div'])
-                if edu_section:
-                    container = edu_section.find_parent('div') or edu_section.find_parent('section')
-                    if container:
-                        # Look for UG specifically
-                        ug_elem = container.find(lambda t: t.text and 'ug:' in t.text.lower() and len(t.text) < 100)
-                        if ug_elem:
-                            ug_text = clean(ug_elem.get_text())
-                            # Extract value after "UG:"
-                            if ':' in ug_text:
-                                ug_text = ug_text.split(':', 1)[1].strip()
-                            # Remove "Key Skills" if present
-                            if 'key skills' in ug_text.lower():
-                                ug_text = ug_text.split('key skills')[0].strip()
-                            job_details['ug_education'] = ug_text.rstrip(',').strip()
-                        
-                        # Look for PG specifically
-                        pg_elem = container.find(lambda t: t.text and 'pg:' in t.text.lower() and len(t.text) < 100)
-                        if pg_elem:
-                            pg_text = clean(pg_elem.get_text())
-                            # Extract value after "PG:"
-                            if ':' in pg_text:
-                                pg_text = pg_text.split(':', 1)[1].strip()
-                            # Remove "Key Skills" if present
-                            if 'key skills' in pg_text.lower():
-                                pg_text = pg_text.split('key skills')[0].strip()
-                            job_details['pg_education'] = pg_text.rstrip(',').strip()
-                
-                # Fallback to find_detail if not found in education section
-                if not job_details['ug_education']:
-                    job_details['ug_education'] = find_detail('UG')
-                if not job_details['pg_education']:
-                    job_details['pg_education'] = find_detail('PG')
-            except Exception as e:
-                pass
+                        # Strategy C: Text node immediately following the label
+                        if label.next_sibling:
+                            text = clean(str(label.next_sibling))
+                            text = text.replace(f'{label_pattern}:', '').replace(f'{label_pattern}', '').strip()
+                            text = text.rstrip(',').strip()
+                            return text
+                return ''
             
-            # 5. About Company
-            try:
-                # Look for header "About Company"
-                about_header = soup.find(lambda tag: tag.text and 'about company' in tag.text.lower() and tag.name in ['h2', 'div'])
-                if about_header:
-                    # The description is usually text inside the parent container
-                    container = about_header.find_parent('div')
-                    if container:
-                        full_text = clean(container.get_text(separator='\n'))
-                        header_text = clean(about_header.get_text())
-                        if full_text.lower().startswith(header_text.lower()):
-                            job_details['about_company_description'] = full_text[len(header_text):].strip()
-                        else:
-                            job_details['about_company_description'] = full_text
-            except Exception as e:
-                pass
+            job_details['role'] = find_detail('Role')
+            job_details['industry_type'] = find_detail('Industry Type')
+            job_details['department'] = find_detail('Department')
+            job_details['employment_type'] = find_detail('Employment Type')
+            job_details['role_category'] = find_detail('Role Category')
             
+            # Education - look for specific education section
+            edu_section = soup.find(lambda tag: tag.text and 'education' in tag.text.lower() and tag.name in ['h2', 'h3', 'div'])
+            if edu_section:
+                container = edu_section.find_parent('div') or edu_section.find_parent('section')
+                if container:
+                    # Look for UG specifically
+                    ug_elem = container.find(lambda t: t.text and 'ug:' in t.text.lower() and len(t.text) < 100)
+                    if ug_elem:
+                        ug_text = clean(ug_elem.get_text())
+                        # Extract value after "UG:"
+                        if ':' in ug_text:
+                            ug_text = ug_text.split(':', 1)[1].strip()
+                        # Remove "Key Skills" if present
+                        if 'key skills' in ug_text.lower():
+                            ug_text = ug_text.split('key skills')[0].strip()
+                        job_details['ug_education'] = ug_text.rstrip(',').strip()
+                    
+                    # Look for PG specifically
+                    pg_elem = container.find(lambda t: t.text and 'pg:' in t.text.lower() and len(t.text) < 100)
+                    if pg_elem:
+                        pg_text = clean(pg_elem.get_text())
+                        # Extract value after "PG:"
+                        if ':' in pg_text:
+                            pg_text = pg_text.split(':', 1)[1].strip()
+                        # Remove "Key Skills" if present
+                        if 'key skills' in pg_text.lower():
+                            pg_text = pg_text.split('key skills')[0].strip()
+                        job_details['pg_education'] = pg_text.rstrip(',').strip()
+            
+            # Fallback to find_detail if not found in education section
+            if not job_details['ug_education']:
+                job_details['ug_education'] = find_detail('UG')
+            if not job_details['pg_education']:
+                job_details['pg_education'] = find_detail('PG')
         except Exception as e:
-            import traceback
-            traceback.print_exc()
+            pass
+        
+        # 5. About Company
+        try:
+            # Look for header "About Company"
+            about_header = soup.find(lambda tag: tag.text and 'about company' in tag.text.lower() and tag.name in ['h2', 'div'])
+            if about_header:
+                # The description is usually text inside the parent container
+                container = about_header.find_parent('div')
+                if container:
+                    full_text = clean(container.get_text(separator='\n'))
+                    header_text = clean(about_header.get_text())
+                    if full_text.lower().startswith(header_text.lower()):
+                        job_details['about_company_description'] = full_text[len(header_text):].strip()
+                    else:
+                        job_details['about_company_description'] = full_text
+        except Exception as e:
+            pass
         
         return job_details
     
+    def prime_session(self):
+        """
+        Load the site home page so the browser holds naukri session cookies
+        before the first search
+        
+        Returns:
+            True if the page loaded without a block signal
+        """
+        return not self._navigate(self.base_url + '/')
+    
+    def is_alive(self):
+        """Check that the browser still answers WebDriver commands"""
+        if not self.driver:
+            return False
+        try:
+            self.driver.current_url
+            return True
+        except Exception:
+            return False
+    
     def close(self):
         """Close the browser driver"""
         if self.driver:
-            self.driver.quit()
+            try:
+                self.driver.quit()
+            finally:
+                self.driver = None
+                LIVE_BROWSERS.dec()
 
@@ -4,9 +4,40 @@ Standalone service module for Naukri.com scraping operations.
 This module provides a reusable function that can be called directly
 without requiring HTTP requests, making it suitable for use in workers,
 scripts, or other APIs.
+
+The scraping engine (selenium, webdriver-manager, BeautifulSoup, requests)
+is imported on first use, so importing this module is cheap for Django
+startup, management commands and gunicorn workers. Call ``warmup()`` to
+pay the import cost ahead of the first request.
 """
-from typing import Dict, Any, Optional
-from .naukri_scraper import NaukriScraper
+import time
+from typing import TYPE_CHECKING, Dict, Any, Optional
+from .browser_pool import get_browser_pool
+from .dedup import dedupe
+from .metrics import (
+    DETAILS_DURATION, FALLBACKS, FIELD_EXTRACTION_FAILURES, INFLIGHT_SCRAPES, SEARCH_DURATION
+)
+
+if TYPE_CHECKING:
+    from .naukri_scraper import NaukriScraper
+
+
+def _scraper_class():
+    """Import the scraping engine on first use"""
+    from .naukri_scraper import NaukriScraper
+    return NaukriScraper
+
+
+def warmup() -> float:
+    """
+    Import the scraping engine ahead of the first scrape.
+    
+    Returns:
+        Milliseconds spent importing (close to 0 once already imported)
+    """
+    start = time.perf_counter()
+    _scraper_class()
+    return round((time.perf_counter() - start) * 1000, 1)
 
 
 def get_naukri_data(
@@ -18,7 +49,9 @@ def get_naukri_data(
     page: int = 1,
     page_size: int = 20,
     job_url: Optional[str] = None,
-    headless: bool = True
+    headless: bool = True,
+    base_url: Optional[str] = None,
+    engine: str = 'browser'
 ) -> Dict[str, Any]:
     """
     Main function to get Naukri.com data (jobs or job details).
@@ -36,13 +69,19 @@ def get_naukri_data(
         page_size: Number of jobs per page (optional for search task, default: 20)
         job_url: URL of job detail page (required for details task)
         headless: Whether to run browser in headless mode (default: True)
+        base_url: Site root to scrape instead of naukri.com, e.g. a local
+            replay server (default: NAUKRI_BASE_URL or https://www.naukri.com)
+        engine: How searches are scraped: 'browser' loads the results page
+            and falls back to the JSON API; 'api' queries the JSON API first
+            without a browser and only starts one if the API returns nothing
+            (default: 'browser'; details always need the browser)
     
     Returns:
         For 'search' task:
         {
             'success': bool,
             'count': int,
-            'jobs': list[dict],
+            'jobs': list[Job],  # scraper.records.Job; supports job['field'] access
             'pagination': {
                 'current_page': int,
                 'page_size': int,
@@ -53,7 +92,7 @@ def get_naukri_data(
             },
             'metadata': {
                 'data_source': str,
-                'debug_info': dict
+                'debug_info': dict  # includes 'timings': per-stage milliseconds
             },
             'error': str | None,
             'message': str | None
@@ -63,11 +102,15 @@ def get_naukri_data(
         {
             'success': bool,
             'job_details': dict,
+            'metadata': {
+                'debug_info': {'timings': dict}
+            },
             'error': str | None,
             'message': str | None
         }
     """
     scraper = None
+    pool = get_browser_pool()
     
     try:
         # Validate task_type
@@ -78,6 +121,13 @@ def get_naukri_data(
                 'message': f"task_type must be 'search' or 'details', got '{task_type}'"
             }
         
+        if engine not in ['browser', 'api']:
+            return {
+                'success': False,
+                'error': 'Invalid engine',
+                'message': f"engine must be 'browser' or 'api', got '{engine}'"
+            }
+        
         # Validate parameters based on task_type
         if task_type == 'search':
             if not job_type:
@@ -112,16 +162,36 @@ def get_naukri_data(
                     'message': 'job_url is required for details task'
                 }
         
-        # Initialize scraper
-        scraper = NaukriScraper(headless=headless)
+        started = time.perf_counter()
+        INFLIGHT_SCRAPES.inc(task_type=task_type)
+        try:
+            if task_type == 'search' and engine == 'api':
+                # No browser needed unless the API comes back empty
+                result = _handle_search_task(
+                    _scraper_class()(base_url=base_url, browser=False),
+                    job_type, keyword, location, experience, page, page_size, api_only=True
+                )
+                if result.get('count'):
+                    _record_metrics(task_type, result, time.perf_counter() - started)
+                    return result
+            
+            # Borrow a pre-started browser, or start one
+            scraper = pool.acquire(headless=headless, base_url=base_url)
+            if scraper is None:
+                scraper = _scraper_class()(headless=headless, base_url=base_url)
+            
+            # Execute appropriate operation
+            if task_type == 'search':
+                result = _handle_search_task(
+                    scraper, job_type, keyword, location, experience, page, page_size
+                )
+            else:  # task_type == 'details'
+                result = _handle_details_task(scraper, job_url)
+        finally:
+            INFLIGHT_SCRAPES.dec(task_type=task_type)
         
-        # Execute appropriate operation
-        if task_type == 'search':
-            return _handle_search_task(
-                scraper, job_type, keyword, location, experience, page, page_size
-            )
-        else:  # task_type == 'details'
-            return _handle_details_task(scraper, job_url)
+        _record_metrics(task_type, result, time.perf_counter() - started)
+        return result
     
     except Exception as e:
         import traceback
@@ -135,48 +205,73 @@ def get_naukri_data(
         }
     
     finally:
-        # Always close the scraper
+        # Always hand the browser back (the pool closes it if it is not kept)
         if scraper:
             try:
-                scraper.close()
+                pool.release(scraper)
             except:
                 pass
 
 
+def _record_metrics(task_type: str, result: Dict[str, Any], elapsed: float) -> None:
+    """Record the latency and outcome of a scrape in the process metrics"""
+    if task_type == 'search':
+        data_source = result.get('metadata', {}).get('data_source', 'unknown')
+        if not result.get('success'):
+            data_source = 'error'
+        SEARCH_DURATION.observe(elapsed, data_source=data_source)
+        if data_source == 'api_fallback':
+            FALLBACKS.inc()
+        return
+    
+    DETAILS_DURATION.observe(elapsed, outcome='success' if result.get('success') else 'error')
+    for field, value in result.get('job_details', {}).items():
+        if not value:
+            FIELD_EXTRACTION_FAILURES.inc(page='details', field=field)
+
+
 def _handle_search_task(
-    scraper: NaukriScraper,
+    scraper: 'NaukriScraper',
     job_type: str,
     keyword: str,
     location: str,
     experience: Optional[int],
     page: int,
-    page_size: int
+    page_size: int,
+    api_only: bool = False
 ) -> Dict[str, Any]:
     """
     Handle job search task.
     
     Args:
-        scraper: Initialized NaukriScraper instance
+        scraper: Initialized NaukriScraper instance (without a browser if api_only)
         job_type: 'job' or 'internship'
         keyword: Search keyword
         location: Search location
         experience: Years of experience (optional)
         page: Page number
         page_size: Number of jobs per page
+        api_only: Query the JSON API only
     
     Returns:
         Structured response dictionary
     """
     try:
         # Scrape jobs (returns tuple of (jobs, metadata))
-        result = scraper.scrape_jobs(
-            job_type=job_type,
-            keyword=keyword,
-            location=location,
-            experience=experience,
-            max_jobs=page_size,
-            page=page
-        )
+        if api_only:
+            result = scraper.scrape_jobs_via_api(
+                job_type, keyword, location, experience, max_jobs=page_size, page=page
+            )
+            result[1]['debug_info']['timings'] = scraper.tracer.as_dict()
+        else:
+            result = scraper.scrape_jobs(
+                job_type=job_type,
+                keyword=keyword,
+                location=location,
+                experience=experience,
+                max_jobs=page_size,
+                page=page
+            )
         
         # Handle both old format (list) and new format (tuple)
         if isinstance(result, tuple) and len(result) == 2:
@@ -193,6 +288,8 @@ def _handle_search_task(
         debug_info = metadata.get('debug_info', {})
         total_jobs_available = debug_info.get('total_jobs_available', 0)
         current_count = len(jobs)
+        # A card can be matched twice on one page; pagination still counts the raw page
+        jobs = dedupe(jobs)
         
         # Calculate pagination info
         has_next_page = current_count >= page_size
@@ -210,8 +307,8 @@ def _handle_search_task(
         # Return structured response
         return {
             'success': True,
-            'count': current_count,
-            'jobs': jobs,  # Return raw job dictionaries
+            'count': len(jobs),
+            'jobs': jobs,  # Job records
             'pagination': {
                 'current_page': page,
                 'page_size': page_size,
@@ -255,7 +352,7 @@ def _handle_search_task(
 
 
 def _handle_details_task(
-    scraper: NaukriScraper,
+    scraper: 'NaukriScraper',
     job_url: str
 ) -> Dict[str, Any]:
     """
@@ -275,6 +372,11 @@ def _handle_details_task(
         return {
             'success': True,
             'job_details': job_details,
+            'metadata': {
+                'debug_info': {
+                    'timings': scraper.tracer.as_dict()
+                }
+            },
             'error': None,
             'message': None
         }
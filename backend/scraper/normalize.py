@@ -0,0 +1,147 @@
+"""
+Batch normalization of salary and experience labels.
+
+Listings carry free-text labels such as "3-6 Lacs PA", "10k/month",
+"50,000-1 Lacs PA", "Unpaid", "Not disclosed" or "2-5 Yrs".
+``normalize_batch`` converts a whole batch into numeric columns:
+
+    min_salary, max_salary           Annual salary in INR (monthly amounts x 12)
+    min_experience, max_experience   Years
+
+Missing or undisclosed values are ``None``. Unpaid listings get a salary of
+0. An open-ended range ("5+ Yrs") has no maximum.
+
+The labels repeat heavily (a crawl has a few hundred distinct salary labels
+per hundred thousand listings), so each batch is factorized first: the
+vectorized string operations run once per distinct label and the results
+are spread back to every listing with a NumPy take. pandas string methods
+on object columns still loop in Python, so running them on every listing
+would be slower than a plain regex per listing.
+"""
+import numpy as np
+import pandas as pd
+
+NORMALIZED_FIELDS = ('min_salary', 'max_salary', 'min_experience', 'max_experience')
+
+# "<low>[k] [- <high>[k]]" with commas removed beforehand
+_RANGE = r'(?P<low>\d+(?:\.\d+)?)\s*(?P<low_k>k\b|thousand)?(?:\s*(?:-|to)\s*(?P<high>\d+(?:\.\d+)?)\s*(?P<high_k>k\b|thousand)?)?'
+_CRORE = r'\bcr\b|crore'
+_LAKHS = r'lakh|\blacs?\b|\blpa\b'
+_MONTHLY = r'month|/\s*m\b|\bpm\b|p\.m'
+_UNPAID = r'unpaid|no stipend'
+
+# Bare amounts below this are taken as monthly stipends
+_MONTHLY_CEILING = 100000
+
+
+def _factorize(labels):
+    """Return (codes, distinct labels as a lowercase Series) of a sequence of labels"""
+    codes, uniques = pd.factorize(pd.Series(labels, dtype='object').fillna('').astype(str))
+    return codes, pd.Series(uniques, dtype='object').str.lower()
+
+
+def _salary_ranges(text):
+    """Annual INR (low, high) arrays of distinct lowercase salary labels"""
+    text = text.str.replace(',', '', regex=False)
+    parts = text.str.extract(_RANGE)
+
+    low = parts['low'].astype(float)
+    high = parts['high'].astype(float)
+    low_k = parts['low_k'].notna()
+    high_k = parts['high_k'].notna()
+
+    # "5-10k" means 5k-10k
+    low = low.where(~(low_k | (high_k & (low < 1000))), low * 1000)
+    high = high.where(~high_k, high * 1000)
+    high = high.fillna(low)
+
+    crore = text.str.contains(_CRORE)
+    lakhs = text.str.contains(_LAKHS) & ~crore
+    monthly = text.str.contains(_MONTHLY) | (~crore & ~lakhs & (high < _MONTHLY_CEILING))
+
+    multiplier = np.select(
+        [crore, lakhs, monthly],
+        [10000000.0, 100000.0, 12.0],
+        default=1.0
+    )
+    # "50000-1 Lacs PA": a lakh range whose low end is already in rupees
+    low_multiplier = np.where(lakhs & (low >= 1000), 1.0, multiplier)
+
+    unpaid = text.str.contains(_UNPAID).to_numpy()
+    low = np.where(unpaid, 0.0, (low * low_multiplier).round().to_numpy())
+    high = np.where(unpaid, 0.0, (high * multiplier).round().to_numpy())
+    return low, high
+
+
+def _experience_ranges(text):
+    """(low, high) arrays of years of distinct lowercase experience labels"""
+    parts = text.str.extract(r'(?P<low>\d+)\s*(?:(?:-|to)\s*(?P<high>\d+)|(?P<plus>\+))?')
+
+    low = parts['low'].astype(float)
+    high = parts['high'].astype(float)
+    high = high.where(high.notna() | parts['plus'].notna(), low)
+
+    fresher = text.str.contains('fresher') & low.isna()
+    return low.mask(fresher, 0.0).to_numpy(), high.mask(fresher, 0.0).to_numpy()
+
+
+def normalize_salaries(salaries):
+    """
+    Convert salary labels to annual INR ranges
+
+    Args:
+        salaries: Sequence (or pandas Series) of salary labels
+
+    Returns:
+        DataFrame with float columns 'min_salary' and 'max_salary' (NaN when unknown)
+    """
+    codes, distinct = _factorize(salaries)
+    low, high = _salary_ranges(distinct)
+    return pd.DataFrame({'min_salary': low.take(codes), 'max_salary': high.take(codes)})
+
+
+def normalize_experience(experiences):
+    """
+    Convert experience labels to ranges of years
+
+    Args:
+        experiences: Sequence (or pandas Series) of experience labels
+
+    Returns:
+        DataFrame with float columns 'min_experience' and 'max_experience'
+    """
+    codes, distinct = _factorize(experiences)
+    low, high = _experience_ranges(distinct)
+    return pd.DataFrame({'min_experience': low.take(codes), 'max_experience': high.take(codes)})
+
+
+def _to_python(column):
+    """Float array to a list of ints, with None for NaN"""
+    missing = np.isnan(column)
+    values = np.where(missing, 0, column).astype(np.int64).astype(object)
+    values[missing] = None
+    return values.tolist()
+
+
+def normalize_batch(jobs):
+    """
+    Normalize the salary and experience labels of a batch of listings
+
+    Args:
+        jobs: Job records or job dictionaries
+
+    Returns:
+        List of dicts (one per job, same order) with NORMALIZED_FIELDS as
+        ints or None
+    """
+    if not jobs:
+        return []
+    salaries = normalize_salaries([job.get('salary') for job in jobs])
+    experience = normalize_experience([job.get('experience') for job in jobs])
+    columns = [
+        _to_python(salaries['min_salary'].to_numpy()),
+        _to_python(salaries['max_salary'].to_numpy()),
+        _to_python(experience['min_experience'].to_numpy()),
+        _to_python(experience['max_experience'].to_numpy()),
+    ]
+    return [dict(zip(NORMALIZED_FIELDS, row)) for row in zip(*columns)]
@@ -0,0 +1,186 @@
+"""
+Adaptive per-host rate limiting for every request sent to naukri.com.
+
+Each host gets a token bucket whose refill rate is tuned with AIMD
+(additive increase, multiplicative decrease): every healthy response nudges
+the rate up by a fixed step, while a block signal (HTTP 429/403, a captcha or
+empty page, or a response slower than the latency threshold) cuts it by a
+factor. 429/403 responses also pause the bucket, honouring ``Retry-After``.
+
+All fetch paths (``requests`` calls and Selenium navigations) share the same
+limiter through ``get_rate_limiter(url)``, so the whole process converges on
+the highest rate the site tolerates.
+"""
+import os
+import threading
+import time
+import urllib.parse
+
+
+RATE_LIMIT_INITIAL = float(os.getenv('NAUKRI_RATE_LIMIT', '1.0'))
+RATE_LIMIT_MIN = float(os.getenv('NAUKRI_RATE_LIMIT_MIN', '0.1'))
+RATE_LIMIT_MAX = float(os.getenv('NAUKRI_RATE_LIMIT_MAX', '5.0'))
+RATE_LIMIT_BURST = float(os.getenv('NAUKRI_RATE_LIMIT_BURST', '2'))
+RATE_LIMIT_LATENCY_THRESHOLD = float(os.getenv('NAUKRI_RATE_LIMIT_LATENCY_THRESHOLD', '8.0'))
+
+BLOCK_STATUS_CODES = (403, 429)
+
+# Markers of anti-bot interstitials served instead of real content
+BLOCK_MARKERS = (
+    'captcha',
+    'access denied',
+    'are you a robot',
+    'unusual traffic',
+    'request blocked',
+)
+
+
+class AdaptiveRateLimiter:
+    """Token bucket whose refill rate adapts to observed responses (AIMD)"""
+
+    def __init__(
+        self,
+        initial_rate=RATE_LIMIT_INITIAL,
+        min_rate=RATE_LIMIT_MIN,
+        max_rate=RATE_LIMIT_MAX,
+        burst=RATE_LIMIT_BURST,
+        increase_step=0.1,
+        decrease_factor=0.5,
+        latency_threshold=RATE_LIMIT_LATENCY_THRESHOLD
+    ):
+        """
+        Args:
+            initial_rate: Starting rate in requests per second
+            min_rate: Lowest rate the limiter will back off to
+            max_rate: Highest rate the limiter will ramp up to
+            burst: Bucket capacity (requests allowed back to back)
+            increase_step: Requests/second added after each healthy response
+            decrease_factor: Multiplier applied to the rate on a block signal
+            latency_threshold: Seconds above which a response counts as congestion
+        """
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = max(1.0, burst)
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.latency_threshold = latency_threshold
+
+        self._rate = min(max(initial_rate, min_rate), max_rate)
+        self._tokens = self.burst
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+        self.total_requests = 0
+        self.total_blocks = 0
+        self.total_wait_seconds = 0.0
+
+    @property
+    def current_rate(self):
+        """Current refill rate in requests per second"""
+        return self._rate
+
+    def _refill(self, now):
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self._rate)
+            self._last_refill = now
+
+    def acquire(self):
+        """
+        Block until a request may be sent
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                else:
+                    self._refill(now)
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        self.total_requests += 1
+                        self.total_wait_seconds += waited
+                        return waited
+                    delay = (1 - self._tokens) / self._rate
+            time.sleep(delay)
+            waited += delay
+
+    def record(self, status_code=None, latency=None, blocked=False, retry_after=None, failed=False):
+        """
+        Feed the outcome of a request back into the limiter
+
+        Args:
+            status_code: HTTP status code, if known (browser navigations have none)
+            latency: Request duration in seconds
+            blocked: True if the response looked like a captcha or empty page
+            retry_after: Value of the Retry-After header, if any
+            failed: True if the request raised (timeout, connection error)
+                instead of returning a response
+        """
+        with self._lock:
+            if blocked or status_code in BLOCK_STATUS_CODES:
+                self.total_blocks += 1
+                self._rate = max(self.min_rate, self._rate * self.decrease_factor)
+                self._tokens = 0.0
+                pause = _parse_retry_after(retry_after)
+                if pause is None:
+                    pause = 1.0 / self._rate
+                self._paused_until = max(self._paused_until, time.monotonic() + pause)
+            elif failed or (latency is not None and latency > self.latency_threshold):
+                self._rate = max(self.min_rate, self._rate * self.decrease_factor)
+            elif status_code is None or status_code < 500:
+                self._rate = min(self.max_rate, self._rate + self.increase_step)
+
+    def snapshot(self):
+        """Return the limiter state as a plain dictionary"""
+        return {
+            'current_rate': round(self._rate, 3),
+            'total_requests': self.total_requests,
+            'total_blocks': self.total_blocks,
+            'total_wait_seconds': round(self.total_wait_seconds, 3),
+        }
+
+
+def _parse_retry_after(value):
+    """Parse a Retry-After header given in seconds"""
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def looks_blocked(text):
+    """Check whether a response body looks like an anti-bot or empty page"""
+    if not text or not text.strip():
+        return True
+    lowered = text[:5000].lower()
+    return any(marker in lowered for marker in BLOCK_MARKERS)
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(url):
+    """Return the shared limiter for the host of a URL"""
+    host = urllib.parse.urlsplit(url).netloc.lower() or url
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = AdaptiveRateLimiter()
+            _limiters[host] = limiter
+        return limiter
+
+
+def rate_limiter_metrics():
+    """Return a snapshot of every host limiter, keyed by host"""
+    with _limiters_lock:
+        limiters = dict(_limiters)
+    return {host: limiter.snapshot() for host, limiter in limiters.items()}
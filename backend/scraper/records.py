@@ -0,0 +1,150 @@
+"""
+Compact record type for scraped job listings.
+
+Large crawls hold hundreds of thousands of listings in memory. A ``Job``
+keeps its twelve fields in ``__slots__`` instead of a per-instance dict, and
+interns the labels that repeat across listings (company, location,
+experience, salary, rating, post date and tags) so equal values share one
+string object.
+
+Values are normalized when they are set, so a ``Job`` always matches the
+response schema without a validating serializer: text fields are strings
+(``None`` becomes ``''``), URL fields hold an http(s) or site-relative URL
+or ``''``, and ``tags`` is a tuple of non-empty strings.
+
+``Job`` also supports read/write access by key (``job['salary']``,
+``job.get('salary')``) so code written against the old job dictionaries
+keeps working. Use ``to_dict()`` or ``JobJSONEncoder``/``encode_job`` to
+serialize it.
+"""
+import json
+import sys
+
+
+JOB_FIELDS = (
+    'job_title', 'company_name', 'company_logo', 'rating', 'reviews', 'experience',
+    'salary', 'location', 'job_description', 'tags', 'job_post_date', 'job_url'
+)
+
+# Fields whose values repeat across many listings
+INTERNED_FIELDS = frozenset((
+    'company_name', 'rating', 'reviews', 'experience', 'salary', 'location', 'job_post_date'
+))
+
+URL_FIELDS = frozenset(('company_logo', 'job_url'))
+_URL_PREFIXES = ('https://', 'http://', '/')
+
+
+class Job:
+    """One job listing; every field is a string except ``tags`` (tuple of strings)"""
+
+    __slots__ = JOB_FIELDS
+
+    def __init__(self, job_title='', company_name='', company_logo='', rating='', reviews='',
+                 experience='', salary='', location='', job_description='', tags=(),
+                 job_post_date='', job_url=''):
+        self.job_title = job_title
+        self.company_name = company_name
+        self.company_logo = company_logo
+        self.rating = rating
+        self.reviews = reviews
+        self.experience = experience
+        self.salary = salary
+        self.location = location
+        self.job_description = job_description
+        self.tags = tags
+        self.job_post_date = job_post_date
+        self.job_url = job_url
+
+    def __setattr__(self, name, value):
+        if name == 'tags':
+            value = tuple(sys.intern(str(tag)) for tag in value or () if tag)
+        else:
+            if type(value) is not str:
+                value = '' if value is None else str(value)
+            if name in INTERNED_FIELDS:
+                value = sys.intern(value)
+            elif name in URL_FIELDS and value and not value.startswith(_URL_PREFIXES):
+                value = ''
+        object.__setattr__(self, name, value)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a Job from a job dictionary, ignoring unknown keys"""
+        return cls(**{field: data[field] for field in JOB_FIELDS if field in data})
+
+    def to_dict(self):
+        """Return the listing as a plain dictionary (tags as a list)"""
+        return {
+            'job_title': self.job_title,
+            'company_name': self.company_name,
+            'company_logo': self.company_logo,
+            'rating': self.rating,
+            'reviews': self.reviews,
+            'experience': self.experience,
+            'salary': self.salary,
+            'location': self.location,
+            'job_description': self.job_description,
+            'tags': list(self.tags),
+            'job_post_date': self.job_post_date,
+            'job_url': self.job_url,
+        }
+
+    # Dictionary-style access, for code written against job dictionaries
+
+    def __getitem__(self, key):
+        if key not in JOB_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in JOB_FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in JOB_FIELDS
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in JOB_FIELDS else default
+
+    def keys(self):
+        return JOB_FIELDS
+
+    def __eq__(self, other):
+        if not isinstance(other, Job):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in JOB_FIELDS)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Job(job_title={self.job_title!r}, company_name={self.company_name!r}, job_url={self.job_url!r})"
+
+    def __getstate__(self):
+        return tuple(getattr(self, field) for field in JOB_FIELDS)
+
+    def __setstate__(self, state):
+        for field, value in zip(JOB_FIELDS, state):
+            setattr(self, field, value)
+
+
+def encode_job(obj):
+    """``default=`` hook for json.dumps and similar encoders"""
+    if isinstance(obj, Job):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class JobJSONEncoder(json.JSONEncoder):
+    """JSON encoder that serializes Job records as dictionaries"""
+
+    def default(self, obj):
+        if isinstance(obj, Job):
+            return obj.to_dict()
+        return super().default(obj)
+
+
+def jobs_to_dicts(jobs):
+    """Convert a list of Job records (or job dictionaries) to dictionaries"""
+    return [job.to_dict() if isinstance(job, Job) else job for job in jobs]
@@ -0,0 +1,258 @@
+"""
+Self-healing registry of the XPath selectors used for browser scraping.
+
+Selectors are declared in ``selectors.json`` as an ordered list of variants
+per field. Every lookup records whether each variant it tried hit or missed,
+and variants are re-ordered by hit rate so the one that currently works is
+tried first. When naukri.com changes its markup, the fallback variant that
+still matches rises to the top instead of being reached through a chain of
+failed lookups on every card.
+
+A field may declare a ``pattern`` its values must match (a numeric rating,
+a URL for links); a value that does not match counts as a miss, so a loose
+variant cannot win by matching the wrong text. On a small fraction of
+lookups (``NAUKRI_SELECTOR_EXPLORE_RATE``) the variants ranked below the one
+that hit are probed too, so a demoted variant can win its place back.
+
+Statistics are persisted to ``NAUKRI_SELECTOR_STATS`` (a JSON file) so the
+learned order survives restarts and can be read by ``manage.py selector_report``.
+"""
+import json
+import os
+import random
+import re
+import tempfile
+import threading
+
+from .metrics import FIELD_EXTRACTION_FAILURES
+
+
+SELECTORS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'selectors.json')
+SELECTOR_STATS_PATH = os.getenv(
+    'NAUKRI_SELECTOR_STATS',
+    os.path.join(tempfile.gettempdir(), 'naukri_selector_stats.json')
+)
+
+# Weight of the latest observation in a variant's recent hit rate. Ordering
+# uses the recent rate so a selector that breaks is demoted within a few
+# dozen lookups, however long its history of hits.
+RECENT_WEIGHT = 0.1
+
+# Recent hit rates are ranked in steps of this size; within a step the
+# declared order wins, so a specific variant that recovers overtakes a
+# loose fallback that matches just as often
+SCORE_RESOLUTION = 0.1
+
+# Fraction of successful lookups that also probe the lower-ranked variants
+EXPLORE_RATE = float(os.getenv('NAUKRI_SELECTOR_EXPLORE_RATE', '0.05'))
+
+
+class SelectorRegistry:
+    """Ordered selector variants per field with runtime hit statistics"""
+
+    def __init__(self, selectors_path=SELECTORS_PATH, stats_path=SELECTOR_STATS_PATH, explore_rate=EXPLORE_RATE):
+        """
+        Args:
+            selectors_path: JSON file declaring the variants of every field
+            stats_path: JSON file used to persist hit statistics (None to disable)
+            explore_rate: Fraction of successful lookups that also probe the
+                lower-ranked variants
+        """
+        with open(selectors_path, 'r', encoding='utf-8') as f:
+            self._specs = json.load(f)
+        self._patterns = {
+            field: re.compile(spec['pattern']) for field, spec in self._specs.items() if spec.get('pattern')
+        }
+        self.stats_path = stats_path
+        self.explore_rate = explore_rate
+        self._lock = threading.Lock()
+        # field -> variant -> [attempts, hits, recent hit rate]
+        self._variant_stats = {field: {} for field in self._specs}
+        # field -> [lookups, lookups where some variant hit]
+        self._field_stats = {field: [0, 0] for field in self._specs}
+        self._load_stats()
+
+    @property
+    def fields(self):
+        """Names of all declared fields"""
+        return list(self._specs)
+
+    def spec(self, field):
+        """Return the declaration of a field"""
+        return self._specs[field]
+
+    def variants(self, field):
+        """
+        Return the variants of a field, most successful first
+
+        Untried variants score 0.5 so they keep their declared position
+        until there is evidence for or against them. Scores are compared at
+        SCORE_RESOLUTION, so variants that both work rank in declared order.
+        """
+        declared = self._specs[field]['variants']
+        with self._lock:
+            stats = self._variant_stats[field]
+
+            def score(item):
+                position, variant = item
+                counts = stats.get(variant)
+                return (-round((counts[2] if counts else 0.5) / SCORE_RESOLUTION), position)
+
+            return [variant for _, variant in sorted(enumerate(declared), key=score)]
+
+    def record(self, field, variant, hit):
+        """Record whether a variant matched"""
+        with self._lock:
+            counts = self._variant_stats[field].setdefault(variant, [0, 0, 0.5])
+            counts[2] += RECENT_WEIGHT * ((1.0 if hit else 0.0) - counts[2])
+            counts[0] += 1
+            if hit:
+                counts[1] += 1
+
+    def record_field(self, field, hit):
+        """Record whether any variant of a field matched"""
+        with self._lock:
+            counts = self._field_stats[field]
+            counts[0] += 1
+            if hit:
+                counts[1] += 1
+        if not hit:
+            FIELD_EXTRACTION_FAILURES.inc(page='search', field=field)
+
+    def accepts(self, field, value):
+        """Check a non-empty value against the field's pattern (every item of a list)"""
+        pattern = self._patterns.get(field)
+        if pattern is None:
+            return True
+        if isinstance(value, (list, tuple)):
+            return all(pattern.search(item) for item in value)
+        return isinstance(value, str) and bool(pattern.search(value))
+
+    def resolve(self, field, probe, variants=None, optional=False):
+        """
+        Try the variants of a field in order until one yields a value
+
+        Args:
+            field: Field name
+            probe: Callable taking a variant and returning a value (falsy on miss)
+            variants: Explicit variant order (defaults to the learned order)
+            optional: The value may legitimately be absent (e.g. the card after
+                the last one on a page); misses are then only recorded when
+                another variant matched
+
+        Returns:
+            Tuple of (matching variant, value), or (None, None) if all missed;
+            values rejected by the field's pattern count as misses
+        """
+        missed = []
+        ordered = variants or self.variants(field)
+        for position, variant in enumerate(ordered):
+            value = probe(variant)
+            if value and self.accepts(field, value):
+                for missed_variant in missed:
+                    self.record(field, missed_variant, False)
+                self.record(field, variant, True)
+                self.record_field(field, True)
+                if self.explore_rate and random.random() < self.explore_rate:
+                    self._explore(field, probe, ordered[position + 1:])
+                return variant, value
+            if optional:
+                missed.append(variant)
+            else:
+                self.record(field, variant, False)
+        if not optional:
+            self.record_field(field, False)
+        return None, None
+
+    def _explore(self, field, probe, variants):
+        """Probe and record lower-ranked variants, without changing the lookup's result"""
+        for variant in variants:
+            try:
+                value = probe(variant)
+            except Exception:
+                return
+            self.record(field, variant, bool(value) and self.accepts(field, value))
+
+    def report(self):
+        """
+        Return per-field and per-variant hit rates
+
+        Returns:
+            Dictionary keyed by field with 'lookups', 'hits', 'hit_rate' and
+            'variants' (list in current priority order)
+        """
+        report = {}
+        for field in self._specs:
+            ordered = self.variants(field)
+            with self._lock:
+                lookups, hits = self._field_stats[field]
+                variants = []
+                for variant in ordered:
+                    attempts, variant_hits, recent = self._variant_stats[field].get(variant, (0, 0, None))
+                    variants.append({
+                        'selector': variant,
+                        'attempts': attempts,
+                        'hits': variant_hits,
+                        'hit_rate': round(variant_hits / attempts, 3) if attempts else None,
+                        'recent_hit_rate': round(recent, 3) if recent is not None else None,
+                    })
+            report[field] = {
+                'lookups': lookups,
+                'hits': hits,
+                'hit_rate': round(hits / lookups, 3) if lookups else None,
+                'variants': variants,
+            }
+        return report
+
+    def _load_stats(self):
+        if not self.stats_path or not os.path.exists(self.stats_path):
+            return
+        try:
+            with open(self.stats_path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        for field, data in saved.items():
+            if field not in self._specs:
+                continue
+            self._field_stats[field] = list(data.get('field', [0, 0]))
+            declared = set(self._specs[field]['variants'])
+            self._variant_stats[field] = {
+                variant: list(counts)
+                for variant, counts in data.get('variants', {}).items()
+                if variant in declared and len(counts) == 3
+            }
+
+    def save(self):
+        """Persist hit statistics to the stats file"""
+        if not self.stats_path:
+            return
+        with self._lock:
+            data = {
+                field: {
+                    'field': self._field_stats[field],
+                    'variants': self._variant_stats[field],
+                }
+                for field in self._specs
+            }
+        try:
+            directory = os.path.dirname(self.stats_path) or '.'
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.stats_path)
+        except OSError:
+            pass
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_selector_registry():
+    """Return the process-wide selector registry"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = SelectorRegistry()
+        return _registry
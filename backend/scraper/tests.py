@@ -0,0 +1,63 @@
+from unittest import TestCase, mock
+
+from benchmarks.replay_server import start_in_thread
+
+from . import circuit_breaker
+from .circuit_breaker import OPEN
+from .naukri_scraper import NaukriScraper
+from .selector_registry import SelectorRegistry
+
+SPECIFIC, LOOSE = SelectorRegistry(stats_path=None).spec('rating')['variants']
+
+
+class SelectorRegistryTests(TestCase):
+    """Selector validation and re-ordering"""
+
+    def test_values_must_match_the_field_pattern(self):
+        registry = SelectorRegistry(stats_path=None, explore_rate=0)
+        cards = {SPECIFIC: '4.1', LOOSE: 'Work with Python 3.11 and Django'}
+        self.assertEqual(registry.resolve('rating', cards.get, variants=[LOOSE, SPECIFIC]), (SPECIFIC, '4.1'))
+        self.assertEqual(registry.resolve('rating', {LOOSE: 'Hiring now...'}.get), (None, None))
+
+    def test_demoted_variant_recovers_through_exploration(self):
+        registry = SelectorRegistry(stats_path=None, explore_rate=1.0)
+        # The specific selector breaks for a while and the loose one takes over
+        for _ in range(30):
+            registry.resolve('rating', {LOOSE: '4.1'}.get)
+        self.assertEqual(registry.variants('rating')[0], LOOSE)
+        # Once it works again it is probed behind the loose one and wins back
+        for _ in range(40):
+            registry.resolve('rating', {SPECIFIC: '4.1', LOOSE: '4.1'}.get)
+        self.assertEqual(registry.variants('rating')[0], SPECIFIC)
+
+    def test_no_exploration_keeps_the_first_hit(self):
+        registry = SelectorRegistry(stats_path=None, explore_rate=0)
+        for _ in range(30):
+            registry.resolve('rating', {LOOSE: '4.1'}.get)
+        for _ in range(40):
+            registry.resolve('rating', {SPECIFIC: '4.1', LOOSE: '4.1'}.get)
+        self.assertEqual(registry.variants('rating')[0], LOOSE)
+
+
+class ApiCircuitBreakerTests(TestCase):
+    """The 'api' breaker around scrape_jobs_via_api"""
+
+    def setUp(self):
+        self.server, self.base_url = start_in_thread(port=0, quiet=True, error_rate=1.0, error_status=500)
+        self.addCleanup(self.server.shutdown)
+        breakers = mock.patch.dict(circuit_breaker._breakers, clear=True)
+        breakers.start()
+        self.addCleanup(breakers.stop)
+
+    def test_failing_api_opens_its_breaker(self):
+        scraper = NaukriScraper(base_url=self.base_url, browser=False)
+        for _ in range(circuit_breaker.BREAKER_FAILURE_THRESHOLD):
+            jobs, metadata = scraper.scrape_jobs_via_api('job', 'python developer', 'bangalore')
+            self.assertEqual(metadata['debug_info']['api_status_code'], 500)
+
+        jobs, metadata = scraper.scrape_jobs_via_api('job', 'python developer', 'bangalore')
+        debug_info = metadata['debug_info']
+        self.assertEqual(jobs, [])
+        self.assertFalse(debug_info['api_attempted'])
+        self.assertEqual(debug_info['api_circuit_breaker']['state'], OPEN)
+        self.assertEqual(debug_info['api_circuit_breaker']['total_short_circuits'], 1)
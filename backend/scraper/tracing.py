@@ -0,0 +1,84 @@
+"""
+Lightweight span timers for the scraping pipeline.
+
+A ``Tracer`` collects the milliseconds spent in each named stage of a
+request (driver init, navigation, container wait, API request, ...). The
+per-request breakdown is returned in ``debug_info.timings``; every finished
+span is also passed to the registered listeners, which by default feed a
+process-wide aggregate (count, total and max per stage).
+"""
+import threading
+import time
+from contextlib import contextmanager
+
+
+class Tracer:
+    """Accumulates per-stage durations (in milliseconds) for one request"""
+
+    def __init__(self):
+        self.timings = {}
+
+    @contextmanager
+    def span(self, name):
+        """Time the enclosed block and add it to the stage total"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, (time.perf_counter() - start) * 1000)
+
+    def add(self, name, milliseconds):
+        """Add a measured duration to a stage"""
+        self.timings[name] = round(self.timings.get(name, 0.0) + milliseconds, 1)
+        for listener in list(_listeners):
+            try:
+                listener(name, milliseconds)
+            except Exception:
+                pass
+
+    def as_dict(self):
+        """Return a copy of the stage timings, including their total"""
+        timings = dict(self.timings)
+        timings['total'] = round(sum(self.timings.values()), 1)
+        return timings
+
+
+class TimingAggregate:
+    """Process-wide count, total and max duration per stage"""
+
+    def __init__(self):
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, milliseconds):
+        with self._lock:
+            stats = self._stats.setdefault(name, {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+            stats['count'] += 1
+            stats['total_ms'] += milliseconds
+            stats['max_ms'] = max(stats['max_ms'], milliseconds)
+
+    def snapshot(self):
+        """Return count, total, mean and max milliseconds per stage"""
+        with self._lock:
+            return {
+                name: {
+                    'count': stats['count'],
+                    'total_ms': round(stats['total_ms'], 1),
+                    'mean_ms': round(stats['total_ms'] / stats['count'], 1),
+                    'max_ms': round(stats['max_ms'], 1),
+                }
+                for name, stats in self._stats.items()
+            }
+
+
+_listeners = []
+timing_aggregate = TimingAggregate()
+
+
+def add_timing_listener(listener):
+    """Register a callable(stage, milliseconds) called for every finished span"""
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+add_timing_listener(timing_aggregate.record)
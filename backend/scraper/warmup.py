@@ -0,0 +1,131 @@
+"""
+Worker warmup: pay the scraping cold start before serving traffic.
+
+``warmup_worker()`` imports the scraping engine and the batch normalizer
+(pandas), resolves chromedriver and fills the browser pool with headless
+browsers that have already loaded the naukri home page (so they hold its
+session cookies). It is called from the
+gunicorn ``post_worker_init`` hook (see ``gunicorn.conf.py``), which runs before the
+worker accepts requests, or in a background thread from
+``JobsConfig.ready`` when ``NAUKRI_WARMUP_ON_READY=true`` (e.g. under
+``runserver``). ``warmup_status()`` backs the ``/ready`` endpoint.
+
+Configuration (environment variables):
+    NAUKRI_BROWSER_POOL_SIZE   Browsers to start (default: 1; 0 skips browsers)
+    NAUKRI_WARMUP_ON_READY     Start warmup from AppConfig.ready (default: false)
+"""
+import importlib
+import os
+import threading
+import time
+import traceback
+from datetime import datetime
+
+
+NOT_STARTED = 'not_started'
+RUNNING = 'running'
+READY = 'ready'
+
+_state = {
+    'status': NOT_STARTED,
+    'pid': None,
+    'started_at': None,
+    'finished_at': None,
+    'steps': {},
+    'browsers': 0,
+    'errors': [],
+}
+_state_lock = threading.Lock()
+
+
+def _step(name, func):
+    """Run one warmup step, recording its duration and any error"""
+    start = time.perf_counter()
+    try:
+        return func()
+    except Exception as e:
+        traceback.print_exc()
+        with _state_lock:
+            _state['errors'].append(f"{name}: {e}"[:300])
+        return None
+    finally:
+        with _state_lock:
+            _state['steps'][name] = round((time.perf_counter() - start) * 1000, 1)
+
+
+def warmup_worker(pool_size=None, headless=True, base_url=None, log=print):
+    """
+    Import the scraping engine, resolve chromedriver and pre-start browsers
+
+    Failures are recorded but not raised: a worker whose browsers could not
+    start still serves requests (cold-starting Chrome or using the API).
+
+    Args:
+        pool_size: Browsers to start (default: NAUKRI_BROWSER_POOL_SIZE or 1)
+        headless: Whether to run the browsers headless
+        base_url: Site root the browsers will scrape
+        log: Callable receiving progress messages
+
+    Returns:
+        Warmup status dictionary (see warmup_status)
+    """
+    from .browser_pool import get_browser_pool
+    from .naukri_service import warmup as import_engine
+
+    pool = get_browser_pool()
+    if pool_size is not None:
+        pool.size = pool_size
+
+    with _state_lock:
+        _state.update(
+            status=RUNNING, pid=os.getpid(), started_at=datetime.now().isoformat(),
+            finished_at=None, steps={}, browsers=0, errors=[]
+        )
+
+    _step('engine_import', import_engine)
+    # pandas, for the batch normalization done when results are indexed
+    _step('normalizer_import', lambda: importlib.import_module('scraper.normalize'))
+    if pool.size > 0:
+        from .naukri_scraper import resolve_chromedriver
+
+        if _step('chromedriver', resolve_chromedriver):
+            _step('browsers', lambda: pool.fill(headless=headless, base_url=base_url, log=log))
+
+    with _state_lock:
+        _state.update(status=READY, finished_at=datetime.now().isoformat(), browsers=pool.idle_count())
+        status = dict(_state)
+
+    log(
+        f"Warmup finished in pid {status['pid']}: {status['browsers']} browser(s) ready, "
+        f"steps {status['steps']}" + (f", errors {status['errors']}" if status['errors'] else '')
+    )
+    return status
+
+
+def start_warmup_thread(**kwargs):
+    """Run warmup_worker on a daemon thread and return the thread"""
+    thread = threading.Thread(target=warmup_worker, kwargs=kwargs, name='naukri-warmup', daemon=True)
+    with _state_lock:
+        _state['status'] = RUNNING
+    thread.start()
+    return thread
+
+
+def warmup_status():
+    """
+    Return the warmup state of this process
+
+    Returns:
+        Dictionary with 'status' ('not_started', 'running' or 'ready'),
+        'ready', 'pid', 'started_at', 'finished_at', 'steps' (milliseconds
+        per step), 'browsers' (idle pooled browsers) and 'errors'
+    """
+    with _state_lock:
+        status = dict(_state)
+        status['steps'] = dict(_state['steps'])
+        status['errors'] = list(_state['errors'])
+    status['ready'] = status['status'] != RUNNING
+    if status['status'] == READY:
+        from .browser_pool import get_browser_pool
+        status['browsers'] = get_browser_pool().idle_count()
+    return status
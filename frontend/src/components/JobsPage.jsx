@@ -1,13 +1,22 @@
-import React, { useState, useMemo, useEffect } from 'react';
+import React, { useState, useEffect } from 'react';
 import { useLocation } from 'react-router-dom';
 import SearchForm from './SearchForm';
 import JobList from './JobList';
 import FilterSidebar from './FilterSidebar';
 import Pagination from './Pagination';
-import { searchJobs } from '../services/api';
+import { searchJobs, localSearch } from '../services/api';
 
 const STORAGE_KEY = 'jobSearchState';
 
+// Sidebar filter keys -> facet query parameters of /api/jobs/local-search/
+const FACET_PARAMS = {
+  department: 'department',
+  roleCategory: 'role_category',
+  stipend: 'stipend',
+  workMode: 'work_mode',
+  location: 'city'
+};
+
 const JobsPage = () => {
   const location = useLocation();
   const [jobs, setJobs] = useState([]);
@@ -18,6 +27,9 @@ const JobsPage = () => {
   const [currentPage, setCurrentPage] = useState(1);
   const [pagination, setPagination] = useState(null);
   const [searchParams, setSearchParams] = useState(null);
+  const [facets, setFacets] = useState(null);
+  // Server-side filtered results ({ jobs, pagination, facets }) while filters are active
+  const [filteredResult, setFilteredResult] = useState(null);
 
   // Restore state from location state (when coming back from job detail) or sessionStorage
   useEffect(() => {
@@ -30,6 +42,8 @@ const JobsPage = () => {
       setCurrentPage(restoredState.currentPage || 1);
       setPagination(restoredState.pagination || null);
       setSearchParams(restoredState.searchParams || null);
+      setFacets(restoredState.facets || null);
+      setFilteredResult(restoredState.filteredResult || null);
       setError(restoredState.error || null);
       
       // Clear the location state to prevent restoring again
@@ -57,6 +71,8 @@ const JobsPage = () => {
         setCurrentPage(parsedState.currentPage || 1);
         setPagination(parsedState.pagination || null);
         setSearchParams(parsedState.searchParams || null);
+        setFacets(parsedState.facets || null);
+        setFilteredResult(parsedState.filteredResult || null);
       }
     } catch (err) {
       // Error restoring state from sessionStorage
@@ -82,7 +98,9 @@ const JobsPage = () => {
         filters,
         currentPage,
         pagination,
-        searchParams
+        searchParams,
+        facets,
+        filteredResult
       };
       try {
         sessionStorage.setItem(STORAGE_KEY, JSON.stringify(stateToSave));
@@ -90,7 +108,7 @@ const JobsPage = () => {
         // Error saving state to sessionStorage
       }
     }
-  }, [jobs, hasSearched, filters, currentPage, pagination, searchParams]);
+  }, [jobs, hasSearched, filters, currentPage, pagination, searchParams, facets, filteredResult]);
 
   const handleSearch = async (params, page = 1) => {
     setLoading(true);
@@ -102,6 +120,7 @@ const JobsPage = () => {
     // Clear filters and pagination on new search (not when changing page)
     if (page === 1) {
       setFilters({});
+      setFilteredResult(null);
       // Clear saved state for new search
       try {
         sessionStorage.removeItem(STORAGE_KEY);
@@ -120,6 +139,7 @@ const JobsPage = () => {
           setJobs(data.jobs || []);
         }
         setPagination(data.pagination || null);
+        setFacets(data.facets || null);
         
         if (!data.jobs || data.jobs.length === 0) {
           setError(null);
@@ -139,130 +159,62 @@ const JobsPage = () => {
     }
   };
 
-  const handlePageChange = (newPage) => {
-    if (searchParams && !loading) {
-      window.scrollTo({ top: 0, behavior: 'smooth' });
-      handleSearch(searchParams, newPage);
-    }
-  };
-
-  // Filter jobs based on all selected filters
-  const filteredJobs = useMemo(() => {
-    const hasActiveFilters = Object.values(filters).some(arr => arr && arr.length > 0);
-    
-    if (!hasActiveFilters) {
-      return jobs;
+  // Filters run on the server, across every stored result of the search
+  const fetchFiltered = async (activeFilters, page = 1) => {
+    const hasActiveFilters = Object.values(activeFilters).some(arr => arr && arr.length > 0);
+    if (!hasActiveFilters || !searchParams) {
+      setFilteredResult(null);
+      return;
     }
-    
-    return jobs.filter(job => {
-      // Department filter
-      if (filters.department && filters.department.length > 0) {
-        const jobTitle = (job.job_title || '').toLowerCase();
-        const matchesDepartment = filters.department.some(dept => {
-          const deptLower = dept.toLowerCase();
-          if (deptLower.includes('engineering') && (jobTitle.includes('engineering') || jobTitle.includes('developer') || jobTitle.includes('software'))) return true;
-          if (deptLower.includes('marketing') && jobTitle.includes('marketing')) return true;
-          if (deptLower.includes('sales') && jobTitle.includes('sales')) return true;
-          if (deptLower.includes('design') && (jobTitle.includes('design') || jobTitle.includes('ui') || jobTitle.includes('ux'))) return true;
-          if (deptLower.includes('data') && (jobTitle.includes('data') || jobTitle.includes('analyst') || jobTitle.includes('science'))) return true;
-          if (deptLower.includes('hr') && jobTitle.includes('hr')) return true;
-          if (deptLower.includes('finance') && jobTitle.includes('finance')) return true;
-          if (deptLower.includes('operations') && jobTitle.includes('operations')) return true;
-          return false;
-        });
-        if (!matchesDepartment) return false;
-      }
 
-      // Role Category filter
-      if (filters.roleCategory && filters.roleCategory.length > 0) {
-        const tags = (job.tags || []).map(t => t.toLowerCase()).join(' ');
-        const jobTitle = (job.job_title || '').toLowerCase();
-        const matchesRole = filters.roleCategory.some(role => {
-          const roleLower = role.toLowerCase();
-          return tags.includes(roleLower) || jobTitle.includes(roleLower);
-        });
-        if (!matchesRole) return false;
-      }
-
-      // Stipend filter
-      if (filters.stipend && filters.stipend.length > 0) {
-        const salary = (job.salary || '').toLowerCase();
-        const matchesStipend = filters.stipend.some(stipend => {
-          if (stipend === 'Unpaid' && (salary.includes('unpaid') || salary.includes('no stipend') || salary === 'not disclosed')) return true;
-          if (stipend === '0-10k') {
-            const match = salary.match(/(\d+)\s*k|(\d+)\s*thousand/i);
-            if (match) {
-              const amount = parseInt(match[1] || match[2]);
-              return amount >= 0 && amount < 10;
-            }
-            return !salary.includes('lakh') && !salary.includes('lpa');
-          }
-          if (stipend === '10k-20k') {
-            const match = salary.match(/(\d+)\s*k|(\d+)\s*thousand/i);
-            if (match) {
-              const amount = parseInt(match[1] || match[2]);
-              return amount >= 10 && amount < 20;
-            }
-            return salary.includes('lakh') || salary.includes('lpa');
-          }
-          if (stipend === '20k-30k') {
-            const match = salary.match(/(\d+)\s*k|(\d+)\s*thousand/i);
-            if (match) {
-              const amount = parseInt(match[1] || match[2]);
-              return amount >= 20 && amount < 30;
-            }
-            return false;
-          }
-          if (stipend === '30k+') {
-            const match = salary.match(/(\d+)\s*k|(\d+)\s*thousand/i);
-            if (match) {
-              const amount = parseInt(match[1] || match[2]);
-              return amount >= 30;
-            }
-            return false;
-          }
-          return false;
-        });
-        if (!matchesStipend) return false;
+    const facetParams = {};
+    Object.entries(activeFilters).forEach(([key, values]) => {
+      if (FACET_PARAMS[key] && values && values.length > 0) {
+        facetParams[FACET_PARAMS[key]] = values;
       }
+    });
 
-      // Work Mode filter
-      if (filters.workMode && filters.workMode.length > 0) {
-        const location = (job.location || '').toLowerCase();
-        const description = (job.job_description || '').toLowerCase();
-        const matchesWorkMode = filters.workMode.some(mode => {
-          if (mode === 'Remote') {
-            return location.includes('remote') || location.includes('work from home') || location.includes('wfh') ||
-                   description.includes('remote') || description.includes('work from home') || description.includes('wfh');
-          }
-          if (mode === 'On-site') {
-            return !location.includes('remote') && !location.includes('work from home') && !location.includes('wfh') &&
-                   !description.includes('remote') && !description.includes('work from home') && !description.includes('wfh');
-          }
-          if (mode === 'Hybrid') {
-            return description.includes('hybrid');
-          }
-          return false;
+    setLoading(true);
+    try {
+      const data = await localSearch({ ...searchParams, ...facetParams, page });
+      if (data.success) {
+        setFilteredResult({
+          jobs: data.jobs || [],
+          pagination: data.pagination || null,
+          facets: data.facets || null
         });
-        if (!matchesWorkMode) return false;
+        setError(null);
+      } else {
+        setError(data.message || data.error || 'An error occurred while filtering jobs');
       }
+    } catch (err) {
+      setError(err.message || err.error || 'Failed to filter jobs. Please make sure the backend is running.');
+    } finally {
+      setLoading(false);
+    }
+  };
 
+  const handleFilterChange = (newFilters) => {
+    setFilters(newFilters);
+    fetchFiltered(newFilters, 1);
+  };
 
-      // Location filter
-      if (filters.location && filters.location.length > 0) {
-        const jobLocations = (job.location || '').split(',').map(loc => loc.trim());
-        const matchesLocation = filters.location.some(filterLoc => {
-          return jobLocations.some(jobLoc => 
-            jobLoc.toLowerCase().includes(filterLoc.toLowerCase()) || 
-            filterLoc.toLowerCase().includes(jobLoc.toLowerCase())
-      );
-        });
-        if (!matchesLocation) return false;
+  const handlePageChange = (newPage) => {
+    if (searchParams && !loading) {
+      window.scrollTo({ top: 0, behavior: 'smooth' });
+      if (filteredResult) {
+        fetchFiltered(filters, newPage);
+      } else {
+        handleSearch(searchParams, newPage);
       }
+    }
+  };
 
-      return true;
-    });
-  }, [jobs, filters]);
+  const displayedJobs = filteredResult ? filteredResult.jobs : jobs;
+  const displayedPagination = filteredResult ? filteredResult.pagination : pagination;
+  const totalCount = filteredResult && filteredResult.pagination?.total_jobs
+    ? filteredResult.pagination.total_jobs
+    : jobs.length;
 
   return (
     <>
@@ -286,31 +238,34 @@ const JobsPage = () => {
           {jobs.length > 0 && (
             <FilterSidebar 
               jobs={jobs} 
+              facets={(filteredResult && filteredResult.facets) || facets}
               filters={filters}
-              onFilterChange={setFilters}
+              onFilterChange={handleFilterChange}
             />
           )}
           <div style={{ flex: 1 }}>
             <JobList 
-              jobs={filteredJobs} 
+              jobs={displayedJobs} 
               loading={loading} 
               hasSearched={hasSearched}
-              totalCount={jobs.length}
+              totalCount={totalCount}
               searchState={{
                 jobs,
                 hasSearched,
                 filters,
                 currentPage,
                 pagination,
-                searchParams
+                searchParams,
+                facets,
+                filteredResult
               }}
             />
             
-            {pagination && jobs.length > 0 && (
+            {displayedPagination && displayedJobs.length > 0 && (
               <Pagination
-                currentPage={pagination.current_page}
-                hasNext={pagination.has_next}
-                hasPrevious={pagination.has_previous}
+                currentPage={displayedPagination.current_page}
+                hasNext={displayedPagination.has_next}
+                hasPrevious={displayedPagination.has_previous}
                 onPageChange={handlePageChange}
                 loading={loading}
               />
@@ -18,7 +18,26 @@ export const searchJobs = async (params) => {
       page_size: params.page_size || 20
     };
     
-    const response = await api.post('/api/jobs/search/', requestParams);
+    // GET so the browser cache can revalidate with If-None-Match (304, no re-scrape)
+    const response = await api.get('/api/jobs/search/', { params: requestParams });
+    return response.data;
+  } catch (error) {
+    throw error.response?.data || { message: 'Network error. Please check if the backend is running.' };
+  }
+};
+
+// Search jobs already scraped, with facet filters applied across every stored result
+export const localSearch = async (params) => {
+  try {
+    const response = await api.get('/api/jobs/local-search/', {
+      params: {
+        ...params,
+        page: params.page || 1,
+        page_size: params.page_size || 20
+      },
+      // Repeat array params (work_mode=Remote&work_mode=Hybrid) as Django expects
+      paramsSerializer: { indexes: null }
+    });
     return response.data;
   } catch (error) {
     throw error.response?.data || { message: 'Network error. Please check if the backend is running.' };
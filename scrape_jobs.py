@@ -3,7 +3,10 @@
 Standalone Naukri.com Job Scraper
 
 This script scrapes job listings from Naukri.com based on search criteria
-and saves the results to a JSON file.
+and saves the results to a JSON file, streams them to a JSON Lines file,
+or writes them to a Parquet file. Scraping goes through the backend's
+scraper.naukri_service, so the CLI and the API share one scraping engine
+(browser pool, API fallback, rate limiting, circuit breaker, selectors).
 
 Usage:
     python scrape_jobs.py --job-type job --designation "software engineer" --location "bangalore" --experience 2
@@ -11,861 +14,608 @@ Usage:
     python scrape_jobs.py -t internship -d "data science" -l "mumbai" -e 0
     
     python scrape_jobs.py --job-type job --designation "python developer" --location "delhi" --output my_jobs.json
+    
+    python scrape_jobs.py --queries queries.csv --workers 4 --pages 10
 
 Arguments:
-    --job-type, -t:     Type of job ('job' or 'internship') [required]
-    --designation, -d:   Job keyword/designation [required]
-    --location, -l:      City or state [required]
+    --job-type, -t:     Type of job ('job' or 'internship') [required without --queries]
+    --designation, -d:   Job keyword/designation [required without --queries]
+    --location, -l:      City or state [required without --queries]
     --experience, -e:    Years of experience (optional)
-    --output, -o:        Output JSON filename (optional, default: jobs_<timestamp>.json)
+    --output, -o:        Output filename (optional, default: jobs_<timestamp>.json/.jsonl[.gz]/.parquet)
     --headless:          Run browser in headless mode (default: True)
+    --queries, -q:       Bulk mode: CSV/YAML file of searches, crawled in parallel
+    --workers, -w:       Bulk mode: worker processes, one browser each (default: 2)
+    --engine:            browser (default; results page, API fallback) or api (JSON API first)
+    --details:           Also scrape every listing's details page
+    --base-url:          Site root to scrape instead of naukri.com (e.g. a replay server)
+    --pages, -p:         Bulk mode: result pages per query (default: 5)
+    --format, -f:        json (default), jsonl (streamed as listings are scraped) or parquet
+    --gzip:              Gzip JSON Lines output on the fly
+    --checkpoint:        Bulk mode: progress journal (default: <output>.checkpoint)
+    --resume:            Bulk mode: continue an interrupted crawl from its checkpoint
 """
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
 import time
-import urllib.parse
 import os
-import shutil
-import requests
 import json
-import random
-import string
 import argparse
+import csv
+import multiprocessing
+import multiprocessing.util
+import queue
 import sys
 from datetime import datetime
 
+# Scraping is done by the backend's scraper package, the same code the API uses
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+from scraper.browser_pool import get_browser_pool  # noqa: E402
+from scraper.dedup import SeenStore, dedup_key, dedupe  # noqa: E402
+from scraper.checkpoint import CrawlJournal  # noqa: E402
+from scraper.export import DETAIL_FIELDS, JSONLWriter, ParquetWriter, read_jsonl, repair_jsonl  # noqa: E402
+from scraper.naukri_service import get_naukri_data  # noqa: E402
+from scraper.records import Job, encode_job  # noqa: E402
+
+
+# Listings per result page, as in the API's default page size
+PAGE_SIZE = 20
+
+# Bulk mode: scrape settings of this worker process (see _init_worker)
+_worker_settings = {'headless': True, 'engine': 'browser', 'base_url': None}
 
-class NaukriScraper:
-    """Scraper for naukri.com job listings"""
+
+def load_queries(path, defaults):
+    """
+    Read the searches of a bulk crawl from a CSV or YAML file
     
-    def __init__(self, headless=True):
-        """Initialize the scraper with Chrome WebDriver"""
-        chrome_options = Options()
-        if headless:
-            chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--remote-debugging-port=9222')
-        chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-        
-        # Initialize ChromeDriver with better error handling
+    CSV files need a header row; YAML files hold a list of mappings (or a
+    mapping with a 'queries' list). Recognized columns/keys are designation
+    (or keyword), location, job_type, experience and pages; missing values
+    come from ``defaults``.
+    
+    Args:
+        path: .csv, .yaml or .yml file
+        defaults: Dict with 'job_type', 'location', 'experience' and 'pages'
+    
+    Returns:
+        List of query dicts with job_type, designation, location, experience and pages
+    """
+    if path.lower().endswith(('.yaml', '.yml')):
         try:
-            # Clear cache and get fresh driver
-            driver_cache_path = os.path.expanduser('~/.wdm/drivers/chromedriver')
-            if os.path.exists(driver_cache_path):
-                try:
-                    shutil.rmtree(driver_cache_path)
-                except Exception as e:
-                    pass
-            
-            # Install ChromeDriver
-            initial_path = ChromeDriverManager().install()
-            
-            # ChromeDriverManager sometimes returns wrong file (like THIRD_PARTY_NOTICES.chromedriver)
-            # Always search for the actual chromedriver executable
-            driver_dir = os.path.dirname(initial_path)
-            driver_path = None
-            
-            # Helper function to check if a path is the actual chromedriver executable
-            def is_valid_chromedriver(path):
-                if not os.path.exists(path):
-                    return False
-                # Check if it's a text file (wrong file)
-                if 'THIRD_PARTY' in path or 'LICENSE' in path or 'NOTICES' in path:
-                    return False
-                # Check file size (chromedriver is > 10MB, text files are < 1MB)
-                try:
-                    size = os.path.getsize(path)
-                    if size < 1000000:  # Less than 1MB is likely not the executable
-                        return False
-                    # Check if it's actually a binary file (not a text file)
-                    with open(path, 'rb') as f:
-                        first_bytes = f.read(4)
-                        # Text files start with readable ASCII, binaries don't
-                        if first_bytes.startswith(b'#!/') or first_bytes.startswith(b'# '):
-                            # Could be a shell script, check more
-                            if b'THIRD_PARTY' in f.read(100):
-                                return False
-                    return os.path.isfile(path)
-                except:
-                    return False
-            
-            # First, check if the returned path is correct
-            if is_valid_chromedriver(initial_path):
-                driver_path = initial_path
-            else:
-                # Search in the same directory as the returned path
-                same_dir_path = os.path.join(driver_dir, 'chromedriver')
-                if is_valid_chromedriver(same_dir_path):
-                    driver_path = same_dir_path
-                else:
-                    # Search in subdirectories (common on macOS ARM64)
-                    if os.path.exists(driver_dir):
-                        # Check immediate subdirectories first
-                        for item in os.listdir(driver_dir):
-                            item_path = os.path.join(driver_dir, item)
-                            if os.path.isdir(item_path):
-                                # Check for chromedriver in this subdirectory
-                                chromedriver_path = os.path.join(item_path, 'chromedriver')
-                                if is_valid_chromedriver(chromedriver_path):
-                                    driver_path = chromedriver_path
-                                    break
-                                # Also check nested subdirectories (macOS ARM64 structure)
-                                for subitem in os.listdir(item_path):
-                                    subitem_path = os.path.join(item_path, subitem)
-                                    if os.path.isdir(subitem_path):
-                                        nested_chromedriver = os.path.join(subitem_path, 'chromedriver')
-                                        if is_valid_chromedriver(nested_chromedriver):
-                                            driver_path = nested_chromedriver
-                                            break
-                                    elif subitem == 'chromedriver':
-                                        if is_valid_chromedriver(subitem_path):
-                                            driver_path = subitem_path
-                                            break
-                                if driver_path:
-                                    break
-                    
-                    # If still not found, do recursive search
-                    if not driver_path and os.path.exists(driver_cache_path):
-                        def find_chromedriver_recursive(directory):
-                            for root, dirs, files in os.walk(directory):
-                                for file in files:
-                                    if file == 'chromedriver' and 'THIRD_PARTY' not in root and 'LICENSE' not in root:
-                                        full_path = os.path.join(root, file)
-                                        if is_valid_chromedriver(full_path):
-                                            return full_path
-                            return None
-                        
-                        driver_path = find_chromedriver_recursive(driver_cache_path)
-            
-            if not driver_path:
-                raise Exception(f"Could not find valid chromedriver executable. Searched in: {driver_dir}")
-            
-            # Verify the driver path exists and make it executable if needed
-            if not os.path.exists(driver_path):
-                raise Exception(f"ChromeDriver not found at {driver_path}")
-            
-            # Ensure it's executable
-            if not os.access(driver_path, os.X_OK):
-                try:
-                    os.chmod(driver_path, 0o755)
-                except Exception as e:
-                    pass
-            
-            # Add additional Chrome options to help with connection issues
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('--remote-debugging-port=9222')
-            
-            service = Service(driver_path)
-            try:
-                self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            except Exception as chrome_error:
-                # If connection fails, try with additional options
-                if 'unable to connect to renderer' in str(chrome_error).lower():
-                    chrome_options.add_argument('--disable-software-rasterizer')
-                    chrome_options.add_argument('--disable-extensions')
-                    self.driver = webdriver.Chrome(service=service, options=chrome_options)
-                else:
-                    raise
-            self.driver.set_page_load_timeout(30)  # 30 second timeout
-            self.wait = WebDriverWait(self.driver, 20)
-            
-        except Exception as e:
-            import traceback
-            traceback.print_exc()
-            raise Exception(f"Failed to initialize ChromeDriver. Make sure Chrome browser is installed. Error: {str(e)}")
+            import yaml
+        except ImportError:
+            raise Exception("Reading YAML query files requires PyYAML (pip install pyyaml)")
+        with open(path, encoding='utf-8') as f:
+            rows = yaml.safe_load(f) or []
+        if isinstance(rows, dict):
+            rows = rows.get('queries') or []
+    else:
+        with open(path, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
     
-    def build_url(self, job_type, keyword, location, experience=None):
-        """
-        Build Naukri.com search URL from parameters
-        
-        Args:
-            job_type: 'job' or 'internship'
-            keyword: Job search keyword
-            location: Job location
-            experience: Years of experience (optional)
-        
-        Returns:
-            Complete URL string
-        """
-        # Format keyword for URL (lowercase, replace spaces with hyphens)
-        keyword_formatted = keyword.lower().replace(' ', '-')
-        location_formatted = location.lower().replace(' ', '-')
-        
-        # Build base URL - correct format for internships
-        if job_type.lower() == 'internship':
-            base_url = f"https://www.naukri.com/{keyword_formatted}-internship-jobs-in-{location_formatted}"
+    queries = []
+    for number, row in enumerate(rows, start=1):
+        row = {str(key).strip().lower(): value for key, value in (row or {}).items() if value not in (None, '')}
+        designation = str(row.get('designation') or row.get('keyword') or '').strip()
+        location = str(row.get('location') or defaults['location'] or '').strip()
+        if not designation or not location:
+            raise Exception(f"Query {number} in {path} needs a designation and a location")
+        job_type = str(row.get('job_type') or defaults['job_type'] or 'job').strip().lower()
+        if job_type not in ('job', 'internship'):
+            raise Exception(f"Query {number} in {path}: job_type must be 'job' or 'internship'")
+        experience = row.get('experience', defaults['experience'])
+        queries.append({
+            'job_type': job_type,
+            'designation': designation,
+            'location': location,
+            'experience': int(experience) if experience is not None else None,
+            'pages': int(row.get('pages') or defaults['pages']),
+        })
+    return queries
+
+
+def search_page(query, page, headless=True, engine='browser', base_url=None):
+    """
+    Scrape one result page of a query through scraper.naukri_service
+    
+    Args:
+        query: Query dict with job_type, designation, location and experience
+        page: Page number
+        headless: Whether to run the browser headless
+        engine: 'browser' (results page, API fallback) or 'api' (API first)
+        base_url: Site root to scrape instead of naukri.com
+    
+    Returns:
+        Dict with jobs, has_next, data source, metadata, error and elapsed seconds
+    """
+    started = time.perf_counter()
+    result = get_naukri_data(
+        task_type='search',
+        job_type=query['job_type'],
+        keyword=query['designation'],
+        location=query['location'],
+        experience=query['experience'],
+        page=page,
+        page_size=PAGE_SIZE,
+        headless=headless,
+        base_url=base_url,
+        engine=engine
+    )
+    metadata = result.get('metadata', {})
+    return {
+        'jobs': result.get('jobs') or [],
+        'has_next': result.get('pagination', {}).get('has_next', False),
+        'source': metadata.get('data_source'),
+        'metadata': metadata,
+        'error': None if result.get('success') else (result.get('message') or result.get('error')),
+        'elapsed': time.perf_counter() - started,
+    }
+
+
+def scrape_details(job, headless=True, base_url=None):
+    """
+    Fetch the details page of a listing through scraper.naukri_service
+    
+    Returns:
+        The listing as a dict with the page's fields under 'details' (None
+        if the listing has no URL or the page could not be scraped)
+    """
+    record = job.to_dict() if isinstance(job, Job) else dict(job)
+    record['details'] = None
+    if record.get('job_url'):
+        result = get_naukri_data(task_type='details', job_url=record['job_url'], headless=headless, base_url=base_url)
+        if result.get('success'):
+            record['details'] = result['job_details']
+    return record
+
+
+def _init_worker(ports, settings):
+    """Pool initializer: claim a debugging port and store the scrape settings"""
+    port = ports.get()
+    if port is not None:
+        os.environ['NAUKRI_DEBUGGING_PORT'] = str(port)
+    _worker_settings.update(settings)
+    # The worker's browser stays in the backend's browser pool between pages;
+    # pool workers do not run atexit handlers, so close it on exit here
+    multiprocessing.util.Finalize(None, get_browser_pool().close_all, exitpriority=16)
+
+
+def crawl_page(query_id, query, page):
+    """
+    Scrape one result page of a query (runs in a worker)
+    
+    Returns:
+        Dict with kind 'page', query_id, page, jobs, has_next, data source,
+        error and elapsed seconds
+    """
+    result = search_page(query, page, **_worker_settings)
+    del result['metadata']
+    return {'kind': 'page', 'query_id': query_id, 'page': page, **result}
+
+
+def crawl_details(query_id, job):
+    """
+    Fetch the details page of one listing (runs in a worker)
+    
+    Returns:
+        Dict with kind 'details', query_id, the listing with its details and elapsed seconds
+    """
+    started = time.perf_counter()
+    record = scrape_details(job, headless=_worker_settings['headless'], base_url=_worker_settings['base_url'])
+    return {'kind': 'details', 'query_id': query_id, 'record': record, 'elapsed': time.perf_counter() - started}
+
+
+def _format_duration(seconds):
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}"
+
+
+class JobOutput:
+    """
+    Destination of a run's listings
+    
+    'json' collects the listings and writes one document at the end. 'jsonl'
+    streams every listing to a JSON Lines file (gzip-compressed for .gz
+    paths) as soon as it arrives; 'parquet' writes them to a Parquet file in
+    row groups. Both write the run's parameters and statistics to
+    <output>.meta.json when the run ends. With append, JSON Lines output is
+    added to an existing file (a resumed crawl).
+    """
+    
+    def __init__(self, path, output_format='json', compress=None, job_type=None, append=False):
+        self.path = path
+        self.format = output_format
+        self.count = 0
+        self._jobs = []
+        if output_format == 'jsonl':
+            self._writer = JSONLWriter(path, compress=compress, append=append)
+        elif output_format == 'parquet':
+            self._writer = ParquetWriter(path, row_group_size=10000, job_type=job_type)
         else:
-            base_url = f"https://www.naukri.com/{keyword_formatted}-jobs-in-{location_formatted}"
-        
-        # Add query parameters
-        params = {
-            'k': keyword,
-            'l': location
-        }
-        
-        if experience is not None:
-            params['experience'] = experience
-        
-        # Add internship-specific parameters
-        if job_type.lower() == 'internship':
-            params['qproductJobSource'] = '2'
-            params['qinternshipFlag'] = 'true'
-            params['naukriCampus'] = 'true'
-        
-        query_string = urllib.parse.urlencode(params)
-        full_url = f"{base_url}?{query_string}"
-        
-        return full_url
+            self._writer = None
     
-    def scrape_jobs(self, job_type, keyword, location, experience=None, max_jobs=20, page=1):
+    @property
+    def meta_path(self):
+        return f"{self.path}.meta.json" if self._writer else self.path
+    
+    def add(self, jobs, job_type=None):
         """
-        Scrape jobs from Naukri.com
-        
-        Args:
-            job_type: 'job' or 'internship'
-            keyword: Job search keyword
-            location: Job location
-            experience: Years of experience (optional)
-            max_jobs: Maximum number of jobs to scrape
-            page: Page number for pagination (default: 1)
+        Add listings (Job records, or dicts with a 'details' entry)
         
-        Returns:
-            Tuple of (list of job dictionaries, metadata dict with 'source' and 'debug_info')
+        In Parquet output, job_type is recorded (listings do not carry it)
+        and the details-page fields get their own columns.
         """
-        # For web scraping, append page number to URL if page > 1
-        if page > 1:
-            url = self.build_url(job_type, keyword, location, experience) + f"&page={page}"
+        if self.format == 'parquet':
+            jobs = [self._parquet_record(job, job_type) for job in jobs]
+        if self._writer:
+            self._writer.write_many(jobs)
         else:
-            url = self.build_url(job_type, keyword, location, experience)
-        
-        metadata = {
-            'source': 'scraping',
-            'debug_info': {
-                'scraping_attempted': True,
-                'scraping_success': False,
-                'api_fallback_used': False,
-                'scraping_errors': [],
-                'api_errors': []
-            }
-        }
-        
-        try:
-            self.driver.get(url)
-            # Reduced initial wait time - wait for specific element instead
-            time.sleep(2)  # Reduced from 5 seconds
-            
-            # Handle popups or modals if they appear (non-blocking)
-            try:
-                popup_selectors = [
-                    "//button[contains(text(), 'Close')]",
-                    "//button[contains(text(), 'Skip')]",
-                    "//span[contains(@class, 'close')]",
-                    "//div[contains(@class, 'closeIcon')]"
-                ]
-                for selector in popup_selectors:
-                    try:
-                        popup = self.driver.find_element(By.XPATH, selector)
-                        if popup and popup.is_displayed():
-                            popup.click()
-                            time.sleep(0.5)
-                            break
-                    except:
-                        continue
-            except:
-                pass  # No popup found
-            
-            # Wait for job cards container to load with reduced timeout
-            container_xpaths = [
-                "/html/body/div[1]/div/main/div[1]/div[2]/div[2]/div/div[1]",
-                "//div[contains(@class, 'srp-jobtuple-wrapper')]",
-                "//div[contains(@class, 'jobTuple')]"
-            ]
-            
-            container_found = False
-            short_wait = WebDriverWait(self.driver, 5)  # Reduced from 20 seconds
-            for xpath in container_xpaths:
-                try:
-                    short_wait.until(
-                        EC.presence_of_element_located((By.XPATH, xpath))
-                    )
-                    container_found = True
-                    break
-                except:
-                    continue
-            
-            if not container_found:
-                error_msg = "Job cards container not found - scraping failed"
-                metadata['debug_info']['scraping_errors'].append(error_msg)
-                # Try API fallback
-                api_jobs, api_metadata = self.scrape_jobs_via_api(job_type, keyword, location, experience, max_jobs)
-                if api_jobs and len(api_jobs) > 0:
-                    metadata['source'] = 'api_fallback'
-                    metadata['debug_info']['api_fallback_used'] = True
-                    metadata['debug_info'].update(api_metadata.get('debug_info', {}))
-                    return api_jobs, metadata
-                return [], metadata
-            
-            # Quick scroll to load content (no wait needed)
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)  # Reduced from 3 seconds
-            
-            jobs = []
-            card_index = 1
-            
-            # Extract job cards using the provided XPath structure
-            while len(jobs) < max_jobs:
-                card_xpath = f"/html/body/div[1]/div/main/div[1]/div[2]/div[2]/div/div[1]/div[{card_index}]"
-                
-                try:
-                    card_element = self.driver.find_element(By.XPATH, card_xpath)
-                    
-                    job_data = self._extract_job_data(card_element, card_index)
-                    
-                    if job_data and job_data.get('job_title'):  # Only add if we got valid data
-                        jobs.append(job_data)
-                    
-                    card_index += 1
-                except Exception as e:
-                    # Try alternative XPath or move to next
-                    try:
-                        alt_xpath = f"/html/body/div[1]/div/main/div[1]/div[2]/div[2]/div/div[{card_index}]/div"
-                        card_element = self.driver.find_element(By.XPATH, alt_xpath)
-                        job_data = self._extract_job_data(card_element, card_index)
-                        if job_data and job_data.get('job_title'):
-                            jobs.append(job_data)
-                        card_index += 1
-                    except:
-                        # No more cards found
-                        if card_index > 10:  # Safety check
-                            break
-                        card_index += 1
-                        if card_index > 50:  # Safety limit
-                            break
-            
-            # Mark scraping as successful if we got jobs
-            if len(jobs) > 0:
-                metadata['debug_info']['scraping_success'] = True
-                return jobs, metadata
-            
-            # If scraping returned no jobs, try API fallback
-            metadata['debug_info']['scraping_errors'].append("No jobs found in scraping results")
-            api_jobs, api_metadata = self.scrape_jobs_via_api(job_type, keyword, location, experience, max_jobs, page)
-            if api_jobs and len(api_jobs) > 0:
-                metadata['source'] = 'api_fallback'
-                metadata['debug_info']['api_fallback_used'] = True
-                metadata['debug_info'].update(api_metadata.get('debug_info', {}))
-                return api_jobs, metadata
-            return jobs, metadata
-            
-        except Exception as e:
-            error_msg = f"Error scraping jobs: {str(e)}"
-            import traceback
-            traceback.print_exc()
-            metadata['debug_info']['scraping_errors'].append(error_msg)
-            
-            # Try API as fallback even on error
-            try:
-                api_jobs, api_metadata = self.scrape_jobs_via_api(job_type, keyword, location, experience, max_jobs, page)
-                if api_jobs and len(api_jobs) > 0:
-                    metadata['source'] = 'api_fallback'
-                    metadata['debug_info']['api_fallback_used'] = True
-                    metadata['debug_info'].update(api_metadata.get('debug_info', {}))
-                    return api_jobs, metadata
-            except Exception as api_error:
-                api_error_msg = f"API fallback also failed: {str(api_error)}"
-                metadata['debug_info']['api_errors'].append(api_error_msg)
-            
-            return [], metadata
+            self._jobs.extend(jobs)
+        self.count += len(jobs)
     
-    def build_api_url(self, job_type, keyword, location, experience=None, page_no=1):
-        """
-        Build Naukri.com API URL from parameters
-        
-        Args:
-            job_type: 'job' or 'internship'
-            keyword: Job search keyword
-            location: Job location
-            experience: Years of experience (optional)
-            page_no: Page number for pagination
-        
-        Returns:
-            Complete API URL string
-        """
-        keyword_formatted = keyword.lower().replace(' ', '-')
-        
-        # Build seoKey for the URL
-        if job_type.lower() == 'internship':
-            seo_key = f"{keyword_formatted}-internship-jobs"
+    @staticmethod
+    def _parquet_record(job, job_type):
+        record = job.to_dict() if isinstance(job, Job) else dict(job)
+        details = record.pop('details', None) or {}
+        record.update((field, details[field]) for field in DETAIL_FIELDS if field in details)
+        if job_type:
+            record['job_type'] = job_type
+        return record
+    
+    def flush(self):
+        """Push streamed JSON Lines to disk (Parquet and JSON are written when the run ends)"""
+        if self.format == 'jsonl':
+            self._writer.flush()
+    
+    def finish(self, search_params, metadata):
+        """Close the output and write the run's parameters and statistics"""
+        results = {'count': self.count}
+        if self._writer:
+            self._writer.close()
+            results['jobs_file'] = self.path
         else:
-            seo_key = f"{keyword_formatted}-jobs"
-        
-        # Build API URL parameters
-        params = {
-            'noOfResults': 20,
-            'urlType': 'search_by_keyword',
-            'searchType': 'adv',
-            'keyword': keyword,
-            'sort': 'p',
-            'pageNo': page_no,
-            'k': keyword,
-            'src': 'jobsearchDesk',
-            'seoKey': seo_key
+            results['jobs'] = self._jobs
+        results['metadata'] = metadata
+        with open(self.meta_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'search_params': search_params,
+                'results': results,
+                'timestamp': datetime.now().isoformat()
+            }, f, indent=2, ensure_ascii=False, default=encode_job)
+    
+    def close(self):
+        """Close without writing statistics (the streamed listings are kept)"""
+        if self._writer:
+            self._writer.close()
+
+
+def default_output_file(args):
+    """Output filename of a run: --output, or jobs_<timestamp> with the format's extension"""
+    if args.output:
+        return args.output
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    extension = '.jsonl.gz' if args.gzip else f".{args.format}"
+    return f"jobs_{timestamp}{extension}"
+
+
+def _remove_journal(path):
+    for suffix in ('', '-wal', '-shm'):
+        try:
+            os.remove(path + suffix)
+        except OSError:
+            pass
+
+
+def run_bulk(args):
+    """
+    Crawl every query of args.queries in parallel into one deduplicated output
+    
+    Pages are the unit of work: a query's next page is queued when the
+    service reports another page and the previous one had new listings, and
+    every page's listings are handed to the output as soon as it is done.
+    With details, every new listing's details page is queued as a task of
+    its own and the listing is written once it is fetched. Progress is
+    committed to a checkpoint journal after every page and details page;
+    with args.resume the crawl continues from the journal instead of
+    starting over.
+    
+    Returns:
+        Process exit code (1 if every query failed)
+    """
+    checkpoint_path = args.checkpoint or f"{args.output}.checkpoint"
+    if args.resume:
+        journal = CrawlJournal(checkpoint_path)
+        if not journal.started:
+            raise Exception(f"Checkpoint {checkpoint_path} holds no crawl")
+        settings = journal.settings()
+        journal_queries = journal.queries()
+        queries = [query for query, _, _, _ in journal_queries]
+    else:
+        queries = load_queries(args.queries, {
+            'job_type': args.job_type,
+            'location': args.location,
+            'experience': args.experience,
+            'pages': args.pages,
+        })
+        output_file = default_output_file(args)
+        checkpoint_path = args.checkpoint or f"{output_file}.checkpoint"
+        settings = {
+            'output': output_file,
+            'format': args.format,
+            'gzip': args.gzip,
+            'queries_file': args.queries,
+            'seen_db': args.seen_db,
+            'engine': args.engine,
+            'base_url': args.base_url,
+            'details': args.details,
         }
-        
-        if experience is not None:
-            params['experience'] = experience
-        
-        # Add internship-specific parameters
-        if job_type.lower() == 'internship':
-            params['qproductJobSource'] = '2'
-            params['qinternshipFlag'] = 'true'
-            params['naukriCampus'] = 'true'
-        
-        # Generate a session ID (random)
-        params['sid'] = ''.join(random.choices(string.digits, k=16))
-        
-        query_string = urllib.parse.urlencode(params)
-        api_url = f"https://www.naukri.com/jobapi/v3/search?{query_string}"
-        
-        return api_url
+        journal = CrawlJournal(checkpoint_path)
+        journal.start(settings, queries)
+        journal_queries = [(query, 0, False, None) for query in queries]
     
-    def scrape_jobs_via_api(self, job_type, keyword, location, experience=None, max_jobs=20, page=1):
-        """
-        Scrape jobs using Naukri.com API endpoint (fallback method)
-        Uses cookies from Selenium session if available
-        
-        Args:
-            job_type: 'job' or 'internship'
-            keyword: Job search keyword
-            location: Job location
-            experience: Years of experience (optional)
-            max_jobs: Maximum number of jobs to scrape
-            page: Page number for pagination (default: 1)
-        
-        Returns:
-            Tuple of (list of job dictionaries, metadata dict with 'source' and 'debug_info')
-        """
-        metadata = {
-            'source': 'api',
-            'debug_info': {
-                'api_attempted': True,
-                'api_success': False,
-                'api_url': '',
-                'api_status_code': None,
-                'api_response_jobs_count': 0,
-                'current_page': page
-            }
+    output_file = settings['output']
+    output_format = settings['format']
+    seen_db = settings['seen_db']
+    with_details = settings.get('details', False)
+    worker_settings = {
+        'headless': args.headless,
+        'engine': settings.get('engine', 'browser'),
+        'base_url': settings.get('base_url'),
+    }
+    
+    # Restore progress; a fresh crawl starts every query at page 1
+    keys = journal.seen_keys()
+    query_stats = [
+        stats or {
+            **query, 'pages_scraped': 0, 'scraped': 0, 'count': 0, 'details': 0,
+            'sources': [], 'error': None, 'seconds': 0.0
         }
-        
-        try:
-            api_url = self.build_api_url(job_type, keyword, location, experience, page)
-            metadata['debug_info']['api_url'] = api_url
-            
-            # Prepare headers - minimal set that might work
-            headers = {
-                'accept': 'application/json',
-                'accept-language': 'en-US,en;q=0.9',
-                'appid': '109',
-                'clientid': 'd3skt0p',
-                'content-type': 'application/json',
-                'systemid': 'Naukri',
-                'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36',
-                'referer': self.build_url(job_type, keyword, location, experience),
-            }
-            
-            # Try to get cookies from Selenium session if driver exists
-            cookies = {}
-            if hasattr(self, 'driver') and self.driver:
-                try:
-                    selenium_cookies = self.driver.get_cookies()
-                    for cookie in selenium_cookies:
-                        cookies[cookie['name']] = cookie['value']
-                except:
-                    pass
-            
-            # Make API request with cookies
-            session = requests.Session()
-            if cookies:
-                session.cookies.update(cookies)
-            
-            response = session.get(api_url, headers=headers, timeout=10)
-            metadata['debug_info']['api_status_code'] = response.status_code
-            
-            if response.status_code == 200:
-                data = response.json()
-                no_of_jobs = data.get('noOfJobs', 0)
-                metadata['debug_info']['api_response_jobs_count'] = no_of_jobs
-                metadata['debug_info']['total_jobs_available'] = no_of_jobs
-                
-                # Try different possible field names for job data
-                job_data_list = None
-                
-                # Check common field names
-                for field_name in ['jobDetails', 'jobDetailsList', 'jobs', 'results', 'data']:
-                    if field_name in data and isinstance(data[field_name], list) and len(data[field_name]) > 0:
-                        job_data_list = data[field_name]
-                        break
-                
-                if job_data_list:
-                    jobs = self._parse_api_job_data(job_data_list, max_jobs)
-                    if jobs:
-                        metadata['debug_info']['api_success'] = True
-                        return jobs, metadata
-                
-                # If noOfJobs > 0 but no job data found, try parsing the entire response
-                if no_of_jobs > 0:
-                    # Try to extract from any array in the response
-                    if isinstance(data, dict):
-                        for key, value in data.items():
-                            if isinstance(value, list) and len(value) > 0:
-                                # Check if first item looks like job data
-                                if isinstance(value[0], dict) and ('title' in value[0] or 'jobTitle' in value[0]):
-                                    jobs = self._parse_api_job_data(value, max_jobs)
-                                    if jobs:
-                                        metadata['debug_info']['api_success'] = True
-                                        return jobs, metadata
-                
-                return [], metadata
-            else:
-                error_msg = f"API request failed with status {response.status_code}"
-                metadata['debug_info']['api_errors'] = [error_msg]
-                return [], metadata
-                
-        except Exception as e:
-            error_msg = f"Error in API scraping: {str(e)}"
-            import traceback
-            traceback.print_exc()
-            metadata['debug_info']['api_errors'] = [error_msg]
-            return [], metadata
+        for query, _, _, stats in journal_queries
+    ]
+    next_pages = {
+        query_id: last_page + 1
+        for query_id, (_, last_page, done, _) in enumerate(journal_queries) if not done
+    }
+    # A query that stopped on an error is retried from its failed page
+    for query_id in next_pages:
+        query_stats[query_id]['error'] = None
+    file_keys = set()
+    if args.resume and output_format == 'jsonl' and os.path.exists(output_file):
+        # The file may end in a half-written line, and may hold listings
+        # flushed after the last commit: keep them and skip them
+        repair_jsonl(output_file)
+        file_keys = {dedup_key(record) for record in read_jsonl(output_file)}
+        keys.update(file_keys)
     
-    def _parse_api_job_data(self, job_details_list, max_jobs=20):
-        """
-        Parse job data from API response
-        
-        Args:
-            job_details_list: List of job objects from API
-            max_jobs: Maximum number of jobs to return
-        
-        Returns:
-            List of job dictionaries in our format
-        """
-        jobs = []
-        
-        for job_detail in job_details_list[:max_jobs]:
-            try:
-                job_data = {
-                    'job_title': '',
-                    'company_name': '',
-                    'company_logo': '',
-                    'rating': '',
-                    'reviews': '',
-                    'experience': '',
-                    'salary': '',
-                    'location': '',
-                    'job_description': '',
-                    'tags': [],
-                    'job_post_date': '',
-                    'job_url': ''
-                }
-                
-                # Extract job title
-                if 'title' in job_detail:
-                    job_data['job_title'] = job_detail['title']
-                elif 'jobTitle' in job_detail:
-                    job_data['job_title'] = job_detail['jobTitle']
-                
-                # Extract company name
-                if 'companyName' in job_detail:
-                    job_data['company_name'] = job_detail['companyName']
-                elif 'company' in job_detail and isinstance(job_detail['company'], dict):
-                    job_data['company_name'] = job_detail['company'].get('name', '')
-                
-                # Extract company logo
-                if 'companyLogo' in job_detail:
-                    job_data['company_logo'] = job_detail['companyLogo']
-                elif 'company' in job_detail and isinstance(job_detail['company'], dict):
-                    job_data['company_logo'] = job_detail['company'].get('logo', '')
+    try:
+        output = JobOutput(
+            output_file, output_format, compress=True if settings['gzip'] else None,
+            append=args.resume and output_format == 'jsonl'
+        )
+    except ImportError:
+        journal.close()
+        if not args.resume:
+            _remove_journal(checkpoint_path)
+        raise
+    # JSON and Parquet files are only complete at the end, so their listings
+    # are kept in the journal and written again on resume
+    keep_jobs = output_format != 'jsonl'
+    if keep_jobs:
+        for query_id, job in journal.stored_jobs():
+            output.add([job], job_type=queries[query_id]['job_type'])
+    else:
+        output.count = len(file_keys)
+    pending_details = []
+    for query_id, job in journal.pending_details():
+        if dedup_key(job) in file_keys:
+            journal.complete_details(job['job_url'], query_id)
+        else:
+            pending_details.append((query_id, job))
+    
+    workers = max(1, min(args.workers, len(next_pages) + len(pending_details) or 1))
+    print("=" * 60)
+    print("Naukri.com Job Scraper (bulk mode)")
+    print("=" * 60)
+    print(f"Queries: {len(queries)} from {settings['queries_file']}")
+    if args.resume:
+        print(
+            f"Resuming: {len(next_pages)} queries left, {output.count} listings already written"
+            + (f", {len(pending_details)} details pages pending" if pending_details else "")
+        )
+    if args.base_port is not None:
+        print(f"Workers: {workers} (debugging ports {args.base_port}-{args.base_port + workers - 1})")
+    else:
+        print(f"Workers: {workers}")
+    print(f"Engine: {worker_settings['engine']}" + (" (with details pages)" if with_details else ""))
+    print(f"Pages per query: up to {max(query['pages'] for query in queries)}")
+    print(f"Output File: {output_file} ({output_format})")
+    print(f"Checkpoint: {checkpoint_path}")
+    if seen_db:
+        print(f"Seen Listings: {seen_db}")
+    print("=" * 60)
+    print()
+    
+    ports = multiprocessing.Queue()
+    for worker in range(workers):
+        ports.put(args.base_port + worker if args.base_port is not None else None)
+    seen_store = SeenStore(seen_db) if seen_db else None
+    
+    # Only keys are kept in memory; listings go straight to the output
+    # (or wait in the journal for their details page)
+    query_keys = {query_id: set() for query_id in next_pages}
+    results = queue.Queue()
+    scraped_count = sum(stats['scraped'] for stats in query_stats)
+    resumed_count = scraped_count
+    pages_done = 0
+    details_queued = len(pending_details)
+    queries_done = len(queries) - len(next_pages)
+    started = time.perf_counter()
+    
+    try:
+        with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(ports, worker_settings)) as pool:
+            def submit(query_id, page):
+                pool.apply_async(
+                    crawl_page, (query_id, queries[query_id], page),
+                    callback=results.put,
+                    error_callback=lambda e: results.put({
+                        'kind': 'page', 'query_id': query_id, 'page': page, 'jobs': [], 'has_next': False,
+                        'source': None, 'error': str(e), 'elapsed': 0.0
+                    })
+                )
+            
+            def submit_details(query_id, job):
+                pool.apply_async(
+                    crawl_details, (query_id, job),
+                    callback=results.put,
+                    error_callback=lambda e: results.put({
+                        'kind': 'details', 'query_id': query_id,
+                        'record': {**job, 'details': None}, 'elapsed': 0.0
+                    })
+                )
+            
+            for query_id, page in next_pages.items():
+                submit(query_id, page)
+            for query_id, job in pending_details:
+                submit_details(query_id, job)
+            in_flight = len(next_pages) + len(pending_details)
+            
+            while in_flight:
+                result = results.get()
+                in_flight -= 1
+                query_id = result['query_id']
+                query, stats = queries[query_id], query_stats[query_id]
+                stats['seconds'] = round(stats['seconds'] + result['elapsed'], 1)
                 
-                # Extract location
-                if 'placeholders' in job_detail and isinstance(job_detail['placeholders'], list):
-                    location_parts = []
-                    for placeholder in job_detail['placeholders']:
-                        if isinstance(placeholder, dict) and 'label' in placeholder:
-                            location_parts.append(placeholder['label'])
-                    if location_parts:
-                        job_data['location'] = ', '.join(location_parts)
+                if result['kind'] == 'details':
+                    record = result['record']
+                    details_queued -= 1
+                    if record['details'] is not None:
+                        stats['details'] += 1
+                    output.add([record], job_type=query['job_type'])
+                    output.flush()
+                    journal.complete_details(record['job_url'], query_id, stats, record if keep_jobs else None)
+                    continue
                 
-                # Extract experience
-                if 'workExp' in job_detail and isinstance(job_detail['workExp'], dict):
-                    min_exp = job_detail['workExp'].get('minExp', '')
-                    max_exp = job_detail['workExp'].get('maxExp', '')
-                    if min_exp and max_exp:
-                        job_data['experience'] = f"{min_exp}-{max_exp} Yrs"
-                    elif min_exp:
-                        job_data['experience'] = f"{min_exp}+ Yrs"
+                pages_done += 1
+                page = result['page']
+                page_jobs = result['jobs']
+                scraped_count += len(page_jobs)
+                stats['scraped'] += len(page_jobs)
+                new_for_query = [job for job in dedupe(page_jobs) if dedup_key(job) not in query_keys[query_id]]
+                query_keys[query_id].update(dedup_key(job) for job in new_for_query)
+                new_jobs = [job for job in new_for_query if dedup_key(job) not in keys]
+                if seen_store:
+                    new_jobs = [job for job in new_jobs if dedup_key(job) not in seen_store]
+                new_keys = [dedup_key(job) for job in new_jobs]
+                keys.update(new_keys)
                 
-                # Extract salary
-                if 'salaryDetail' in job_detail:
-                    salary_detail = job_detail['salaryDetail']
-                    if isinstance(salary_detail, dict):
-                        salary_label = salary_detail.get('label', '')
-                        if salary_label:
-                            job_data['salary'] = salary_label
+                # Listings with a details page wait for it; the rest are written now
+                detail_jobs = [job for job in new_jobs if job['job_url']] if with_details else []
+                ready_jobs = (
+                    [{**job.to_dict(), 'details': None} for job in new_jobs if not job['job_url']]
+                    if with_details else new_jobs
+                )
+                output.add(ready_jobs, job_type=query['job_type'])
                 
-                # Extract job description
-                if 'description' in job_detail:
-                    desc = job_detail['description']
-                    if isinstance(desc, str):
-                        job_data['job_description'] = desc[:500]  # Limit description length
+                if result['error']:
+                    stats['error'] = result['error']
+                else:
+                    stats['pages_scraped'] = page
+                    stats['count'] += len(new_for_query)
+                    if result['source'] not in stats['sources']:
+                        stats['sources'].append(result['source'])
                 
-                # Extract tags/skills
-                if 'tagsAndSkills' in job_detail:
-                    tags = job_detail['tagsAndSkills']
-                    if isinstance(tags, list):
-                        job_data['tags'] = [tag.get('label', tag) if isinstance(tag, dict) else str(tag) for tag in tags[:5]]
+                more = not result['error'] and new_for_query and result['has_next'] and page < query['pages']
                 
-                # Extract job post date
-                if 'createdDate' in job_detail:
-                    job_data['job_post_date'] = job_detail['createdDate']
-                elif 'postedDate' in job_detail:
-                    job_data['job_post_date'] = job_detail['postedDate']
+                # The output is flushed before the page is committed, so a
+                # committed page is always on disk
+                output.flush()
+                # A failed page is not done: the query resumes from it
+                journal.record_page(
+                    query_id, page if not result['error'] else page - 1, new_keys,
+                    not more and not result['error'], stats,
+                    jobs=ready_jobs if keep_jobs else None, detail_jobs=[job.to_dict() for job in detail_jobs]
+                )
+                if seen_store and new_keys:
+                    seen_store.add_many(new_keys)
                 
-                # Extract job URL
-                if 'jobUrl' in job_detail:
-                    job_url = job_detail['jobUrl']
-                    if job_url:
-                        if job_url.startswith('/'):
-                            job_url = f"https://www.naukri.com{job_url}"
-                        job_data['job_url'] = job_url
-                elif 'applyUrl' in job_detail:
-                    job_url = job_detail['applyUrl']
-                    if job_url:
-                        if job_url.startswith('/'):
-                            job_url = f"https://www.naukri.com{job_url}"
-                        job_data['job_url'] = job_url
-                elif 'jdURL' in job_detail:
-                    job_url = job_detail['jdURL']
-                    if job_url:
-                        if job_url.startswith('/'):
-                            job_url = f"https://www.naukri.com{job_url}"
-                        job_data['job_url'] = job_url
+                for job in detail_jobs:
+                    submit_details(query_id, job.to_dict())
+                in_flight += len(detail_jobs)
+                details_queued += len(detail_jobs)
+                if more:
+                    submit(query_id, page + 1)
+                    in_flight += 1
+                else:
+                    queries_done += 1
+                    del query_keys[query_id]
                 
-                # Only add if we have at least a job title
-                if job_data['job_title']:
-                    jobs.append(job_data)
-                    
-            except Exception as e:
-                pass
-                continue
-        
-        return jobs
+                # Remaining pages are an upper bound: queries may stop early
+                elapsed = time.perf_counter() - started
+                remaining_pages = sum(
+                    queries[pending]['pages'] - query_stats[pending]['pages_scraped']
+                    for pending in query_keys
+                )
+                eta = elapsed / pages_done * remaining_pages
+                outcome = f"error: {result['error']}" if result['error'] else f"page {page}: {len(page_jobs)} jobs"
+                print(
+                    f"[{queries_done}/{len(queries)} queries, {pages_done} pages] "
+                    f"{scraped_count} jobs ({output.count} written"
+                    + (f", {details_queued} awaiting details" if with_details else "") + ") | "
+                    f"{(scraped_count - resumed_count) / elapsed if elapsed else 0:.1f} jobs/s | "
+                    f"ETA {_format_duration(eta)} | "
+                    f"{query['designation']} @ {query['location']} {outcome}",
+                    flush=True
+                )
+            
+            # Let the workers exit normally so that they close their browsers
+            pool.close()
+            pool.join()
+    except BaseException:
+        output.close()
+        journal.close()
+        print(f"\nProgress is saved in {checkpoint_path}. Resume with:")
+        print(f"  python scrape_jobs.py --resume --checkpoint {checkpoint_path}")
+        raise
+    finally:
+        if seen_store:
+            seen_store.close()
     
-    def _extract_job_data(self, card_element, card_index):
-        """Extract data from a single job card element"""
-        job_data = {
-            'job_title': '',
-            'company_name': '',
-            'company_logo': '',
-            'rating': '',
-            'reviews': '',
-            'experience': '',
-            'salary': '',
-            'location': '',
-            'job_description': '',
-            'tags': [],
-            'job_post_date': '',
-            'job_url': ''
+    elapsed = time.perf_counter() - started
+    output.finish(
+        {'queries_file': settings['queries_file'], 'queries': queries},
+        {
+            'scraped': scraped_count,
+            'duplicates_dropped': scraped_count - output.count,
+            'seconds': round(elapsed, 1),
+            'queries': query_stats,
         }
-        
-        try:
-            # Row 1: Job title, company name, company logo
-            try:
-                title_element = card_element.find_element(By.XPATH, ".//div[1]/h2")
-                job_data['job_title'] = title_element.text.strip()
-                # Try to get job URL from title link
-                try:
-                    title_link = title_element.find_element(By.XPATH, ".//a")
-                    job_url = title_link.get_attribute('href')
-                    if job_url:
-                        # Convert relative URLs to absolute
-                        if job_url.startswith('/'):
-                            job_url = f"https://www.naukri.com{job_url}"
-                        job_data['job_url'] = job_url
-                except:
-                    pass
-            except:
-                # Try alternative
-                try:
-                    title_element = card_element.find_element(By.XPATH, ".//h2")
-                    job_data['job_title'] = title_element.text.strip()
-                    # Try to get job URL from title link
-                    try:
-                        title_link = title_element.find_element(By.XPATH, ".//a")
-                        job_url = title_link.get_attribute('href')
-                        if job_url:
-                            if job_url.startswith('/'):
-                                job_url = f"https://www.naukri.com{job_url}"
-                            job_data['job_url'] = job_url
-                    except:
-                        pass
-                except:
-                    pass
-            
-            # Also try to get URL from card wrapper or any link in the card
-            if not job_data.get('job_url'):
-                try:
-                    # Try to find any link that looks like a job detail link
-                    card_link = card_element.find_element(By.XPATH, ".//a[contains(@href, 'job-listings') or contains(@href, '/jobs/')]")
-                    job_url = card_link.get_attribute('href')
-                    if job_url:
-                        if job_url.startswith('/'):
-                            job_url = f"https://www.naukri.com{job_url}"
-                        job_data['job_url'] = job_url
-                except:
-                    pass
-            
-            try:
-                logo_element = card_element.find_element(By.XPATH, ".//div[1]/span/img")
-                job_data['company_logo'] = logo_element.get_attribute('src') or ''
-            except:
-                # Try alternative
-                try:
-                    logo_element = card_element.find_element(By.XPATH, ".//span/img")
-                    job_data['company_logo'] = logo_element.get_attribute('src') or ''
-                except:
-                    pass
-            
-            try:
-                # Company name is in div[2]/span/a[1] according to XPath structure
-                company_link = card_element.find_element(By.XPATH, ".//div[2]/span/a[1]")
-                job_data['company_name'] = company_link.text.strip()
-            except:
-                # Try alternative locations
-                try:
-                    company_link = card_element.find_element(By.XPATH, ".//div[1]/span/a[1]")
-                    job_data['company_name'] = company_link.text.strip()
-                except:
-                    try:
-                        # Try getting from span text
-                        company_span = card_element.find_element(By.XPATH, ".//div[1]/span")
-                        company_text = company_span.text.strip()
-                        lines = [line.strip() for line in company_text.split('\n') if line.strip()]
-                        if lines:
-                            job_data['company_name'] = lines[0]
-                    except:
-                        pass
-            
-            # Row 2: Rating and reviews
-            try:
-                rating_element = card_element.find_element(By.XPATH, ".//div[2]/span/a[2]/span[2]")
-                job_data['rating'] = rating_element.text.strip()
-            except:
-                # Try alternative paths
-                try:
-                    rating_element = card_element.find_element(By.XPATH, ".//span[contains(@class, 'rating') or contains(text(), '.')]")
-                    job_data['rating'] = rating_element.text.strip()
-                except:
-                    pass
-            
-            try:
-                reviews_element = card_element.find_element(By.XPATH, ".//div[2]/span/a[3]")
-                job_data['reviews'] = reviews_element.text.strip()
-            except:
-                pass
-            
-            # Row 3: Experience, Salary, Location
-            try:
-                exp_element = card_element.find_element(By.XPATH, ".//div[3]/div/span[1]/span/span")
-                job_data['experience'] = exp_element.text.strip()
-            except:
-                # Try alternative
-                try:
-                    exp_element = card_element.find_element(By.XPATH, ".//span[contains(text(), 'Yrs') or contains(text(), 'Experience')]")
-                    job_data['experience'] = exp_element.text.strip()
-                except:
-                    pass
-            
-            try:
-                salary_element = card_element.find_element(By.XPATH, ".//div[3]/div/span[2]/span/span")
-                job_data['salary'] = salary_element.text.strip()
-            except:
-                # Try alternative
-                try:
-                    salary_element = card_element.find_element(By.XPATH, ".//span[contains(text(), 'Lakhs') or contains(text(), 'LPA')]")
-                    job_data['salary'] = salary_element.text.strip()
-                except:
-                    pass
-            
-            try:
-                loc_element = card_element.find_element(By.XPATH, ".//div[3]/div/span[3]/span/span")
-                job_data['location'] = loc_element.text.strip()
-            except:
-                # Try alternative
-                try:
-                    loc_element = card_element.find_element(By.XPATH, ".//span[contains(@class, 'loc') or contains(text(), 'Location')]")
-                    job_data['location'] = loc_element.text.strip()
-                except:
-                    pass
-            
-            # Row 4: Job description
-            try:
-                desc_element = card_element.find_element(By.XPATH, ".//div[4]/span")
-                job_data['job_description'] = desc_element.text.strip()
-            except:
-                # Try alternative
-                try:
-                    desc_element = card_element.find_element(By.XPATH, ".//span[contains(@class, 'desc') or contains(@class, 'job-desc')]")
-                    job_data['job_description'] = desc_element.text.strip()
-                except:
-                    pass
-            
-            # Row 5: Tags
-            try:
-                tags_list = card_element.find_element(By.XPATH, ".//div[5]/ul")
-                tag_items = tags_list.find_elements(By.TAG_NAME, "li")
-                job_data['tags'] = [tag.text.strip() for tag in tag_items if tag.text.strip()]
-            except:
-                # Try alternative
-                try:
-                    tags_list = card_element.find_element(By.XPATH, ".//ul")
-                    tag_items = tags_list.find_elements(By.TAG_NAME, "li")
-                    job_data['tags'] = [tag.text.strip() for tag in tag_items if tag.text.strip()][:5]  # Limit to 5 tags
-                except:
-                    pass
-            
-            # Row 6: Job post date
-            try:
-                date_element = card_element.find_element(By.XPATH, ".//div[6]/span[1]")
-                job_data['job_post_date'] = date_element.text.strip()
-            except:
-                # Try alternative
-                try:
-                    date_element = card_element.find_element(By.XPATH, ".//span[contains(text(), 'ago') or contains(text(), 'Posted')]")
-                    job_data['job_post_date'] = date_element.text.strip()
-                except:
-                    pass
-            
-        except Exception as e:
-            pass
-        
-        return job_data
+    )
+    journal.close()
+    failed = sum(1 for stats in query_stats if stats['error'])
+    if not failed:
+        _remove_journal(checkpoint_path)
     
-    def close(self):
-        """Close the browser driver"""
-        if self.driver:
-            self.driver.quit()
+    print()
+    print("=" * 60)
+    print("Summary")
+    print("=" * 60)
+    print(f"Queries: {len(queries)} ({failed} failed)")
+    print(f"Jobs scraped: {scraped_count}")
+    print(f"Unique jobs written: {output.count}")
+    if with_details:
+        print(f"Details pages scraped: {sum(stats['details'] for stats in query_stats)}")
+    rate = (scraped_count - resumed_count) / elapsed if elapsed else 0
+    print(f"Elapsed: {_format_duration(elapsed)} ({rate:.1f} jobs/s)")
+    print(f"Output file: {output.path}")
+    if output.meta_path != output.path:
+        print(f"Run statistics: {output.meta_path}")
+    print("=" * 60)
+    if failed:
+        print(f"\n{failed} queries stopped on an error; progress is kept in {checkpoint_path}. Retry them with:")
+        print(f"  python scrape_jobs.py --resume --checkpoint {checkpoint_path}")
+    return 1 if failed == len(queries) else 0
 
 
 def parse_arguments():
@@ -878,26 +628,35 @@ Examples:
   python scrape_jobs.py --job-type job --designation "software engineer" --location "bangalore" --experience 2
   python scrape_jobs.py -t internship -d "data science" -l "mumbai" -e 0
   python scrape_jobs.py --job-type job --designation "python developer" --location "delhi" --output my_jobs.json
+  python scrape_jobs.py -t job -d "python developer" -l "delhi" --seen-db seen_jobs.sqlite3
+  python scrape_jobs.py -t job -d "python developer" -l "delhi" --engine api --details
+  python scrape_jobs.py --queries queries.csv --workers 4 --pages 10 --output crawl.json
+  python scrape_jobs.py --queries queries.csv --output crawl.jsonl.gz
+  python scrape_jobs.py --queries queries.csv --output crawl.parquet
+  python scrape_jobs.py --resume --output crawl.jsonl.gz
+
+Query files (CSV with a header row, or a YAML list of mappings):
+  designation,location,job_type,experience,pages
+  python developer,bangalore,job,2,10
+  data science,mumbai,internship,,
         """
     )
     
     parser.add_argument(
         '--job-type', '-t',
-        required=True,
         choices=['job', 'internship'],
-        help='Type of job: "job" or "internship"'
+        help='Type of job: "job" or "internship" (with --queries: default for queries without one)'
     )
     
     parser.add_argument(
         '--designation', '-d',
-        required=True,
         help='Job keyword/designation (e.g., "software engineer", "data scientist")'
     )
     
     parser.add_argument(
         '--location', '-l',
-        required=True,
-        help='City or state (e.g., "bangalore", "mumbai", "delhi")'
+        help='City or state (e.g., "bangalore", "mumbai", "delhi"); '
+             'with --queries: default for queries without one'
     )
     
     parser.add_argument(
@@ -910,7 +669,95 @@ Examples:
     parser.add_argument(
         '--output', '-o',
         default=None,
-        help='Output JSON filename (default: jobs_<timestamp>.json)'
+        help='Output filename (default: jobs_<timestamp>.<format>, .jsonl.gz with --gzip)'
+    )
+    
+    parser.add_argument(
+        '--format', '-f',
+        choices=['json', 'jsonl', 'parquet'],
+        default=None,
+        help='json: one document written at the end; jsonl: one listing per line, '
+             'written as it is scraped; parquet: columnar file for analytics (needs pyarrow) '
+             '(default: from the output extension, else json)'
+    )
+    
+    parser.add_argument(
+        '--gzip',
+        action='store_true',
+        help='Compress JSON Lines output with gzip (implied by a .gz output name)'
+    )
+    
+    parser.add_argument(
+        '--engine',
+        choices=['browser', 'api'],
+        default='browser',
+        help='browser: load the results page, falling back to the JSON API; '
+             'api: query the JSON API first, starting a browser only if it returns nothing '
+             '(default: browser)'
+    )
+    
+    parser.add_argument(
+        '--details',
+        action='store_true',
+        help='Also scrape the details page of every listing written (key skills, '
+             'department, role, industry, full description...), under "details"'
+    )
+    
+    parser.add_argument(
+        '--base-url',
+        default=None,
+        help='Site root to scrape instead of naukri.com, e.g. a local replay server '
+             '(default: NAUKRI_BASE_URL or https://www.naukri.com)'
+    )
+    
+    parser.add_argument(
+        '--seen-db',
+        default=os.getenv('NAUKRI_SEEN_DB'),
+        help='SQLite file of listings already scraped; only new listings are written '
+             '(default: NAUKRI_SEEN_DB, unset = keep everything)'
+    )
+    
+    parser.add_argument(
+        '--queries', '-q',
+        default=None,
+        help='Bulk mode: CSV or YAML file of searches (designation, location, '
+             'job_type, experience, pages) crawled in parallel into one output file'
+    )
+    
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=2,
+        help='Bulk mode: worker processes, each with its own browser (default: 2)'
+    )
+    
+    parser.add_argument(
+        '--pages', '-p',
+        type=int,
+        default=5,
+        help='Bulk mode: result pages to crawl per query (default: 5)'
+    )
+    
+    parser.add_argument(
+        '--base-port',
+        type=int,
+        default=None,
+        help='Bulk mode: remote debugging port of the first worker browser; '
+             'worker N uses base + N (default: a free port per browser)'
+    )
+    
+    parser.add_argument(
+        '--checkpoint',
+        default=None,
+        help='Bulk mode: SQLite journal of the crawl\'s progress, committed after every page '
+             'and removed when the crawl completes (default: <output>.checkpoint)'
+    )
+    
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Bulk mode: continue the interrupted crawl of --output (or --checkpoint) '
+             'with the next page of every unfinished query'
     )
     
     parser.add_argument(
@@ -927,21 +774,64 @@ Examples:
         help='Run browser in visible mode (overrides --headless)'
     )
     
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.format is None:
+        output_name = (args.output or '').lower()
+        if output_name.endswith('.parquet'):
+            args.format = 'parquet'
+        elif args.gzip or output_name.endswith(('.jsonl', '.ndjson', '.jsonl.gz', '.ndjson.gz')):
+            args.format = 'jsonl'
+        else:
+            args.format = 'json'
+    if args.gzip and args.format != 'jsonl':
+        parser.error('--gzip needs --format jsonl')
+    if args.resume:
+        # Queries, output format and pages come from the checkpoint
+        if not (args.output or args.checkpoint):
+            parser.error('--resume needs --output or --checkpoint')
+        if not os.path.exists(args.checkpoint or f"{args.output}.checkpoint"):
+            parser.error(f"no checkpoint to resume at {args.checkpoint or f'{args.output}.checkpoint'}")
+        if args.workers < 1:
+            parser.error('--workers must be at least 1')
+    elif args.queries:
+        if args.workers < 1 or args.pages < 1:
+            parser.error('--workers and --pages must be at least 1')
+    else:
+        missing = [
+            option for option, value in (
+                ('--job-type', args.job_type), ('--designation', args.designation), ('--location', args.location)
+            ) if not value
+        ]
+        if missing:
+            parser.error(f"the following arguments are required without --queries: {', '.join(missing)}")
+    return args
 
 
 def main():
     """Main execution function"""
     args = parse_arguments()
     
-    # Generate output filename if not provided
-    if args.output:
-        output_file = args.output
-    else:
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        output_file = f"jobs_{timestamp}.json"
+    if args.queries or args.resume:
+        try:
+            sys.exit(run_bulk(args))
+        except ImportError as e:
+            print(f"Error: {str(e)}")
+            sys.exit(1)
+        except KeyboardInterrupt:
+            print("\n\nScraping interrupted by user")
+            sys.exit(1)
+        except Exception as e:
+            print(f"\n\nError: {str(e)}")
+            import traceback
+            traceback.print_exc()
+            sys.exit(1)
     
-    scraper = None
+    output_file = default_output_file(args)
+    try:
+        output = JobOutput(output_file, args.format, compress=True if args.gzip else None, job_type=args.job_type)
+    except ImportError as e:
+        print(f"Error: {str(e)}")
+        sys.exit(1)
     
     try:
         # Print progress messages
@@ -953,50 +843,54 @@ def main():
         print(f"Location: {args.location}")
         if args.experience is not None:
             print(f"Experience: {args.experience} years")
-        print(f"Output File: {output_file}")
+        print(f"Engine: {args.engine}" + (" (with details pages)" if args.details else ""))
+        print(f"Output File: {output_file} ({args.format})")
+        if args.seen_db:
+            print(f"Seen Listings: {args.seen_db}")
         print(f"Headless Mode: {args.headless}")
         print("=" * 60)
         print()
         
-        # Initialize scraper
-        print("Initializing scraper...")
-        scraper = NaukriScraper(headless=args.headless)
-        print("✓ Scraper initialized successfully")
-        print()
-        
         # Scrape jobs
         print("Scraping jobs...")
-        jobs, metadata = scraper.scrape_jobs(
-            job_type=args.job_type,
-            keyword=args.designation,
-            location=args.location,
-            experience=args.experience,
-            max_jobs=100,
-            page=1
-        )
+        query = {
+            'job_type': args.job_type,
+            'designation': args.designation,
+            'location': args.location,
+            'experience': args.experience,
+        }
+        result = search_page(query, 1, headless=args.headless, engine=args.engine, base_url=args.base_url)
+        if result['error']:
+            raise Exception(result['error'])
+        jobs = result['jobs']
+        # 'source' is the key earlier versions of this script wrote
+        metadata = {'source': result['source'] or 'unknown', **result['metadata']}
         print(f"✓ Scraping completed")
+        
+        # With --seen-db, drop the listings an earlier run already wrote
+        scraped_count = len(jobs)
+        if args.seen_db:
+            seen_store = SeenStore(args.seen_db)
+            try:
+                jobs, _ = seen_store.filter_new(jobs)
+            finally:
+                seen_store.close()
+        else:
+            jobs = dedupe(jobs)
+        if len(jobs) < scraped_count:
+            print(f"Skipped {scraped_count - len(jobs)} duplicate or already seen listings")
         print()
         
-        # Prepare output data
-        output_data = {
-            'search_params': {
-                'job_type': args.job_type,
-                'designation': args.designation,
-                'location': args.location,
-                'experience': args.experience
-            },
-            'results': {
-                'count': len(jobs),
-                'jobs': jobs,
-                'metadata': metadata
-            },
-            'timestamp': datetime.now().isoformat()
-        }
+        if args.details:
+            print(f"Scraping {len(jobs)} details pages...")
+            jobs = [scrape_details(job, headless=args.headless, base_url=args.base_url) for job in jobs]
+            print(f"✓ Details scraped")
+            print()
         
-        # Save to JSON file
+        # Save results
         print(f"Saving results to {output_file}...")
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        output.add(jobs)
+        output.finish(query, metadata)
         print(f"✓ Results saved successfully")
         print()
         
@@ -1005,7 +899,7 @@ def main():
         print("Summary")
         print("=" * 60)
         print(f"Jobs found: {len(jobs)}")
-        print(f"Data source: {metadata.get('source', 'unknown')}")
+        print(f"Data source: {metadata['source']}")
         print(f"Output file: {output_file}")
         print("=" * 60)
         
@@ -1021,14 +915,7 @@ def main():
         traceback.print_exc()
         sys.exit(1)
     finally:
-        # Always close scraper
-        if scraper:
-            try:
-                print("\nCleaning up...")
-                scraper.close()
-                print("✓ Cleanup completed")
-            except:
-                pass
+        output.close()
 
 
 if __name__ == '__main__':